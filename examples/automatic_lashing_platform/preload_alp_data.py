@@ -1,9 +1,8 @@
 import logging
+import os
 import time
 from pathlib import Path
 
-from tqdm import tqdm
-
 import flowcean.cli
 from flowcean.core.environment import ChainEnvironment
 from flowcean.environments.json import JsonDataLoader
@@ -15,18 +14,15 @@ logger = logging.getLogger(__name__)
 def main() -> None:
     flowcean.cli.initialize_logging()
     time_start = time.time()
-    data = ChainEnvironment(
-        *[
-            ParquetDataLoader(path)
-            .load()
-            .to_time_series("t")
-            .join(JsonDataLoader(path.with_suffix(".json")).load())
-            for path in tqdm(
-                list(Path("./data").glob("*.parquet")),
-                desc="Loading environments",
-            )
-        ]
-    )
+    paths = list(Path("./data").glob("*.parquet"))
+    time_series = ChainEnvironment(
+        *[ParquetDataLoader(path) for path in paths],
+    ).load()
+    metadata = ChainEnvironment(
+        *[JsonDataLoader(path.with_suffix(".json")) for path in paths],
+        max_workers=os.cpu_count(),
+    ).load()
+    data = time_series.to_time_series_per_environment("t").join(metadata)
     data.load()
     time_end = time.time()
     logger.info("took %.5f s to load data", time_end - time_start)
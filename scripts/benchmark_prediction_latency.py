@@ -0,0 +1,88 @@
+"""Benchmark the latency of predicting single samples.
+
+Compares `Model.predict` on single-row DataFrames with `Model.predict_one` on
+numpy vectors for a scikit-learn and a PyTorch model, and reports the median
+and 99th percentile latency of each.
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+import numpy as np
+import polars as pl
+import torch
+from sklearn.linear_model import LinearRegression
+
+from flowcean.core import Model
+from flowcean.models.pytorch import PyTorchModel
+from flowcean.models.sklearn import SciKitModel
+
+N_FEATURES = 8
+
+
+def measure(predict: Callable[[int], object], iterations: int) -> np.ndarray:
+    latencies = np.empty(iterations)
+    for i in range(iterations):
+        start = time.perf_counter_ns()
+        predict(i)
+        latencies[i] = time.perf_counter_ns() - start
+    return latencies / 1000
+
+
+def report(name: str, latencies: np.ndarray) -> None:
+    p50, p99 = np.percentile(latencies, [50, 99])
+    print(f"{name:<28} p50 {p50:9.1f} us   p99 {p99:9.1f} us")
+
+
+def benchmark(name: str, model: Model, iterations: int) -> None:
+    samples = np.random.default_rng(0).random((iterations, N_FEATURES))
+    columns = [f"x{i}" for i in range(N_FEATURES)]
+    out = np.empty(1, dtype=np.float32)
+
+    report(
+        f"{name} predict",
+        measure(
+            lambda i: model.predict(
+                pl.DataFrame(samples[i : i + 1], schema=columns),
+            ),
+            iterations,
+        ),
+    )
+    report(
+        f"{name} predict_one",
+        measure(lambda i: model.predict_one(samples[i], out), iterations),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=10_000)
+    arguments = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    inputs = pl.DataFrame(
+        rng.random((1000, N_FEATURES)),
+        schema=[f"x{i}" for i in range(N_FEATURES)],
+    )
+    outputs = rng.random(1000)
+
+    benchmark(
+        "sklearn",
+        SciKitModel(LinearRegression().fit(inputs, outputs), "y"),
+        arguments.iterations,
+    )
+    module = torch.nn.Sequential(
+        torch.nn.Linear(N_FEATURES, 32),
+        torch.nn.LeakyReLU(),
+        torch.nn.Linear(32, 1),
+    )
+    benchmark(
+        "pytorch",
+        PyTorchModel(module, ["y"], num_threads=1),
+        arguments.iterations,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ __all__ = [
     "ModelWithTransform",
     "OfflineEnvironment",
     "OfflineMetric",
+    "OnlineMetric",
     "SupervisedIncrementalLearner",
     "SupervisedLearner",
     "Transform",
@@ -31,6 +32,6 @@ from .learner import (
     UnsupervisedIncrementalLearner,
     UnsupervisedLearner,
 )
-from .metric import OfflineMetric
+from .metric import OfflineMetric, OnlineMetric
 from .model import Model, ModelWithTransform
 from .transform import Transform
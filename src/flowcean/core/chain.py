@@ -10,11 +10,22 @@ from flowcean.core.learner import (
 from .transform import Transform
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     import polars as pl
 
 
 class Chain(Transform, UnsupervisedLearner, UnsupervisedIncrementalLearner):
-    """A transform that is a chain of other transforms."""
+    """A transform that is a chain of other transforms.
+
+    Transforming data with a chain builds a single lazy query from the
+    `transform_lazy` plans of consecutive fusable transforms and collects it
+    once. Transforms that can be expressed as polars expressions are thereby
+    fused into one pass over the data without materializing intermediate
+    results. Transforms that are not fusable, e.g., because they need the
+    materialized data or have a faster eager implementation, collect the
+    query built so far and are applied eagerly.
+    """
 
     transforms: tuple[Transform, ...]
 
@@ -31,10 +42,35 @@ class Chain(Transform, UnsupervisedLearner, UnsupervisedIncrementalLearner):
 
     @override
     def transform(self, data: pl.DataFrame) -> pl.DataFrame:
+        fused: list[Transform] = []
+        for transform in self.transforms:
+            if transform.fusable:
+                fused.append(transform)
+                continue
+            data = transform.transform(_apply_lazy(data, fused))
+            fused = []
+        return _apply_lazy(data, fused)
+
+    @override
+    def transform_lazy(self, data: pl.LazyFrame) -> pl.LazyFrame:
         for transform in self.transforms:
-            data = transform.transform(data)
+            data = transform.transform_lazy(data)
         return data
 
+    @property
+    @override
+    def fusable(self) -> bool:
+        return all(transform.fusable for transform in self.transforms)
+
+    @override
+    def transform_stream(
+        self,
+        batches: Iterable[pl.DataFrame],
+    ) -> Iterator[pl.DataFrame]:
+        for transform in self.transforms:
+            batches = transform.transform_stream(batches)
+        return iter(batches)
+
     @override
     def __or__(self, other: Transform) -> Chain:
         """Pipe this transform into another transform.
@@ -46,14 +82,32 @@ class Chain(Transform, UnsupervisedLearner, UnsupervisedIncrementalLearner):
 
     @override
     def fit(self, data: pl.DataFrame) -> None:
-        for transform in self.transforms:
-            if isinstance(transform, UnsupervisedLearner):
-                transform.fit(data)
-            data = transform.transform(data)
+        self.fit_transform(data)
 
     @override
     def fit_incremental(self, data: pl.DataFrame) -> None:
+        self.fit_transform_incremental(data)
+
+    @override
+    def fit_transform(self, data: pl.DataFrame) -> pl.DataFrame:
         for transform in self.transforms:
-            if isinstance(transform, UnsupervisedIncrementalLearner):
-                transform.fit_incremental(data)
-            data = transform.transform(data)
+            data = transform.fit_transform(data)
+        return data
+
+    @override
+    def fit_transform_incremental(self, data: pl.DataFrame) -> pl.DataFrame:
+        for transform in self.transforms:
+            data = transform.fit_transform_incremental(data)
+        return data
+
+
+def _apply_lazy(
+    data: pl.DataFrame,
+    transforms: list[Transform],
+) -> pl.DataFrame:
+    if not transforms:
+        return data
+    lazy = data.lazy()
+    for transform in transforms:
+        lazy = transform.transform_lazy(lazy)
+    return lazy.collect()
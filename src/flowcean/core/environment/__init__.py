@@ -1,10 +1,13 @@
 __all__ = [
     "ActiveEnvironment",
+    "Collector",
     "Environment",
+    "EnvironmentLoadError",
     "IncrementalEnvironment",
     "NotLoadedError",
     "JoinedEnvironment",
     "OfflineEnvironment",
+    "PrefetchingEnvironment",
     "ChainEnvironment",
     "StreamingOfflineData",
     "TransformedEnvironment",
@@ -14,8 +17,11 @@ __all__ = [
 from .active import ActiveEnvironment
 from .base import Environment, NotLoadedError
 from .chain import ChainEnvironment
+from .collector import Collector
 from .incremental import IncrementalEnvironment
 from .joined import JoinedEnvironment
 from .offline import OfflineEnvironment
+from .parallel import EnvironmentLoadError
+from .prefetch import PrefetchingEnvironment
 from .streaming import StreamingOfflineData
 from .transformed import TransformedEnvironment
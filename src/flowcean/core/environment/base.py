@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Self
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from flowcean.core import Transform
 
     from .transformed import TransformedEnvironment
@@ -31,6 +33,9 @@ class Environment(ABC):
     def with_transform(
         self,
         transform: Transform,
+        *,
+        cache: bool = False,
+        cache_directory: str | Path | None = None,
     ) -> TransformedEnvironment[Self]:
         """Attach a transform to the environment.
 
@@ -41,13 +46,22 @@ class Environment(ABC):
 
         Args:
             transform: The transform to apply to the data of the environment.
+            cache: Whether to cache the transformed data. Only supported for
+                offline environments.
+            cache_directory: Directory to store cached data in. If not
+                provided, data is cached in memory.
 
         Returns:
             The transformed environment.
         """
         from .transformed import TransformedEnvironment
 
-        return TransformedEnvironment(self, transform)
+        return TransformedEnvironment(
+            self,
+            transform,
+            cache=cache,
+            cache_directory=cache_directory,
+        )
 
 
 class NotLoadedError(Exception):
@@ -2,7 +2,8 @@ from typing import Self, override
 
 import polars as pl
 
-from .offline import OfflineEnvironment
+from .offline import OfflineEnvironment, to_time_series_query
+from .parallel import ExecutorKind, load_environments
 
 
 class ChainEnvironment(OfflineEnvironment):
@@ -12,20 +13,143 @@ class ChainEnvironment(OfflineEnvironment):
     This environment is useful when you want to chain multiple datasets into a
     single one. It is useful when you have multiple datasets that you want to
     use together.
+
+    The environments can be loaded concurrently by setting `max_workers`.
+    The order of the data is the order of the environments, regardless of the
+    order in which they finish loading.
+
+    Converting a chain to a time series creates a single time series sample
+    of all chained data. `to_time_series_per_environment` instead creates one
+    sample per chained environment in a single query over all environments.
     """
 
-    def __init__(self, *environments: OfflineEnvironment) -> None:
+    def __init__(
+        self,
+        *environments: OfflineEnvironment,
+        max_workers: int | None = None,
+        max_in_flight: int | None = None,
+        executor: ExecutorKind = "thread",
+    ) -> None:
+        """Initialize the chain environment.
+
+        Args:
+            *environments: The offline environments to chain.
+            max_workers: The number of workers used to load the environments
+                concurrently. If `None`, the environments are loaded
+                sequentially.
+            max_in_flight: The maximum number of environments loading at the
+                same time. Defaults to twice the number of workers.
+            executor: Whether to load the environments in threads or
+                processes.
+        """
         super().__init__()
         self.environments = environments
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        self.executor: ExecutorKind = executor
+
+    @override
+    def fingerprint(self) -> str | None:
+        # prevent circular imports
+        from flowcean.utils import combine_fingerprints
+
+        return combine_fingerprints(
+            ["chain", *(env.fingerprint() for env in self.environments)],
+        )
 
     @override
     def load(self) -> Self:
-        for environment in self.environments:
-            environment.load()
+        self.environments = tuple(
+            load_environments(
+                self.environments,
+                max_workers=self.max_workers,
+                max_in_flight=self.max_in_flight,
+                executor=self.executor,
+            ),
+        )
         return self
 
     @override
     def get_data(self) -> pl.DataFrame:
+        return self.get_lazy().collect()
+
+    @override
+    def get_lazy(self) -> pl.LazyFrame:
         return pl.concat(
-            [env.get_data() for env in self.environments], how="vertical"
+            [env.get_lazy() for env in self.environments], how="vertical"
+        )
+
+    def to_time_series_per_environment(
+        self,
+        time_feature: str | dict[str, str],
+        *,
+        columnar: bool = False,
+    ) -> OfflineEnvironment:
+        """Convert each chained environment to a time series sample.
+
+        The result equals chaining the time series of the individual
+        environments, but is computed in a single parallel query instead of
+        one query per environment. Environments without data result in a
+        sample of empty time series, so that the samples stay aligned with
+        the environments. In contrast, `to_time_series` converts all data of
+        the chain into a single sample.
+
+        Args:
+            time_feature: The feature in the environments that represents the
+                time vector. Either a string if all series share a common time
+                vector, or a dictionary where the keys are the value features
+                and the values are the corresponding time vector feature names.
+            columnar: Whether to create the time series in the columnar
+                layout.
+
+        Returns:
+            A OfflineEnvironment with one time series sample per chained
+            environment.
+        """
+        from flowcean.environments.dataset import Dataset
+
+        data = pl.concat(
+            [
+                environment.get_lazy().with_columns(
+                    pl.lit(index, dtype=pl.UInt32).alias(_SOURCE_FEATURE),
+                )
+                for index, environment in enumerate(self.environments)
+            ],
+            how="vertical",
+        )
+        series = to_time_series_query(
+            data,
+            time_feature,
+            _SOURCE_FEATURE,
+            columnar=columnar,
+        )
+        sources = pl.LazyFrame(
+            {
+                _SOURCE_FEATURE: pl.Series(
+                    range(len(self.environments)),
+                    dtype=pl.UInt32,
+                ),
+            },
         )
+        return Dataset(
+            sources.join(series, on=_SOURCE_FEATURE, how="left")
+            .with_columns(
+                pl.col(feature).fill_null(_empty_series(data_type))
+                for feature, data_type in series.collect_schema().items()
+                if feature != _SOURCE_FEATURE
+            )
+            .drop(_SOURCE_FEATURE)
+            .collect(),
+        )
+
+
+def _empty_series(data_type: pl.DataType) -> pl.Expr:
+    if isinstance(data_type, pl.Struct):
+        return pl.struct(
+            pl.lit([], dtype=field.dtype).alias(field.name)
+            for field in data_type.fields
+        )
+    return pl.lit([], dtype=data_type)
+
+
+_SOURCE_FEATURE = "__flowcean_source__"
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import logging
+import tempfile
+from pathlib import Path
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+
+class Collector:
+    """Accumulate batches of samples into a single DataFrame.
+
+    Appending samples one by one to a DataFrame copies all previously
+    collected data on every append. Instead, the collector buffers incoming
+    samples and concatenates them in rounds of `chunk_size` samples. All
+    chunks are concatenated and rechunked only once when finishing the
+    collection, so every sample is copied a constant number of times.
+
+    Optionally, the memory used by the collected chunks can be bounded. When
+    the estimated size of the chunks held in memory exceeds `memory_limit`
+    bytes, they are spilled to Arrow IPC files in `spill_directory` and read
+    back when finishing the collection.
+
+    Example:
+        ```python
+        collector = Collector(memory_limit=512 * 1024**2)
+        for sample in samples:
+            collector.append(sample)
+        data = collector.finish()
+        ```
+
+    Attributes:
+        chunk_size: Number of samples buffered before they are concatenated.
+        memory_limit: Maximum number of bytes of collected data held in
+            memory, or `None` for no limit.
+        spill_directory: Directory to spill chunks to. A temporary directory
+            is used if not provided.
+    """
+
+    chunk_size: int
+    memory_limit: int | None
+    spill_directory: Path | None
+
+    def __init__(
+        self,
+        *,
+        chunk_size: int = 1024,
+        memory_limit: int | None = None,
+        spill_directory: str | Path | None = None,
+    ) -> None:
+        """Initialize a collector.
+
+        Args:
+            chunk_size: Number of samples buffered before they are
+                concatenated into a chunk.
+            memory_limit: Maximum number of bytes of collected data held in
+                memory. If exceeded, chunks are spilled to disk. Defaults to
+                no limit.
+            spill_directory: Directory to spill chunks to. A temporary
+                directory is used if not provided.
+        """
+        if chunk_size < 1:
+            message = "chunk_size must be positive"
+            raise ValueError(message)
+        self.chunk_size = chunk_size
+        self.memory_limit = memory_limit
+        self.spill_directory = (
+            Path(spill_directory) if spill_directory is not None else None
+        )
+        self._pending: list[pl.DataFrame] = []
+        self._pending_bytes = 0
+        self._chunks: list[pl.DataFrame] = []
+        self._chunk_bytes = 0
+        self._spilled: list[Path] = []
+        self._temporary_directory: tempfile.TemporaryDirectory[str] | None = (
+            None
+        )
+        self._height = 0
+
+    def __len__(self) -> int:
+        """Return the number of rows collected so far."""
+        return self._height
+
+    def append(self, sample: pl.DataFrame) -> None:
+        """Append a sample to the collection.
+
+        Args:
+            sample: The sample to append.
+        """
+        self._pending.append(sample)
+        self._pending_bytes += sample.estimated_size()
+        self._height += len(sample)
+        if len(self._pending) >= self.chunk_size:
+            self._flush_pending()
+        if (
+            self.memory_limit is not None
+            and self._chunk_bytes + self._pending_bytes > self.memory_limit
+        ):
+            self._flush_pending()
+            self._spill()
+
+    def finish(self) -> pl.DataFrame:
+        """Finish the collection and return the collected data.
+
+        Returns:
+            The collected data in a single contiguous DataFrame.
+        """
+        self._flush_pending()
+        try:
+            frames = [
+                pl.read_ipc(path, memory_map=False) for path in self._spilled
+            ]
+            frames.extend(self._chunks)
+            if not frames:
+                return pl.DataFrame()
+            return pl.concat(frames, how="vertical", rechunk=True)
+        finally:
+            self._chunks = []
+            self._chunk_bytes = 0
+            self._cleanup()
+
+    def _flush_pending(self) -> None:
+        if not self._pending:
+            return
+        chunk = pl.concat(self._pending, how="vertical", rechunk=True)
+        self._pending = []
+        self._pending_bytes = 0
+        self._chunks.append(chunk)
+        self._chunk_bytes += chunk.estimated_size()
+
+    def _spill(self) -> None:
+        if not self._chunks:
+            return
+        directory = self._directory()
+        chunk = pl.concat(self._chunks, how="vertical", rechunk=False)
+        path = directory / f"{id(self):x}_{len(self._spilled):06d}.arrow"
+        logger.debug(
+            "Spilling %d bytes of collected data to %s",
+            self._chunk_bytes,
+            path,
+        )
+        chunk.write_ipc(path)
+        self._spilled.append(path)
+        self._chunks = []
+        self._chunk_bytes = 0
+
+    def _directory(self) -> Path:
+        if self.spill_directory is not None:
+            self.spill_directory.mkdir(parents=True, exist_ok=True)
+            return self.spill_directory
+        if self._temporary_directory is None:
+            self._temporary_directory = tempfile.TemporaryDirectory(
+                prefix="flowcean-collect-",
+            )
+        return Path(self._temporary_directory.name)
+
+    def _cleanup(self) -> None:
+        for path in self._spilled:
+            path.unlink(missing_ok=True)
+        self._spilled = []
+        if self._temporary_directory is not None:
+            self._temporary_directory.cleanup()
+            self._temporary_directory = None
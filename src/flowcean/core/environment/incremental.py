@@ -8,9 +8,14 @@ import polars as pl
 from tqdm import tqdm
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from flowcean.environments.dataset import Dataset
 
+    from .prefetch import PrefetchingEnvironment
+
 from .base import Environment
+from .collector import Collector
 
 
 class IncrementalEnvironment(Environment, Iterable[pl.DataFrame]):
@@ -26,14 +31,25 @@ class IncrementalEnvironment(Environment, Iterable[pl.DataFrame]):
         n: int,
         *,
         progress_bar: bool | dict[str, Any] = True,
+        memory_limit: int | None = None,
+        spill_directory: str | Path | None = None,
     ) -> Dataset:
         """Collect n samples.
 
+        The samples are accumulated by a
+        [`Collector`][flowcean.core.environment.Collector], so the cost of
+        collecting grows linearly with the number of samples.
+
         Args:
             n: Number of samples to collect.
             progress_bar: Show a progress bar while collecting the samples. If
                 a dictionary is passed, it is used as keyword arguments for the
                 `tqdm` progress bar.
+            memory_limit: Maximum number of bytes of collected data to hold in
+                memory while collecting. Exceeding data is spilled to Arrow IPC
+                files. Defaults to no limit.
+            spill_directory: Directory to spill data to when exceeding the
+                `memory_limit`. A temporary directory is used if not provided.
 
         Returns:
             Dataset with the collected data.
@@ -52,8 +68,25 @@ class IncrementalEnvironment(Environment, Iterable[pl.DataFrame]):
         elif progress_bar:
             samples = tqdm(samples, desc="Collecting samples", total=n)
 
-        data = pl.DataFrame()
+        collector = Collector(
+            memory_limit=memory_limit,
+            spill_directory=spill_directory,
+        )
         for sample in samples:
-            data = data.vstack(sample)
+            collector.append(sample)
+
+        return Dataset(collector.finish())
+
+    def prefetch(self, depth: int = 2) -> PrefetchingEnvironment:
+        """Prefetch the batches of this environment in the background.
+
+        Args:
+            depth: The maximum number of batches to prefetch.
+
+        Returns:
+            An environment producing the batches of this environment in a
+            background thread.
+        """
+        from .prefetch import PrefetchingEnvironment
 
-        return Dataset(data)
+        return PrefetchingEnvironment(self, depth)
@@ -1,8 +1,9 @@
-from typing import Self
+from typing import Self, override
 
 import polars as pl
 
 from .offline import OfflineEnvironment
+from .parallel import ExecutorKind, load_environments
 
 
 class JoinedEnvironment(OfflineEnvironment):
@@ -12,29 +13,68 @@ class JoinedEnvironment(OfflineEnvironment):
     into a single one by concatenating them horizontally. All environments must
     have the same number of samples. If multiple environments share a feature,
     only the feature from the last environment will be used.
+
+    The environments can be loaded concurrently by setting `max_workers`.
     """
 
-    def __init__(self, *environments: OfflineEnvironment) -> None:
+    def __init__(
+        self,
+        *environments: OfflineEnvironment,
+        max_workers: int | None = None,
+        max_in_flight: int | None = None,
+        executor: ExecutorKind = "thread",
+    ) -> None:
         """Initialize the extend environment.
 
         Args:
             *environments: List of offline environments whose features should
                 be combined.
+            max_workers: The number of workers used to load the environments
+                concurrently. If `None`, the environments are loaded
+                sequentially.
+            max_in_flight: The maximum number of environments loading at the
+                same time. Defaults to twice the number of workers.
+            executor: Whether to load the environments in threads or
+                processes.
         """
         super().__init__()
         self.environments = environments
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        self.executor: ExecutorKind = executor
+
+    @override
+    def fingerprint(self) -> str | None:
+        # prevent circular imports
+        from flowcean.utils import combine_fingerprints
+
+        return combine_fingerprints(
+            ["join", *(env.fingerprint() for env in self.environments)],
+        )
 
+    @override
     def load(self) -> Self:
-        for env in self.environments:
-            env.load()
+        self.environments = tuple(
+            load_environments(
+                self.environments,
+                max_workers=self.max_workers,
+                max_in_flight=self.max_in_flight,
+                executor=self.executor,
+            ),
+        )
         return self
 
+    @override
     def get_data(self) -> pl.DataFrame:
         """Get data from the environment.
 
         Returns:
             The loaded dataset.
         """
+        return self.get_lazy().collect()
+
+    @override
+    def get_lazy(self) -> pl.LazyFrame:
         return pl.concat(
-            [env.get_data() for env in self.environments], how="horizontal"
+            [env.get_lazy() for env in self.environments], how="horizontal"
         )
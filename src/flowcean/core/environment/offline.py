@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from typing import TYPE_CHECKING
 
 import polars as pl
 
 from .base import Environment
 from .streaming import StreamingOfflineData
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
 
 class OfflineEnvironment(Environment):
     """Base class for offline environments.
@@ -23,6 +27,80 @@ class OfflineEnvironment(Environment):
             The loaded dataset.
         """
 
+    def fingerprint(self) -> str | None:
+        """Get a fingerprint of the data of the environment.
+
+        Data derived from the environment, e.g., the cached data of a
+        transformed environment, is identified by this fingerprint. It must
+        change whenever the data of the environment changes, and should be
+        equal for the same data across instances and runs. Environments
+        backed by files should override this method, e.g., with
+        `file_fingerprint`. By default, the data has no fingerprint.
+
+        Returns:
+            The fingerprint of the data, or `None` if it is unknown.
+        """
+        return None
+
+    def get_lazy(self) -> pl.LazyFrame:
+        """Get the data of the environment as a lazy query.
+
+        The returned `LazyFrame` is only evaluated when collected, which allows
+        polars to optimize the whole query, e.g., by pushing projections and
+        filters down to the data source. Environments that can scan their
+        source lazily should override this method. By default, the data
+        returned by `get_data` is wrapped.
+
+        Returns:
+            The data of the environment as a `LazyFrame`.
+        """
+        return self.get_data().lazy()
+
+    def select(self, features: Iterable[str]) -> pl.DataFrame:
+        """Get a subset of the features of the environment.
+
+        The selected features are resolved against the features of the
+        environment first, so that only the required features are read from
+        the underlying data source. Feature names wrapped by `^` and `$` are
+        treated as regular expressions.
+
+        Args:
+            features: The names of the features to select.
+
+        Returns:
+            The data of the selected features.
+        """
+        # prevent circular imports
+        from flowcean.utils.resolve_features import resolve_features
+
+        data = self.get_lazy()
+        columns = resolve_features(data.collect_schema().names(), features)
+        return data.select(columns).collect()
+
+    def iter_batches(
+        self,
+        batch_size: int,
+        features: Iterable[str] | None = None,
+    ) -> Iterator[pl.DataFrame]:
+        """Iterate over the data of the environment in batches.
+
+        Environments backed by files should override this method to read the
+        batches on demand, so that the data does not need to fit into memory.
+        By default, the data returned by `get_data`, or by `select` if
+        features are given, is sliced into batches.
+
+        Args:
+            batch_size: The number of samples of each batch.
+            features: The names of the features to include in the batches,
+                as accepted by `select`. If `None`, all features are included.
+
+        Yields:
+            Batches of `batch_size` samples. The last batch may be smaller.
+        """
+        data = self.get_data() if features is None else self.select(features)
+        for i in range(0, len(data), batch_size):
+            yield data.slice(i, batch_size)
+
     def as_stream(self, batch_size: int = 1) -> StreamingOfflineData:
         """Get a streaming interface to the data of the environment.
 
@@ -63,7 +141,11 @@ class OfflineEnvironment(Environment):
         return JoinedEnvironment(self, other)
 
     def to_time_series(
-        self, time_feature: str | dict[str, str]
+        self,
+        time_feature: str | dict[str, str],
+        *,
+        partition_by: str | None = None,
+        columnar: bool = False,
     ) -> OfflineEnvironment:
         """Convert this environment to a time series.
 
@@ -72,34 +154,94 @@ class OfflineEnvironment(Environment):
                 time vector. Either a string if all series share a common time
                 vector, or a dictionary where the keys are the value features
                 and the values are the corresponding time vector feature names.
+            partition_by: A feature that identifies the series each sample
+                belongs to. If given, one time series sample is created per
+                distinct value of this feature in a single aggregation, and
+                the feature is kept to identify the samples.
+            columnar: Whether to create the time series in the columnar
+                layout, i.e., as a struct of a `time` and a `value` list
+                instead of a list of `time` and `value` structs.
 
         Returns:
-            A OfflineEnvironment with exactly one sample containing the source
-            environment as a time series.
+            A OfflineEnvironment containing the source environment as a time
+            series. Without `partition_by`, it contains exactly one sample.
         """
         from flowcean.environments.dataset import Dataset
 
-        # Get the underlying dataframe
-        data = self.get_data()
-        # Create the time feature mapping
-        if isinstance(time_feature, str):
-            time_feature = {
-                feature_name: time_feature
-                for feature_name in data.columns
-                if feature_name != time_feature
-            }
-
-        # Convert the features into a time series
         return Dataset(
-            data.select(
-                [
-                    pl.struct(
-                        pl.col(t_feature).alias("time"),
-                        pl.col(value_feature).alias("value"),
-                    )
-                    .implode()
-                    .alias(value_feature)
-                    for value_feature, t_feature in time_feature.items()
-                ]
-            )
+            to_time_series_query(
+                self.get_lazy(),
+                time_feature,
+                partition_by,
+                columnar=columnar,
+            ).collect(),
         )
+
+
+def to_time_series_query(
+    data: pl.LazyFrame,
+    time_feature: str | dict[str, str],
+    partition_by: str | None,
+    *,
+    columnar: bool = False,
+) -> pl.LazyFrame:
+    """Build a query converting data into time series samples.
+
+    Args:
+        data: The data to convert.
+        time_feature: The feature that represents the time vector, or a
+            mapping from value features to their time vector features.
+        partition_by: A feature identifying the samples. If `None`, all data
+            is converted into a single sample.
+        columnar: Whether to create the time series in the columnar layout.
+
+    Returns:
+        The query converting the data into time series samples.
+    """
+    # Create the time feature mapping
+    if isinstance(time_feature, str):
+        time_feature = {
+            feature_name: time_feature
+            for feature_name in data.collect_schema().names()
+            if feature_name not in (time_feature, partition_by)
+        }
+
+    if columnar:
+        return _to_columnar_time_series_query(data, time_feature, partition_by)
+
+    # Convert the features into a time series
+    series = [
+        pl.struct(
+            pl.col(t_feature).alias("time"),
+            pl.col(value_feature).alias("value"),
+        ).alias(value_feature)
+        for value_feature, t_feature in time_feature.items()
+    ]
+    if partition_by is None:
+        return data.select([expression.implode() for expression in series])
+    return data.group_by(partition_by, maintain_order=True).agg(series)
+
+
+def _to_columnar_time_series_query(
+    data: pl.LazyFrame,
+    time_feature: dict[str, str],
+    partition_by: str | None,
+) -> pl.LazyFrame:
+    # Aggregate every feature into a list only once, even if a time vector
+    # is shared by multiple series, and pair the lists afterwards.
+    features = list(dict.fromkeys([*time_feature, *time_feature.values()]))
+    aggregated = (
+        data.select(pl.col(features).implode())
+        if partition_by is None
+        else data.group_by(partition_by, maintain_order=True).agg(features)
+    )
+    return aggregated.select(
+        *([] if partition_by is None else [partition_by]),
+        *(
+            pl.struct(
+                pl.col(t_feature).alias("time"),
+                pl.col(value_feature).alias("value"),
+            ).alias(value_feature)
+            for value_feature, t_feature in time_feature.items()
+        ),
+    )
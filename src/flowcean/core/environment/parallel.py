@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import TYPE_CHECKING, Literal, TypeVar
+
+from .base import Environment
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+logger = logging.getLogger(__name__)
+
+T_Environment = TypeVar("T_Environment", bound=Environment)
+
+type ExecutorKind = Literal["thread", "process"]
+
+
+class EnvironmentLoadError(Exception):
+    """Loading one or more environments failed.
+
+    This exception is raised after all environments have been attempted to be
+    loaded concurrently. The failures are reported per environment.
+
+    Attributes:
+        failures: The exception raised by each failed environment, keyed by
+            the position of the environment.
+    """
+
+    failures: dict[int, Exception]
+
+    def __init__(self, failures: dict[int, Exception]) -> None:
+        self.failures = failures
+        details = "; ".join(
+            f"environment {index}: {exception!r}"
+            for index, exception in sorted(failures.items())
+        )
+        super().__init__(
+            f"failed to load {len(failures)} environment(s): {details}",
+        )
+
+
+def load_environments(
+    environments: Sequence[T_Environment],
+    *,
+    max_workers: int | None = None,
+    max_in_flight: int | None = None,
+    executor: ExecutorKind = "thread",
+) -> list[T_Environment]:
+    """Load multiple environments.
+
+    Without `max_workers`, the environments are loaded one after another.
+    Otherwise, they are loaded concurrently in a pool of `max_workers` threads
+    or processes. At most `max_in_flight` environments are submitted to the
+    pool at the same time, so that the pool does not queue all environments
+    at once. When loading in processes, the loaded environments are copies of
+    the given ones, so they must be picklable.
+
+    Args:
+        environments: The environments to load.
+        max_workers: The number of workers used to load the environments
+            concurrently. If `None`, the environments are loaded
+            sequentially.
+        max_in_flight: The maximum number of environments loading at the same
+            time. Defaults to twice the number of workers.
+        executor: Whether to load environments in threads or processes.
+
+    Returns:
+        The loaded environments in the order of `environments`.
+
+    Raises:
+        EnvironmentLoadError: If loading any environment failed when loading
+            concurrently.
+    """
+    if max_workers is None:
+        return [environment.load() for environment in environments]
+    if max_in_flight is None:
+        max_in_flight = 2 * max_workers
+
+    loaded: list[T_Environment] = list(environments)
+    failures: dict[int, Exception] = {}
+    pool: Executor = (
+        ProcessPoolExecutor(max_workers)
+        if executor == "process"
+        else ThreadPoolExecutor(max_workers, "flowcean-load")
+    )
+    with pool:
+        in_flight: dict[Future[T_Environment], int] = {}
+        for index, environment in enumerate(environments):
+            if len(in_flight) >= max_in_flight:
+                _collect(in_flight, loaded, failures, wait_for_all=False)
+            in_flight[pool.submit(_load, environment)] = index
+        _collect(in_flight, loaded, failures, wait_for_all=True)
+
+    if failures:
+        raise EnvironmentLoadError(failures)
+    return loaded
+
+
+def _load(environment: T_Environment) -> T_Environment:
+    return environment.load()
+
+
+def _collect(
+    in_flight: dict[Future[T_Environment], int],
+    loaded: list[T_Environment],
+    failures: dict[int, Exception],
+    *,
+    wait_for_all: bool,
+) -> None:
+    done, _ = wait(
+        in_flight,
+        return_when=ALL_COMPLETED if wait_for_all else FIRST_COMPLETED,
+    )
+    for future in done:
+        index = in_flight.pop(future)
+        exception = future.exception()
+        if exception is None:
+            loaded[index] = future.result()
+        elif isinstance(exception, Exception):
+            logger.error("Failed to load environment %d: %s", index, exception)
+            failures[index] = exception
+        else:
+            raise exception
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import queue
+import threading
+from typing import TYPE_CHECKING, Self, override
+
+from .incremental import IncrementalEnvironment
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import polars as pl
+
+
+class PrefetchingEnvironment(IncrementalEnvironment):
+    """Prefetch the batches of an incremental environment in the background.
+
+    This class wraps an incremental environment and produces its batches in a
+    background thread while the consumer, e.g., a learner, processes the
+    previous batches. Produced batches are stored in a bounded queue of
+    `depth` batches. When the queue is full, the producer waits until the
+    consumer takes a batch, so at most `depth` batches are held in memory.
+
+    Producing batches in a thread pays off when the environment releases the
+    GIL while producing, e.g., when reading and decoding files with polars or
+    integrating with numpy and scipy.
+
+    Attributes:
+        environment: The incremental environment to wrap.
+        depth: The maximum number of batches to prefetch.
+    """
+
+    environment: IncrementalEnvironment
+    depth: int
+
+    def __init__(
+        self,
+        environment: IncrementalEnvironment,
+        depth: int = 2,
+    ) -> None:
+        """Initialize a prefetching environment.
+
+        Args:
+            environment: The incremental environment to wrap.
+            depth: The maximum number of batches to prefetch.
+        """
+        if depth < 1:
+            message = "depth must be positive"
+            raise ValueError(message)
+        self.environment = environment
+        self.depth = depth
+
+    @override
+    def load(self) -> Self:
+        self.environment.load()
+        return self
+
+    @override
+    def __iter__(self) -> Iterator[pl.DataFrame]:
+        batches: queue.Queue[pl.DataFrame | _Done] = queue.Queue(
+            maxsize=self.depth,
+        )
+        stop = threading.Event()
+        producer = threading.Thread(
+            target=self._produce,
+            args=(batches, stop),
+            name="flowcean-prefetch",
+            daemon=True,
+        )
+        producer.start()
+        try:
+            while not isinstance(item := batches.get(), _Done):
+                yield item
+            if item.exception is not None:
+                raise item.exception
+        finally:
+            stop.set()
+            producer.join()
+
+    def _produce(
+        self,
+        batches: queue.Queue[pl.DataFrame | _Done],
+        stop: threading.Event,
+    ) -> None:
+        done = _Done()
+        try:
+            for batch in self.environment:
+                if not _put(batches, batch, stop):
+                    return
+        except BaseException as exception:  # noqa: BLE001
+            done.exception = exception
+        finally:
+            # The consumer waits for this sentinel, so it is enqueued however
+            # the producer stops.
+            _put(batches, done, stop)
+
+
+class _Done:
+    exception: BaseException | None = None
+
+
+def _put(
+    batches: queue.Queue[pl.DataFrame | _Done],
+    item: pl.DataFrame | _Done,
+    stop: threading.Event,
+) -> bool:
+    while not stop.is_set():
+        try:
+            batches.put(item, timeout=0.1)
+        except queue.Full:
+            continue
+        return True
+    return False
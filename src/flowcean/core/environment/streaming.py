@@ -18,19 +18,19 @@ class StreamingOfflineData(IncrementalEnvironment):
     """Streaming offline data.
 
     This class wraps an offline environment and provides a streaming interface
-    to its data. The data is loaded once and then streamed in batches of a
-    given size.
+    to its data. The data is streamed in batches of a given size, which are
+    requested from the environment on demand. Environments backed by files
+    read the batches from disk, so the data does not need to fit into memory.
 
     Attributes:
         environment: The offline environment to wrap.
         batch_size: The number of samples to yield at each iteration.
-        index: The current index of the data.
-        data: The loaded data.
+        loaded: Whether the wrapped environment has been loaded.
     """
 
     environment: OfflineEnvironment
     batch_size: int
-    data: pl.DataFrame | None
+    loaded: bool
 
     def __init__(
         self,
@@ -45,17 +45,16 @@ class StreamingOfflineData(IncrementalEnvironment):
         """
         self.environment = environment
         self.batch_size = batch_size
-        self.data = None
+        self.loaded = False
 
     @override
     def load(self) -> Self:
         self.environment.load()
-        self.data = self.environment.get_data()
+        self.loaded = True
         return self
 
     @override
     def __iter__(self) -> Iterator[pl.DataFrame]:
-        if self.data is None:
+        if not self.loaded:
             raise NotLoadedError
-        for i in range(0, len(self.data), self.batch_size):
-            yield self.data.slice(i, self.batch_size)
+        return self.environment.iter_batches(self.batch_size)
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+import hashlib
+import logging
+import pickle
+import uuid
+from pathlib import Path
 from typing import TYPE_CHECKING, Generic, Self, TypeVar, override
 
+import polars as pl
+
 from .base import Environment
 from .incremental import IncrementalEnvironment
 from .offline import OfflineEnvironment
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
-
-    import polars as pl
+    from collections.abc import Iterable, Iterator
 
     from flowcean.core import Transform
 
+logger = logging.getLogger(__name__)
+
 T_Environment = TypeVar("T_Environment", bound=Environment)
 T_OfflineEnvironment = TypeVar(
     "T_OfflineEnvironment",
@@ -32,44 +39,222 @@ class TransformedEnvironment(
     """Environment with a transform.
 
     This class wraps an environment and a transform. It applies the transform
-    to any data of the environment before returning it.
+    to any data of the environment before returning it. For incremental
+    environments, the batches are transformed as a stream. For offline
+    environments, the transform is added to the lazy query plan of the wrapped
+    environment, so that the data is only computed once it is requested.
+    Transforms that are not expressed lazily, e.g., `Resample` or `Flatten`,
+    are an exception: they are applied eagerly when `get_lazy` is called,
+    together with the part of the query they depend on.
+    Iterating over the batches of an uncached offline environment transforms
+    the batches of the wrapped environment as a stream, so that the data does
+    not need to fit into memory.
+
+    Optionally, the transformed data of an offline environment can be cached,
+    so that repeated requests do not run the transform again. The cache is
+    keyed by the parameters of the transform and the `fingerprint` of the
+    wrapped environment, so it is invalidated when the data of the wrapped
+    environment or the parameters of the transform change. The data of
+    environments without a fingerprint, e.g., in-memory datasets, is cached
+    until this environment is loaded again.
+
+    If a cache directory is given, the cached data is stored as an Arrow IPC
+    file named after the fingerprint of this environment and memory-mapped,
+    so that it does not occupy main memory. Runs transforming the same data
+    share these files. This requires the wrapped environment to have a
+    fingerprint and the transform to be picklable. Files are never removed by
+    the environment, as returned data may still map them, so stale files of
+    changed data have to be removed from the directory manually.
 
     Attributes:
         environment: The environment to wrap.
         transform: The transform to apply to the data of the environment.
+        cache: Whether the transformed data is cached.
+        cache_directory: Directory of the on-disk cache, or `None` if results
+            are only cached in memory.
+        cache_hits: Number of requests served from the cache.
+        cache_misses: Number of requests that required to run the transform.
     """
 
     environment: T_Environment
     transform: Transform
+    cache: bool
+    cache_directory: Path | None
+    cache_hits: int
+    cache_misses: int
 
     def __init__(
         self,
         environment: T_Environment,
         transform: Transform,
+        *,
+        cache: bool = False,
+        cache_directory: str | Path | None = None,
     ) -> None:
         """Initialize a transformed environment.
 
         Args:
             environment: The environment to wrap.
             transform: The transform to apply to the data of the environment.
+            cache: Whether to cache the transformed data. Only supported for
+                offline environments.
+            cache_directory: Directory to store cached data in. If not
+                provided, data is cached in memory.
+
+        Raises:
+            ValueError: If caching is requested for an environment that is
+                not an offline environment.
         """
+        if cache and not isinstance(environment, OfflineEnvironment):
+            message = "caching is only supported for offline environments"
+            raise ValueError(message)
         self.environment = environment
         self.transform = transform
+        self.cache = cache
+        self.cache_directory = (
+            Path(cache_directory) if cache_directory is not None else None
+        )
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cached_key: str | None = None
+        self._cached_data: pl.DataFrame | None = None
 
     @override
     def load(self) -> Self:
         self.environment.load()
+        self.invalidate_cache()
         return self
 
     @override
     def get_data(
         self: TransformedEnvironment[T_OfflineEnvironment],
     ) -> pl.DataFrame:
-        data = self.environment.get_data()
-        return self.transform.transform(data)
+        if not self.cache:
+            return self._transformed().collect()
+
+        key = self._cache_key()
+        if self._cached_data is not None and self._cached_key == key:
+            self.cache_hits += 1
+            return self._cached_data
+
+        self.invalidate_cache()
+        if self.cache_directory is None:
+            self.cache_misses += 1
+            data = self._transformed().collect()
+        else:
+            data = self._read_disk_cache(self.cache_directory)
+        self._cached_key = key
+        self._cached_data = data
+        return data
+
+    @override
+    def get_lazy(
+        self: TransformedEnvironment[T_OfflineEnvironment],
+    ) -> pl.LazyFrame:
+        if self.cache:
+            return self.get_data().lazy()
+        return self._transformed()
+
+    @override
+    def iter_batches(
+        self: TransformedEnvironment[T_OfflineEnvironment],
+        batch_size: int,
+        features: Iterable[str] | None = None,
+    ) -> Iterator[pl.DataFrame]:
+        # prevent circular imports
+        from flowcean.utils import rebatch
+
+        if self.cache:
+            return super().iter_batches(batch_size, features)
+        batches = self.transform.transform_stream(
+            self.environment.iter_batches(batch_size),
+        )
+        if features is not None:
+            selected = list(features)
+            batches = (batch.select(selected) for batch in batches)
+        return rebatch(batches, batch_size)
+
+    @override
+    def fingerprint(
+        self: TransformedEnvironment[T_OfflineEnvironment],
+    ) -> str | None:
+        # prevent circular imports
+        from flowcean.utils import combine_fingerprints
+
+        return combine_fingerprints(
+            [
+                self.environment.fingerprint(),
+                _transform_fingerprint(self.transform),
+            ],
+        )
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached data of this environment.
+
+        Files in the cache directory are kept, as they may still be mapped by
+        returned data and are only reused for the same data.
+        """
+        self._cached_key = None
+        self._cached_data = None
+
+    def _read_disk_cache(
+        self: TransformedEnvironment[T_OfflineEnvironment],
+        directory: Path,
+    ) -> pl.DataFrame:
+        fingerprint = self.fingerprint()
+        if fingerprint is None:
+            message = (
+                "caching on disk requires a wrapped environment with a "
+                "fingerprint and a picklable transform"
+            )
+            raise ValueError(message)
+        path = directory / f"{fingerprint}.arrow"
+        if path.exists():
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+            directory.mkdir(parents=True, exist_ok=True)
+            partial = path.with_suffix(f".{uuid.uuid4().hex}.partial")
+            self._transformed().collect().write_ipc(
+                partial,
+                compression="uncompressed",
+            )
+            partial.replace(path)
+        return pl.read_ipc(path, memory_map=True)
+
+    def _transformed(
+        self: TransformedEnvironment[T_OfflineEnvironment],
+    ) -> pl.LazyFrame:
+        data = self.environment.get_lazy()
+        return self.transform.transform_lazy(data)
+
+    def _cache_key(
+        self: TransformedEnvironment[T_OfflineEnvironment],
+    ) -> str:
+        # Without fingerprints, the data is identified by the objects that
+        # produce it, which is only valid as long as this environment is not
+        # loaded again.
+        source = self.environment.fingerprint()
+        transform = _transform_fingerprint(self.transform)
+        key = hashlib.sha256()
+        key.update((source or f"{id(self.environment):x}").encode())
+        key.update(b"\0")
+        key.update((transform or f"{id(self.transform):x}").encode())
+        return key.hexdigest()
 
     @override
     def __iter__(
         self: TransformedEnvironment[T_IncrementalEnvironment],
     ) -> Iterator[pl.DataFrame]:
-        return self.environment.__iter__()
+        return self.transform.transform_stream(self.environment)
+
+
+def _transform_fingerprint(transform: Transform) -> str | None:
+    try:
+        return hashlib.sha256(pickle.dumps(transform)).hexdigest()
+    except (pickle.PicklingError, AttributeError, TypeError):
+        logger.debug(
+            "Transform cannot be pickled, changes of its parameters will not "
+            "invalidate the cache",
+        )
+        return None
@@ -1,5 +1,6 @@
+import copy
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Self, override
 
 import polars as pl
 
@@ -27,3 +28,50 @@ class OfflineMetric(ABC):
         Returns:
             Metric value
         """
+
+
+class OnlineMetric(OfflineMetric):
+    """Base class for metrics computed incrementally.
+
+    Online metrics accumulate a state of constant size from batches of true
+    and predicted labels, so they can evaluate a model on data that does not
+    fit into memory. The states of metrics updated on different batches can
+    be merged. Calling an online metric computes its value on the given data
+    alone and leaves the accumulated state untouched.
+    """
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Reset the accumulated state of the metric."""
+
+    @abstractmethod
+    def update(self, true: pl.DataFrame, predicted: pl.DataFrame) -> None:
+        """Update the state of the metric with a batch of labels.
+
+        Args:
+            true: True labels
+            predicted: Predicted labels
+        """
+
+    @abstractmethod
+    def compute(self) -> Any:
+        """Compute the metric value from the accumulated state.
+
+        Returns:
+            Metric value
+        """
+
+    @abstractmethod
+    def merge(self, other: Self) -> None:
+        """Merge the accumulated state of another metric into this one.
+
+        Args:
+            other: The metric to merge, updated on other batches.
+        """
+
+    @override
+    def __call__(self, true: pl.DataFrame, predicted: pl.DataFrame) -> Any:
+        metric = copy.deepcopy(self)
+        metric.reset()
+        metric.update(true, predicted)
+        return metric.compute()
@@ -1,14 +1,26 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import override
+from typing import Any, override
 
+import numpy as np
 import polars as pl
+from numpy.typing import NDArray
 
 from .transform import Transform
 
 
 class Model(ABC):
+    """Base class for models.
+
+    Attributes:
+        input_names: The names of the input features the model was learned
+            with, if known. Used to name the columns of arrays passed to
+            `predict_array`.
+    """
+
+    input_names: list[str] | None = None
+
     @abstractmethod
     def predict(
         self,
@@ -23,6 +35,54 @@ class Model(ABC):
             The predicted outputs.
         """
 
+    def predict_array(
+        self,
+        inputs: NDArray[Any],
+        out: NDArray[Any] | None = None,
+    ) -> NDArray[Any]:
+        """Predict outputs for an array of input samples.
+
+        This avoids building DataFrames for models that can predict on arrays
+        directly, e.g., in control loops predicting a few samples at a time.
+        By default, the inputs are passed to `predict` as a DataFrame with
+        the columns named after `input_names`.
+
+        Args:
+            inputs: The inputs of shape `(samples, input features)` with the
+                features in the order the model was learned with.
+            out: An optional array of shape `(samples, output features)` to
+                write the predictions to, e.g., a buffer reused across calls.
+
+        Returns:
+            The predicted outputs of shape `(samples, output features)`.
+        """
+        predictions = self.predict(
+            pl.DataFrame(inputs, schema=self.input_names, orient="row"),
+        )
+        return write_predictions(predictions.to_numpy(), out)
+
+    def predict_one(
+        self,
+        inputs: NDArray[Any],
+        out: NDArray[Any] | None = None,
+    ) -> NDArray[Any]:
+        """Predict the outputs of a single input sample.
+
+        Args:
+            inputs: The input vector of shape `(input features,)`.
+            out: An optional array of shape `(output features,)` to write the
+                prediction to. It does not need to be contiguous.
+
+        Returns:
+            The predicted output vector of shape `(output features,)`.
+        """
+        if out is None:
+            return self.predict_array(inputs.reshape(1, -1))[0]
+        # Unlike reshaping, adding an axis always returns a view, so that the
+        # prediction is written to `out` even if it is not contiguous.
+        self.predict_array(inputs.reshape(1, -1), out[np.newaxis])
+        return out
+
     @abstractmethod
     def save(self, path: Path) -> None:
         """Save the model to path.
@@ -42,8 +102,18 @@ class Model(ABC):
 
 @dataclass
 class ModelWithTransform(Model):
+    """Model applying a transform to its inputs before predicting.
+
+    Attributes:
+        model: The model predicting the transformed inputs.
+        transform: The transform applied to the inputs.
+        input_names: The names of the input features before the transform.
+            Required to predict on arrays, whose columns have no names.
+    """
+
     model: Model
     transform: Transform
+    input_names: list[str] | None = None
 
     @override
     def predict(
@@ -53,6 +123,20 @@ class ModelWithTransform(Model):
         transformed = self.transform.transform(input_features)
         return self.model.predict(transformed)
 
+    @override
+    def predict_array(
+        self,
+        inputs: NDArray[Any],
+        out: NDArray[Any] | None = None,
+    ) -> NDArray[Any]:
+        if self.input_names is None:
+            message = "predicting on arrays requires the input names"
+            raise ValueError(message)
+        transformed = self.transform.transform(
+            pl.DataFrame(inputs, schema=self.input_names, orient="row"),
+        )
+        return self.model.predict_array(transformed.to_numpy(), out)
+
     @override
     def save(self, path: Path) -> None:
         raise NotImplementedError
@@ -60,3 +144,22 @@ class ModelWithTransform(Model):
     @override
     def load(self, path: Path) -> None:
         raise NotImplementedError
+
+
+def write_predictions(
+    predictions: NDArray[Any],
+    out: NDArray[Any] | None,
+) -> NDArray[Any]:
+    """Write predictions to an optional output array.
+
+    Args:
+        predictions: The predictions.
+        out: The array to write the predictions to, if any.
+
+    Returns:
+        The output array if given, otherwise the predictions.
+    """
+    if out is None:
+        return predictions
+    np.copyto(out, predictions.reshape(out.shape))
+    return out
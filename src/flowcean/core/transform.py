@@ -55,6 +55,8 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     import polars as pl
 
     from .chain import Chain
@@ -85,6 +87,100 @@ class Transform(ABC):
         """
         return self.transform(data)
 
+    def fit_transform(self, data: pl.DataFrame) -> pl.DataFrame:
+        """Fit this transform to data and transform the same data.
+
+        Transforms that are unsupervised learners are fitted to the data
+        first. Transforms that can compute the fit and the transformation
+        more efficiently in one step should override this method.
+
+        Args:
+            data: The data to fit to and transform.
+
+        Returns:
+            The transformed data.
+        """
+        # prevent circular imports
+        from .learner import UnsupervisedLearner
+
+        if isinstance(self, UnsupervisedLearner):
+            self.fit(data)
+        return self.transform(data)
+
+    def fit_transform_incremental(self, data: pl.DataFrame) -> pl.DataFrame:
+        """Fit this transform to data incrementally and transform the data.
+
+        Transforms that are unsupervised incremental learners are fitted to
+        the data first.
+
+        Args:
+            data: The data to fit to and transform.
+
+        Returns:
+            The transformed data.
+        """
+        # prevent circular imports
+        from .learner import UnsupervisedIncrementalLearner
+
+        if isinstance(self, UnsupervisedIncrementalLearner):
+            self.fit_incremental(data)
+        return self.transform(data)
+
+    def transform_lazy(self, data: pl.LazyFrame) -> pl.LazyFrame:
+        """Add this transform to a lazy query plan.
+
+        Transforms that can be expressed as polars expressions should override
+        this method, so that they become part of the query plan and benefit
+        from its optimizations. By default, the plan is collected and the
+        transform is applied eagerly, which acts as a barrier in the plan.
+        The barrier is not deferred: the query built so far and this
+        transform are executed when this method is called, not when the
+        returned plan is collected.
+
+        Args:
+            data: The lazy data to transform.
+
+        Returns:
+            The lazily transformed data.
+        """
+        return self.transform(data.collect()).lazy()
+
+    @property
+    def fusable(self) -> bool:
+        """Whether this transform is best applied as part of a lazy query.
+
+        Chains fuse consecutive fusable transforms into a single query, and
+        apply all other transforms eagerly with `transform`. By default, a
+        transform is fusable if it overrides `transform_lazy`. Transforms
+        with an eager implementation that is faster than their lazy one
+        should return `False`.
+
+        Returns:
+            Whether this transform is fusable.
+        """
+        return type(self).transform_lazy is not Transform.transform_lazy
+
+    def transform_stream(
+        self,
+        batches: Iterable[pl.DataFrame],
+    ) -> Iterator[pl.DataFrame]:
+        """Transform a stream of batches with this transform.
+
+        By default, every batch is transformed independently. Transforms whose
+        result depends on neighbouring rows, e.g., windows over the row
+        dimension, should override this method to carry the required state
+        across batch boundaries, so that the transformed stream matches the
+        transform of the concatenated batches.
+
+        Args:
+            batches: The stream of batches to transform.
+
+        Yields:
+            The transformed batches.
+        """
+        for batch in batches:
+            yield self.transform(batch)
+
     def __or__(self, other: Transform) -> Chain:
         """Pipe this transform into another transform.
 
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Self, override
 
@@ -6,38 +7,111 @@ import polars as pl
 
 from flowcean.core import OfflineEnvironment
 from flowcean.core.environment import NotLoadedError
+from flowcean.utils import file_fingerprint, rebatch, resolve_features
 
 logger = logging.getLogger(__name__)
 
 
 class CsvDataLoader(OfflineEnvironment):
-    """DataLoader for CSV files."""
+    """DataLoader for CSV files.
+
+    The file is scanned lazily, so only the data that is actually required by
+    a query is parsed. When streamed, the file is parsed in chunks of
+    `read_size` rows, so that it does not need to fit into memory.
+    """
 
     path: Path
     separator: str
+    read_size: int
     data: pl.DataFrame | None = None
+    lazy_data: pl.LazyFrame | None = None
 
-    def __init__(self, path: str | Path, separator: str = ",") -> None:
+    def __init__(
+        self,
+        path: str | Path,
+        separator: str = ",",
+        *,
+        read_size: int = 65_536,
+    ) -> None:
         """Initialize the CsvDataLoader.
 
         Args:
             path: Path to the CSV file.
             separator: Value separator. Defaults to ",".
+            read_size: Number of rows parsed at once when streaming the file.
         """
         self.path = Path(path)
         self.separator = separator
+        self.read_size = read_size
+
+    @override
+    def fingerprint(self) -> str | None:
+        return file_fingerprint(self.path, self.separator)
 
     @override
     def load(self) -> Self:
         logger.info("Loading data from %s", self.path)
-        self.data = pl.read_csv(self.path, separator=self.separator)
-        self.data.columns = [
-            column_name.strip() for column_name in self.data.columns
-        ]
+        self.lazy_data = pl.scan_csv(
+            self.path,
+            separator=self.separator,
+            with_column_names=_strip_column_names,
+        )
+        self.data = None
         return self
 
     @override
     def get_data(self) -> pl.DataFrame:
         if self.data is None:
-            raise NotLoadedError
+            self.data = self.get_lazy().collect()
         return self.data
+
+    @override
+    def get_lazy(self) -> pl.LazyFrame:
+        if self.lazy_data is None:
+            raise NotLoadedError
+        if self.data is not None:
+            return self.data.lazy()
+        return self.lazy_data
+
+    @override
+    def iter_batches(
+        self,
+        batch_size: int,
+        features: Iterable[str] | None = None,
+    ) -> Iterator[pl.DataFrame]:
+        if self.data is not None:
+            return super().iter_batches(batch_size, features)
+        return rebatch(
+            self._read_chunks(max(batch_size, self.read_size), features),
+            batch_size,
+        )
+
+    def _read_chunks(
+        self,
+        length: int,
+        features: Iterable[str] | None,
+    ) -> Iterator[pl.DataFrame]:
+        schema = self.get_lazy().collect_schema()
+        names = schema.names()
+        columns = (
+            names if features is None else resolve_features(names, features)
+        )
+        # Columns are parsed by their index, as the names in the file are not
+        # stripped yet. The reader returns them in the order of the file.
+        indices = sorted(names.index(column) for column in columns)
+        reader = pl.read_csv_batched(
+            self.path,
+            separator=self.separator,
+            batch_size=length,
+            columns=indices,
+        )
+        while (chunks := reader.next_batches(1)) is not None:
+            for chunk in chunks:
+                chunk.columns = [names[index] for index in indices]
+                yield chunk.select(columns).cast(
+                    {column: schema[column] for column in columns},
+                )
+
+
+def _strip_column_names(column_names: list[str]) -> list[str]:
+    return [column_name.strip() for column_name in column_names]
@@ -6,6 +6,7 @@ import polars as pl
 
 from flowcean.core import OfflineEnvironment
 from flowcean.core.environment import NotLoadedError
+from flowcean.utils import file_fingerprint
 
 
 class JsonDataLoader(OfflineEnvironment):
@@ -15,6 +16,10 @@ class JsonDataLoader(OfflineEnvironment):
     def __init__(self, path: str | Path) -> None:
         self.path = Path(path)
 
+    @override
+    def fingerprint(self) -> str | None:
+        return file_fingerprint(self.path)
+
     @override
     def load(self) -> Self:
         with self.path.open() as file:
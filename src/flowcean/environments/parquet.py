@@ -1,3 +1,4 @@
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Self, override
 
@@ -5,29 +6,79 @@ import polars as pl
 
 from flowcean.core import OfflineEnvironment
 from flowcean.core.environment import NotLoadedError
+from flowcean.utils import file_fingerprint, rebatch, resolve_features
 
 
 class ParquetDataLoader(OfflineEnvironment):
-    """DataLoader for Parquet files."""
+    """DataLoader for Parquet files.
+
+    The file is scanned lazily, so only the data that is actually required by
+    a query is read from disk. When streamed, the file is read in slices of
+    `read_size` rows, so that it does not need to fit into memory.
+    """
 
     path: Path
+    read_size: int
     data: pl.DataFrame | None = None
+    lazy_data: pl.LazyFrame | None = None
 
-    def __init__(self, path: str | Path) -> None:
+    def __init__(self, path: str | Path, *, read_size: int = 65_536) -> None:
         """Initialize the ParquetDataLoader.
 
         Args:
             path: Path to the Parquet file.
+            read_size: Number of rows read at once when streaming the file.
         """
         self.path = Path(path)
+        self.read_size = read_size
+
+    @override
+    def fingerprint(self) -> str | None:
+        return file_fingerprint(self.path)
 
     @override
     def load(self) -> Self:
-        self.data = pl.read_parquet(self.path)
+        self.lazy_data = pl.scan_parquet(self.path)
+        self.data = None
         return self
 
     @override
     def get_data(self) -> pl.DataFrame:
         if self.data is None:
-            raise NotLoadedError
+            self.data = self.get_lazy().collect()
         return self.data
+
+    @override
+    def get_lazy(self) -> pl.LazyFrame:
+        if self.lazy_data is None:
+            raise NotLoadedError
+        if self.data is not None:
+            return self.data.lazy()
+        return self.lazy_data
+
+    @override
+    def iter_batches(
+        self,
+        batch_size: int,
+        features: Iterable[str] | None = None,
+    ) -> Iterator[pl.DataFrame]:
+        if self.data is not None:
+            return super().iter_batches(batch_size, features)
+        return rebatch(
+            self._read_slices(max(batch_size, self.read_size), features),
+            batch_size,
+        )
+
+    def _read_slices(
+        self,
+        length: int,
+        features: Iterable[str] | None,
+    ) -> Iterator[pl.DataFrame]:
+        data = self.get_lazy()
+        if features is not None:
+            data = data.select(
+                resolve_features(data.collect_schema().names(), features),
+            )
+        height = data.select(pl.len()).collect().item()
+        for offset in range(0, height, length):
+            yield data.slice(offset, length).collect()
@@ -1,24 +1,168 @@
+import math
+import warnings
+from collections.abc import Iterator, Sequence
+
+import numpy as np
 import polars as pl
+import torch
 from torch import Tensor
-from torch.utils.data import Dataset
+from torch.utils.data import (
+    DataLoader,
+    Dataset,
+    Sampler,
+)
 
 
 class TorchDataset(Dataset[tuple[Tensor, Tensor]]):
+    """PyTorch dataset of input and output features.
+
+    The features are converted once to contiguous `float32` tensors when the
+    dataset is created, without a copy where the layout of the data allows
+    it, e.g., for a single `Float32` column. Indexing the dataset with an
+    integer returns the tensors of a single sample, while indexing with a
+    slice or a sequence of indices returns a whole batch at once. Use
+    `data_loader` to iterate over batches without looking up every sample
+    separately.
+
+    Attributes:
+        inputs: The input features.
+        outputs: The output features, if any.
+        input_tensor: The input features as a tensor of shape
+            `(samples, input features)`.
+        output_tensor: The output features as a tensor of shape
+            `(samples, output features)`. Has no columns if the dataset has
+            no outputs.
+    """
+
+    inputs: pl.DataFrame
+    outputs: pl.DataFrame | None
+    input_tensor: Tensor
+    output_tensor: Tensor
+
     def __init__(
         self,
         inputs: pl.DataFrame,
         outputs: pl.DataFrame | None = None,
     ) -> None:
+        """Initialize the dataset.
+
+        Args:
+            inputs: The input features.
+            outputs: The output features, if any.
+        """
         self.inputs = inputs
         self.outputs = outputs
+        self.input_tensor = to_tensor(inputs)
+        self.output_tensor = (
+            torch.empty((len(inputs), 0))
+            if outputs is None
+            else to_tensor(outputs)
+        )
 
     def __len__(self) -> int:
         return len(self.inputs)
 
-    def __getitem__(self, item: int) -> tuple[Tensor, Tensor]:
-        inputs = Tensor(self.inputs.row(item))
-        if self.outputs is None:
-            outputs = Tensor([])
-        else:
-            outputs = Tensor(self.outputs.row(item))
-        return inputs, outputs
+    def __getitem__(
+        self,
+        item: int | slice | Sequence[int],
+    ) -> tuple[Tensor, Tensor]:
+        if isinstance(item, int | slice):
+            return self.input_tensor[item], self.output_tensor[item]
+        indices = torch.as_tensor(item, dtype=torch.long)
+        return (
+            self.input_tensor.index_select(0, indices),
+            self.output_tensor.index_select(0, indices),
+        )
+
+    def data_loader(
+        self,
+        batch_size: int,
+        *,
+        shuffle: bool = False,
+        num_workers: int = 0,
+        persistent_workers: bool = False,
+    ) -> DataLoader[tuple[Tensor, Tensor]]:
+        """Create a data loader serving whole batches of the dataset.
+
+        Every batch is taken from the tensors of the dataset at once. Without
+        shuffling, the batches are views of the tensors and no data is copied.
+
+        Args:
+            batch_size: The number of samples per batch.
+            shuffle: Whether to shuffle the samples on every epoch.
+            num_workers: The number of worker processes of the data loader.
+            persistent_workers: Whether to keep the workers alive between
+                epochs.
+
+        Returns:
+            The data loader.
+        """
+        return DataLoader(
+            self,
+            batch_size=None,
+            sampler=BatchSampler(len(self), batch_size, shuffle=shuffle),
+            num_workers=num_workers,
+            persistent_workers=persistent_workers and num_workers > 0,
+        )
+
+
+class BatchSampler(Sampler[slice | list[int]]):
+    """Sample the indices of whole batches.
+
+    Without shuffling, the batches are contiguous slices, so that indexing a
+    tensor with them returns a view instead of a copy.
+    """
+
+    def __init__(
+        self,
+        length: int,
+        batch_size: int,
+        *,
+        shuffle: bool = False,
+    ) -> None:
+        """Initialize the sampler.
+
+        Args:
+            length: The number of samples.
+            batch_size: The number of samples per batch.
+            shuffle: Whether to shuffle the samples on every iteration.
+        """
+        if batch_size < 1:
+            message = "batch_size must be positive"
+            raise ValueError(message)
+        self.length = length
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+
+    def __len__(self) -> int:
+        return math.ceil(self.length / self.batch_size)
+
+    def __iter__(self) -> Iterator[slice | list[int]]:
+        if not self.shuffle:
+            for start in range(0, self.length, self.batch_size):
+                yield slice(start, min(start + self.batch_size, self.length))
+            return
+        indices = torch.randperm(self.length).tolist()
+        for start in range(0, self.length, self.batch_size):
+            yield indices[start : start + self.batch_size]
+
+
+def to_tensor(data: pl.DataFrame) -> Tensor:
+    """Convert a DataFrame to a contiguous `float32` tensor.
+
+    Args:
+        data: The DataFrame to convert.
+
+    Returns:
+        The tensor of shape `(rows, columns)`. It shares the memory of the
+        DataFrame if its layout allows it.
+    """
+    array = np.ascontiguousarray(
+        data.to_numpy(order="c"),
+        dtype=np.float32,
+    ).reshape(len(data), data.width)
+    with warnings.catch_warnings():
+        # Zero-copy arrays of polars are read-only. The dataset never writes
+        # to its tensors.
+        warnings.filterwarnings("ignore", "The given NumPy array is not")
+        return torch.from_numpy(array)
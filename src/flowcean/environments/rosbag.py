@@ -1,6 +1,6 @@
 """Loading data from rosbag topics."""
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 from typing import Self, override
 
@@ -10,6 +10,7 @@ from rosbags.highlevel import AnyReader
 
 from flowcean.core.environment import OfflineEnvironment
 from flowcean.core.environment.base import NotLoadedError
+from flowcean.utils import resolve_features
 
 
 class RosbagLoader(OfflineEnvironment):
@@ -17,7 +18,10 @@ class RosbagLoader(OfflineEnvironment):
 
     The RosbagEnvironment is used to load data from a rosbag file. The
     environment is initialized with the path to the rosbag file and a
-    dictionary of topics to load.
+    dictionary of topics to load. Each topic becomes a time series feature
+    named after the topic. Topics are read from the rosbag when their data is
+    first requested, so selecting a subset of the features only reads the
+    corresponding topics.
 
     Example:
         ```python
@@ -46,38 +50,67 @@ class RosbagLoader(OfflineEnvironment):
         self,
         path: str | Path,
         topics: dict[str, list[str]],
+        *,
+        columnar: bool = False,
     ) -> None:
         """Initialize the RosbagEnvironment.
 
         Args:
             path: Path to the rosbag.
             topics: Dictionary of topics to load (`topic: [keys]`).
+            columnar: Whether to load the topics as time series in the
+                columnar layout, i.e., as a struct of a `time` and a `value`
+                list.
         """
         self.path = Path(path)
         self.topics = topics
-        self.data = None
+        self.columnar = columnar
+        self.topic_data: dict[str, pl.DataFrame] | None = None
 
     @override
     def load(self) -> Self:
-        with AnyReader([self.path]) as reader:
-            features = [
-                read_timeseries(reader, topic, keys)
-                for topic, keys in self.topics.items()
-            ]
-            self.data = pl.concat(features, how="horizontal")
+        if not self.path.exists():
+            raise FileNotFoundError(self.path)
+        self.topic_data = {}
         return self
 
     @override
     def get_data(self) -> pl.DataFrame:
-        if self.data is None:
+        return self._read_topics(list(self.topics))
+
+    @override
+    def get_lazy(self) -> pl.LazyFrame:
+        return self.get_data().lazy()
+
+    @override
+    def select(self, features: Iterable[str]) -> pl.DataFrame:
+        return self._read_topics(resolve_features(list(self.topics), features))
+
+    def _read_topics(self, topics: Sequence[str]) -> pl.DataFrame:
+        if self.topic_data is None:
             raise NotLoadedError
-        return self.data
+        missing = [topic for topic in topics if topic not in self.topic_data]
+        if missing:
+            with AnyReader([self.path]) as reader:
+                for topic in missing:
+                    self.topic_data[topic] = read_timeseries(
+                        reader,
+                        topic,
+                        self.topics[topic],
+                        columnar=self.columnar,
+                    )
+        return pl.concat(
+            [self.topic_data[topic] for topic in topics],
+            how="horizontal",
+        )
 
 
 def read_timeseries(
     reader: AnyReader,
     topic: str,
     keys: Sequence[str],
+    *,
+    columnar: bool = False,
 ) -> pl.DataFrame:
     """Read a timeseries from a rosbag topic.
 
@@ -85,6 +118,7 @@ def read_timeseries(
         reader: Rosbag reader.
         topic: Topic name.
         keys: Keys to read from the topic.
+        columnar: Whether to return the time series in the columnar layout.
 
     Returns:
         Timeseries DataFrame.
@@ -92,6 +126,13 @@ def read_timeseries(
     data = pl.from_pandas(
         get_dataframe(reader, topic, keys).reset_index(names="time"),
     )
+    if columnar:
+        return data.select(
+            pl.struct(
+                pl.col("time").implode(),
+                pl.struct(pl.exclude("time")).implode().alias("value"),
+            ).alias(topic),
+        )
     nest_into_timeseries = pl.struct(
         [
             pl.col("time"),
@@ -1,3 +1,4 @@
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Self, override
 from urllib.parse import urlparse
@@ -29,6 +30,12 @@ class UriDataLoader(OfflineEnvironment):
         """
         self.uri = uri
 
+    @override
+    def fingerprint(self) -> str | None:
+        if self.data_loader is None:
+            return None
+        return self.data_loader.fingerprint()
+
     @override
     def load(self) -> Self:
         path = _file_uri_to_path(self.uri)
@@ -48,6 +55,28 @@ class UriDataLoader(OfflineEnvironment):
             raise NotLoadedError
         return self.data_loader.get_data()
 
+    @override
+    def get_lazy(self) -> pl.LazyFrame:
+        if self.data_loader is None:
+            raise NotLoadedError
+        return self.data_loader.get_lazy()
+
+    @override
+    def select(self, features: Iterable[str]) -> pl.DataFrame:
+        if self.data_loader is None:
+            raise NotLoadedError
+        return self.data_loader.select(features)
+
+    @override
+    def iter_batches(
+        self,
+        batch_size: int,
+        features: Iterable[str] | None = None,
+    ) -> Iterator[pl.DataFrame]:
+        if self.data_loader is None:
+            raise NotLoadedError
+        return self.data_loader.iter_batches(batch_size, features)
+
 
 class InvalidUriSchemeError(Exception):
     def __init__(self, scheme: str) -> None:
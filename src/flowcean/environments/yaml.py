@@ -6,6 +6,7 @@ from ruamel.yaml import YAML
 
 from flowcean.core import OfflineEnvironment
 from flowcean.core.environment import NotLoadedError
+from flowcean.utils import file_fingerprint
 
 
 class YamlDataLoader(OfflineEnvironment):
@@ -15,6 +16,10 @@ class YamlDataLoader(OfflineEnvironment):
     def __init__(self, path: str | Path) -> None:
         self.path = Path(path)
 
+    @override
+    def fingerprint(self) -> str | None:
+        return file_fingerprint(self.path)
+
     @override
     def load(self) -> Self:
         self.data = pl.DataFrame(YAML(typ="safe").load(self.path))
@@ -6,7 +6,6 @@ import lightning
 import polars as pl
 import torch
 from torch import Tensor
-from torch.utils.data import DataLoader
 
 from flowcean.core import SupervisedLearner
 from flowcean.environments.pytorch import TorchDataset
@@ -36,10 +35,8 @@ class LightningLearner(SupervisedLearner):
         inputs: pl.DataFrame,
         outputs: pl.DataFrame,
     ) -> PyTorchModel:
-        dataset = TorchDataset(inputs, outputs)
-        dataloader = DataLoader(
-            dataset,
-            batch_size=self.batch_size,
+        dataloader = TorchDataset(inputs, outputs).data_loader(
+            self.batch_size,
             num_workers=self.num_workers,
             persistent_workers=platform.system() == "Windows",
         )
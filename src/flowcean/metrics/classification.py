@@ -1,20 +1,46 @@
-from typing import Any, override
+from collections.abc import Iterable
+from typing import Any, Self, override
 
+import numpy as np
 import polars as pl
+from numpy.typing import NDArray
 from sklearn import metrics
 
-from flowcean.core import OfflineMetric
+from flowcean.core import OfflineMetric, OnlineMetric
 
 
-class Accuracy(OfflineMetric):
+class Accuracy(OnlineMetric):
     """Accuracy classification score.
 
     As defined by [scikit-learn](https://scikit-learn.org/stable/modules/generated/sklearn.metrics.accuracy_score.html).
+    With multiple label columns, a sample is correct only if all of its
+    labels are predicted correctly.
     """
 
+    def __init__(self) -> None:
+        self.reset()
+
     @override
-    def __call__(self, true: pl.DataFrame, predicted: pl.DataFrame) -> Any:
-        return metrics.accuracy_score(true, predicted)
+    def reset(self) -> None:
+        self._correct = 0
+        self._count = 0
+
+    @override
+    def update(self, true: pl.DataFrame, predicted: pl.DataFrame) -> None:
+        correct = _labels(true) == _labels(predicted)
+        self._correct += int(correct.all(axis=1).sum())
+        self._count += len(correct)
+
+    @override
+    def compute(self) -> Any:
+        if self._count == 0:
+            return np.nan
+        return self._correct / self._count
+
+    @override
+    def merge(self, other: Self) -> None:
+        self._correct += other._correct
+        self._count += other._count
 
 
 class ClassificationReport(OfflineMetric):
@@ -28,37 +54,114 @@ class ClassificationReport(OfflineMetric):
         return metrics.classification_report(true, predicted)
 
 
-class FBetaScore(OfflineMetric):
+class _BinaryConfusion(OnlineMetric):
+    """Base class for scores of binary classifications.
+
+    Accumulates the true positives, false positives and false negatives for
+    the positive label `1`. Like scikit-learn, a `ValueError` is raised if
+    the labels are not binary, i.e., if there is more than one label column,
+    more than two distinct labels, or two labels without the positive one.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    @override
+    def reset(self) -> None:
+        self._true_positives = 0
+        self._false_positives = 0
+        self._false_negatives = 0
+        self._classes: set[Any] = set()
+
+    @override
+    def update(self, true: pl.DataFrame, predicted: pl.DataFrame) -> None:
+        if true.width != 1 or predicted.width != 1:
+            message = "binary scores require a single label column"
+            raise ValueError(message)
+        labels = _labels(true)
+        predicted_labels = _labels(predicted)
+        self._add_classes(
+            np.union1d(labels.ravel(), predicted_labels.ravel()).tolist(),
+        )
+        positive = labels == 1
+        predicted_positive = predicted_labels == 1
+        self._true_positives += int((positive & predicted_positive).sum())
+        self._false_positives += int((~positive & predicted_positive).sum())
+        self._false_negatives += int((positive & ~predicted_positive).sum())
+
+    @override
+    def merge(self, other: Self) -> None:
+        self._true_positives += other._true_positives
+        self._false_positives += other._false_positives
+        self._false_negatives += other._false_negatives
+        self._add_classes(other._classes)
+
+    def _add_classes(self, classes: Iterable[Any]) -> None:
+        classes = self._classes.union(classes)
+        if len(classes) > 2:  # noqa: PLR2004
+            message = f"labels are not binary: {sorted(classes, key=str)}"
+            raise ValueError(message)
+        if len(classes) == 2 and 1 not in classes:  # noqa: PLR2004
+            message = (
+                "positive label 1 is not one of the labels "
+                f"{sorted(classes, key=str)}"
+            )
+            raise ValueError(message)
+        self._classes = classes
+
+
+class FBetaScore(_BinaryConfusion):
     """F-beta score.
 
     As defined by [scikit-learn](https://scikit-learn.org/stable/modules/generated/sklearn.metrics.fbeta_score.html).
     """
 
     def __init__(self, beta: float = 1.0) -> None:
+        super().__init__()
         self.beta = beta
 
     @override
-    def __call__(self, true: pl.DataFrame, predicted: pl.DataFrame) -> Any:
-        return metrics.fbeta_score(true, predicted, beta=self.beta)
+    def compute(self) -> Any:
+        beta2 = self.beta**2
+        weighted = (1 + beta2) * self._true_positives
+        return _divide(
+            weighted,
+            weighted + beta2 * self._false_negatives + self._false_positives,
+        )
 
 
-class PrecisionScore(OfflineMetric):
+class PrecisionScore(_BinaryConfusion):
     """Precision classification score.
 
     As defined by [scikit-learn](https://scikit-learn.org/stable/modules/generated/sklearn.metrics.precision_score.html).
     """
 
     @override
-    def __call__(self, true: pl.DataFrame, predicted: pl.DataFrame) -> Any:
-        return metrics.precision_score(true, predicted)
+    def compute(self) -> Any:
+        return _divide(
+            self._true_positives,
+            self._true_positives + self._false_positives,
+        )
 
 
-class Recall(OfflineMetric):
+class Recall(_BinaryConfusion):
     """Recall classification score.
 
     As defined by [scikit-learn](https://scikit-learn.org/stable/modules/generated/sklearn.metrics.recall_score.html).
     """
 
     @override
-    def __call__(self, true: pl.DataFrame, predicted: pl.DataFrame) -> Any:
-        return metrics.recall_score(true, predicted)
+    def compute(self) -> Any:
+        return _divide(
+            self._true_positives,
+            self._true_positives + self._false_negatives,
+        )
+
+
+def _labels(data: pl.DataFrame) -> NDArray[Any]:
+    return data.to_numpy().reshape(len(data), -1)
+
+
+def _divide(numerator: float, denominator: float) -> float:
+    # Like scikit-learn, undefined scores are zero.
+    return numerator / denominator if denominator > 0 else 0.0
@@ -1,50 +1,190 @@
-from typing import Any, override
+from typing import Any, Self, override
 
+import numpy as np
 import polars as pl
-from sklearn import metrics
+from numpy.typing import NDArray
 
-from flowcean.core import OfflineMetric
+from flowcean.core import OnlineMetric
 
 
-class MaxError(OfflineMetric):
+class MaxError(OnlineMetric):
     """Max error regression loss.
 
     As defined by [scikit-learn](https://scikit-learn.org/stable/modules/generated/sklearn.metrics.max_error.html).
     """
 
+    def __init__(self) -> None:
+        self.reset()
+
+    @override
+    def reset(self) -> None:
+        self._max = -np.inf
+
+    @override
+    def update(self, true: pl.DataFrame, predicted: pl.DataFrame) -> None:
+        errors = np.abs(_errors(true, predicted))
+        if errors.size > 0:
+            self._max = max(self._max, float(errors.max()))
+
+    @override
+    def compute(self) -> Any:
+        return self._max if np.isfinite(self._max) else np.nan
+
     @override
-    def __call__(self, true: pl.DataFrame, predicted: pl.DataFrame) -> Any:
-        return metrics.max_error(true, predicted)
+    def merge(self, other: Self) -> None:
+        self._max = max(self._max, other._max)
 
 
-class MeanAbsoluteError(OfflineMetric):
+class MeanAbsoluteError(OnlineMetric):
     """Mean absolute error (MAE) regression loss.
 
     As defined by [scikit-learn](https://scikit-learn.org/stable/modules/generated/sklearn.metrics.mean_absolute_error.html).
     """
 
+    def __init__(self) -> None:
+        self.reset()
+
+    @override
+    def reset(self) -> None:
+        self._count = 0
+        self._sum: NDArray[np.float64] | float = 0.0
+
+    @override
+    def update(self, true: pl.DataFrame, predicted: pl.DataFrame) -> None:
+        errors = _errors(true, predicted)
+        self._count += len(errors)
+        self._sum = self._sum + np.abs(errors).sum(axis=0)
+
+    @override
+    def compute(self) -> Any:
+        if self._count == 0:
+            return np.nan
+        return float(np.mean(self._sum) / self._count)
+
     @override
-    def __call__(self, true: pl.DataFrame, predicted: pl.DataFrame) -> Any:
-        return metrics.mean_absolute_error(true, predicted)
+    def merge(self, other: Self) -> None:
+        self._count += other._count
+        self._sum = self._sum + other._sum
 
 
-class MeanSquaredError(OfflineMetric):
+class MeanSquaredError(OnlineMetric):
     """Mean squared error (MSE) regression loss.
 
     As defined by [scikit-learn](https://scikit-learn.org/stable/modules/generated/sklearn.metrics.mean_squared_error.html).
     """
 
+    def __init__(self) -> None:
+        self.reset()
+
+    @override
+    def reset(self) -> None:
+        self._count = 0
+        self._sum: NDArray[np.float64] | float = 0.0
+
+    @override
+    def update(self, true: pl.DataFrame, predicted: pl.DataFrame) -> None:
+        errors = _errors(true, predicted)
+        self._count += len(errors)
+        self._sum = self._sum + np.square(errors).sum(axis=0)
+
+    @override
+    def compute(self) -> Any:
+        if self._count == 0:
+            return np.nan
+        return float(np.mean(self._sum) / self._count)
+
     @override
-    def __call__(self, true: pl.DataFrame, predicted: pl.DataFrame) -> Any:
-        return metrics.mean_squared_error(true, predicted)
+    def merge(self, other: Self) -> None:
+        self._count += other._count
+        self._sum = self._sum + other._sum
 
 
-class R2Score(OfflineMetric):
+class R2Score(OnlineMetric):
     """R^2 (coefficient of determination) regression score.
 
     As defined by [scikit-learn](https://scikit-learn.org/stable/modules/generated/sklearn.metrics.r2_score.html).
+    The total sum of squares is accumulated with the parallel algorithm of
+    Chan et al., so that it is numerically stable across batches. Like
+    scikit-learn, the score is not defined for less than two samples and
+    `nan` is returned.
     """
 
+    def __init__(self) -> None:
+        self.reset()
+
+    @override
+    def reset(self) -> None:
+        self._count = 0
+        self._mean: NDArray[np.float64] | float = 0.0
+        self._total: NDArray[np.float64] | float = 0.0
+        self._residual: NDArray[np.float64] | float = 0.0
+
+    @override
+    def update(self, true: pl.DataFrame, predicted: pl.DataFrame) -> None:
+        errors = _errors(true, predicted)
+        if len(errors) == 0:
+            return
+        y = _values(true)
+        mean = y.mean(axis=0)
+        self._combine(
+            len(y),
+            mean,
+            np.square(y - mean).sum(axis=0),
+            np.square(errors).sum(axis=0),
+        )
+
+    @override
+    def compute(self) -> Any:
+        if self._count < 2:  # noqa: PLR2004
+            return np.nan
+        total = np.asarray(self._total)
+        residual = np.asarray(self._residual)
+        nonzero = total != 0
+        scores = np.where(residual == 0, 1.0, 0.0)
+        scores[nonzero] = 1 - residual[nonzero] / total[nonzero]
+        return float(np.mean(scores))
+
     @override
-    def __call__(self, true: pl.DataFrame, predicted: pl.DataFrame) -> Any:
-        return metrics.r2_score(true, predicted)
+    def merge(self, other: Self) -> None:
+        if other._count > 0:
+            self._combine(
+                other._count,
+                other._mean,
+                other._total,
+                other._residual,
+            )
+
+    def _combine(
+        self,
+        count: int,
+        mean: NDArray[np.float64] | float,
+        total: NDArray[np.float64] | float,
+        residual: NDArray[np.float64] | float,
+    ) -> None:
+        n = self._count + count
+        delta = np.subtract(mean, self._mean)
+        self._mean = self._mean + delta * count / n
+        self._total = self._total + total + delta**2 * self._count * count / n
+        self._residual = self._residual + residual
+        self._count = n
+
+
+def _values(data: pl.DataFrame) -> NDArray[np.float64]:
+    return (
+        data.to_numpy().astype(np.float64, copy=False).reshape(len(data), -1)
+    )
+
+
+def _errors(
+    true: pl.DataFrame,
+    predicted: pl.DataFrame,
+) -> NDArray[np.float64]:
+    true_values = _values(true)
+    predicted_values = _values(predicted)
+    if true_values.shape != predicted_values.shape:
+        message = (
+            "true and predicted values have different shapes: "
+            f"{true_values.shape} and {predicted_values.shape}"
+        )
+        raise ValueError(message)
+    return true_values - predicted_values
@@ -1,46 +1,126 @@
+import threading
+import warnings
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import override
+from typing import Any, override
 
 import numpy as np
 import polars as pl
 import torch
+from numpy.typing import NDArray
 from torch.nn import Module
-from torch.utils.data import DataLoader
 
-from flowcean.core.model import Model
-from flowcean.environments.pytorch import TorchDataset
+from flowcean.core.model import Model, write_predictions
+from flowcean.environments.pytorch import to_tensor
 
 
 class PyTorchModel(Model):
-    """PyTorch model wrapper."""
+    """PyTorch model wrapper.
+
+    Predictions run in the calling process. The input features are converted
+    to a single tensor and passed through the module in batches of
+    `batch_size` samples under `torch.inference_mode`. The outputs of all
+    batches are written into one preallocated array. Inputs of at most
+    `batch_size` samples are passed through the module in a single forward
+    pass.
+
+    Attributes:
+        module: The PyTorch module.
+        output_names: The names of the output features.
+        batch_size: The number of samples per forward pass.
+        num_workers: Deprecated and ignored, predictions no longer use worker
+            processes.
+        num_threads: The number of threads used by PyTorch for intra-op
+            parallelism during prediction. If `None`, the global setting of
+            PyTorch is used. As the setting may be global to the process,
+            predictions with a number of threads run one at a time, even if
+            they are called from several threads.
+    """
 
     def __init__(
         self,
         module: Module,
         output_names: list[str],
         batch_size: int = 32,
-        num_workers: int = 1,
+        num_workers: int | None = None,
+        num_threads: int | None = None,
     ) -> None:
+        """Initialize the model.
+
+        Args:
+            module: The PyTorch module.
+            output_names: The names of the output features.
+            batch_size: The number of samples per forward pass.
+            num_workers: Deprecated and ignored. Passing it emits a
+                `DeprecationWarning`.
+            num_threads: The number of threads used by PyTorch for intra-op
+                parallelism during prediction. If `None`, the global setting
+                of PyTorch is used.
+        """
+        if num_workers is not None:
+            warnings.warn(
+                "num_workers is deprecated and ignored, predictions run in "
+                "the calling process",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         self.module = module
         self.output_names = output_names
         self.batch_size = batch_size
         self.num_workers = num_workers
+        self.num_threads = num_threads
 
     @override
     def predict(self, input_features: pl.DataFrame) -> pl.DataFrame:
-        dataloader = DataLoader(
-            TorchDataset(input_features),
-            batch_size=self.batch_size,
-            num_workers=self.num_workers,
-            persistent_workers=True,
-        )
-        predictions = []
-        for batch in dataloader:
-            inputs, _ = batch
-            predictions.append(self.module(inputs).detach().numpy())
-        predictions = np.concatenate(predictions, axis=0)
+        predictions = self.predict_tensor(to_tensor(input_features))
         return pl.DataFrame(predictions, self.output_names)
 
+    @override
+    def predict_array(
+        self,
+        inputs: NDArray[Any],
+        out: NDArray[Any] | None = None,
+    ) -> NDArray[Any]:
+        tensor = torch.from_numpy(np.ascontiguousarray(inputs, np.float32))
+        if out is not None and _is_buffer(out):
+            return self.predict_tensor(tensor, out)
+        return write_predictions(self.predict_tensor(tensor), out)
+
+    def predict_tensor(
+        self,
+        inputs: torch.Tensor,
+        out: NDArray[np.float32] | None = None,
+    ) -> NDArray[np.float32]:
+        """Predict outputs for a tensor of inputs.
+
+        Args:
+            inputs: The inputs of shape `(samples, input features)`.
+            out: An optional array of shape `(samples, output features)` to
+                write the predictions to.
+
+        Returns:
+            The predictions of shape `(samples, output features)`.
+        """
+        if out is None:
+            out = np.empty(
+                (len(inputs), len(self.output_names)),
+                dtype=np.float32,
+            )
+        outputs = torch.from_numpy(out)
+        with _num_threads(self.num_threads), torch.inference_mode():
+            if len(inputs) <= self.batch_size:
+                outputs.copy_(self.module(inputs).reshape(outputs.shape))
+                return out
+            for start in range(0, len(inputs), self.batch_size):
+                batch = outputs[start : start + self.batch_size]
+                batch.copy_(
+                    self.module(
+                        inputs[start : start + self.batch_size],
+                    ).reshape(batch.shape),
+                )
+        return out
+
     @override
     def save(self, path: Path) -> None:
         torch.save(self.module.state_dict(), path)
@@ -48,3 +128,32 @@ class PyTorchModel(Model):
     @override
     def load(self, path: Path) -> None:
         self.module.load_state_dict(torch.load(path))
+
+
+_num_threads_lock = threading.Lock()
+
+
+@contextmanager
+def _num_threads(num_threads: int | None) -> Iterator[None]:
+    if num_threads is None:
+        yield
+        return
+    # The number of threads is global to the process in some builds of
+    # PyTorch, so predictions setting it run one at a time. Otherwise,
+    # concurrent predictions would race on restoring the previous value.
+    with _num_threads_lock:
+        previous = torch.get_num_threads()
+        torch.set_num_threads(num_threads)
+        try:
+            yield
+        finally:
+            torch.set_num_threads(previous)
+
+
+def _is_buffer(out: NDArray[Any]) -> bool:
+    # Predictions can be written to contiguous float32 matrices in place.
+    return (
+        out.dtype == np.float32
+        and out.ndim == 2  # noqa: PLR2004
+        and out.flags.c_contiguous
+    )
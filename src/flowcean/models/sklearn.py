@@ -1,10 +1,21 @@
+import warnings
 from pathlib import Path
-from typing import Any
+from typing import Any, override
 
 import joblib
 import polars as pl
+from numpy.typing import NDArray
 
-from flowcean.core.model import Model
+from flowcean.core.model import Model, write_predictions
+
+# Models fitted on named features warn when predicting on arrays, which have
+# none. The filter is installed once, as changing the filters on every call
+# of `predict_array` is not thread-safe and slows down predictions.
+warnings.filterwarnings(
+    "ignore",
+    "X does not have valid feature names",
+    UserWarning,
+)
 
 
 class SciKitModel(Model):
@@ -16,6 +27,7 @@ class SciKitModel(Model):
         self.model = model
         self.output_name = output_name
 
+    @override
     def predict(
         self,
         input_features: pl.DataFrame,
@@ -23,8 +35,19 @@ class SciKitModel(Model):
         outputs = self.model.predict(input_features)
         return pl.DataFrame({self.output_name: outputs})
 
+    @override
+    def predict_array(
+        self,
+        inputs: NDArray[Any],
+        out: NDArray[Any] | None = None,
+    ) -> NDArray[Any]:
+        outputs = self.model.predict(inputs)
+        return write_predictions(outputs.reshape(len(inputs), -1), out)
+
+    @override
     def save(self, path: Path) -> None:
         joblib.dump(self.model, path)
 
+    @override
     def load(self, path: Path) -> None:
         self.model = joblib.load(path)
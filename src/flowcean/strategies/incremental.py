@@ -1,11 +1,14 @@
+import copy
+
 from flowcean.core import (
     IncrementalEnvironment,
     Model,
     ModelWithTransform,
+    OnlineMetric,
     SupervisedIncrementalLearner,
     Transform,
-    UnsupervisedIncrementalLearner,
 )
+from flowcean.metrics.report import Report
 
 
 def learn_incremental(
@@ -32,20 +35,61 @@ def learn_incremental(
         The model learned from the environment.
     """
     model = None
+    input_names = None
     for data in environment:
         input_features = data.select(inputs)
         output_features = data.select(outputs)
+        input_names = input_features.columns
 
         if input_transform is not None:
-            if isinstance(input_transform, UnsupervisedIncrementalLearner):
-                input_transform.fit_incremental(input_features)
-            input_features = input_transform.transform(input_features)
+            input_features = input_transform.fit_transform_incremental(
+                input_features,
+            )
 
         model = learner.learn_incremental(input_features, output_features)
+        model.input_names = input_features.columns
 
     if model is None:
         message = "No data found in environment."
         raise ValueError(message)
     if input_transform is not None:
-        return ModelWithTransform(model=model, transform=input_transform)
+        return ModelWithTransform(
+            model=model,
+            transform=input_transform,
+            input_names=input_names,
+        )
     return model
+
+
+def evaluate_incremental(
+    model: Model,
+    environment: IncrementalEnvironment,
+    inputs: list[str],
+    outputs: list[str],
+    metrics: list[OnlineMetric],
+) -> Report:
+    """Evaluate a model on an incremental environment.
+
+    The model predicts the outputs of one batch of the environment at a time,
+    and the metrics are updated with every batch. Only a single batch is held
+    in memory at any time. The given metrics are not modified.
+
+    Args:
+        model: The model to evaluate.
+        environment: The incremental environment.
+        inputs: The input feature names.
+        outputs: The output feature names.
+        metrics: The online metrics to evaluate.
+
+    Returns:
+        The evaluation report.
+    """
+    states = [copy.deepcopy(metric) for metric in metrics]
+    for state in states:
+        state.reset()
+    for data in environment:
+        predictions = model.predict(data.select(inputs))
+        output_features = data.select(outputs)
+        for state in states:
+            state.update(output_features, predictions)
+    return Report({state.name: state.compute() for state in states})
@@ -1,8 +1,14 @@
+import copy
 import logging
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import polars as pl
 
 from flowcean.core.environment.offline import OfflineEnvironment
-from flowcean.core.learner import SupervisedLearner, UnsupervisedLearner
-from flowcean.core.metric import OfflineMetric
+from flowcean.core.learner import SupervisedLearner
+from flowcean.core.metric import OfflineMetric, OnlineMetric
 from flowcean.core.model import Model, ModelWithTransform
 from flowcean.core.transform import Transform
 from flowcean.metrics.report import Report
@@ -32,23 +38,26 @@ def learn_offline(
         The model learned from the environment.
     """
     logger.info("Learning with offline strategy")
-    data = environment.get_data()
     logger.info("Selecting input and output features")
+    data = environment.select([*inputs, *outputs])
     input_features = data.select(inputs)
     output_features = data.select(outputs)
 
+    input_names = input_features.columns
     if input_transform is not None:
-        if isinstance(input_transform, UnsupervisedLearner):
-            logger.info("Learning input transform")
-            input_transform.fit(input_features)
-        logger.info("Applying input transform")
-        input_features = input_transform.transform(input_features)
+        logger.info("Learning and applying input transform")
+        input_features = input_transform.fit_transform(input_features)
 
     logger.info("Learning model")
     model = learner.learn(input_features, output_features)
+    model.input_names = input_features.columns
 
     if input_transform is not None:
-        return ModelWithTransform(model=model, transform=input_transform)
+        return ModelWithTransform(
+            model=model,
+            transform=input_transform,
+            input_names=input_names,
+        )
     return model
 
 
@@ -58,14 +67,98 @@ def evaluate_offline(
     inputs: list[str],
     outputs: list[str],
     metrics: list[OfflineMetric],
+    *,
+    batch_size: int | None = None,
+    max_workers: int | None = None,
 ) -> Report:
-    data = environment.get_data()
-    input_features = data.select(inputs)
-    output_features = data.select(outputs)
-    predictions = model.predict(input_features)
+    """Evaluate a model on an offline environment.
+
+    Without a `batch_size`, the model predicts the outputs of the whole
+    environment at once. Otherwise, the data is evaluated in batches of
+    `batch_size` samples, bounding the size of the inputs passed to the
+    model. Only the input and output features are read from the environment.
+    Online metrics are updated with every batch. Other metrics are
+    computed once on the collected outputs and predictions. With
+    `max_workers`, the batches are predicted concurrently in a pool of
+    threads. At most twice as many batches as workers are processed at once.
+
+    Args:
+        model: The model to evaluate.
+        environment: The offline environment.
+        inputs: The input feature names.
+        outputs: The output feature names.
+        metrics: The metrics to evaluate.
+        batch_size: The number of samples predicted at once. If `None`, all
+            samples are predicted at once.
+        max_workers: The number of threads used to predict batches
+            concurrently. If `None`, the batches are predicted sequentially.
+            Only used with a `batch_size`.
+
+    Returns:
+        The evaluation report.
+    """
+    if batch_size is None:
+        data = environment.select([*inputs, *outputs])
+        input_features = data.select(inputs)
+        output_features = data.select(outputs)
+        predictions = model.predict(input_features)
+        return Report(
+            {
+                metric.name: metric(output_features, predictions)
+                for metric in metrics
+            },
+        )
+
+    states = [copy.deepcopy(metric) for metric in metrics]
+    online = [state for state in states if isinstance(state, OnlineMetric)]
+    for state in online:
+        state.reset()
+    collected: list[tuple[pl.DataFrame, pl.DataFrame]] = []
+    collect = len(online) < len(states)
+
+    for output_features, predictions in _predict_batches(
+        model,
+        environment.iter_batches(batch_size, [*inputs, *outputs]),
+        inputs,
+        outputs,
+        max_workers,
+    ):
+        for state in online:
+            state.update(output_features, predictions)
+        if collect:
+            collected.append((output_features, predictions))
+
+    if collect:
+        output_features = pl.concat(true for true, _ in collected)
+        predictions = pl.concat(predicted for _, predicted in collected)
     return Report(
         {
-            metric.name: metric(output_features, predictions)
-            for metric in metrics
+            state.name: state.compute()
+            if isinstance(state, OnlineMetric)
+            else state(output_features, predictions)
+            for state in states
         },
     )
+
+
+def _predict_batches(
+    model: Model,
+    batches: Iterator[pl.DataFrame],
+    inputs: list[str],
+    outputs: list[str],
+    max_workers: int | None,
+) -> Iterator[tuple[pl.DataFrame, pl.DataFrame]]:
+    def predict(batch: pl.DataFrame) -> tuple[pl.DataFrame, pl.DataFrame]:
+        return batch.select(outputs), model.predict(batch.select(inputs))
+
+    if max_workers is None:
+        yield from map(predict, batches)
+        return
+    with ThreadPoolExecutor(max_workers, "flowcean-evaluate") as pool:
+        in_flight: deque[Future[tuple[pl.DataFrame, pl.DataFrame]]] = deque()
+        for batch in batches:
+            if len(in_flight) >= 2 * max_workers:
+                yield in_flight.popleft().result()
+            in_flight.append(pool.submit(predict, batch))
+        while in_flight:
+            yield in_flight.popleft().result()
@@ -0,0 +1,56 @@
+import numpy as np
+import polars as pl
+from numpy.typing import NDArray
+
+
+def flatten_lists(series: pl.Series) -> tuple[NDArray, NDArray[np.int64]]:
+    """Flatten a list series into its values and row offsets.
+
+    The values of row `i` are `values[offsets[i]:offsets[i + 1]]`. Empty and
+    missing lists contribute no values.
+
+    Args:
+        series: The list series to flatten.
+
+    Returns:
+        The concatenated values of all rows and the offsets of the rows.
+    """
+    lengths = series.list.len().fill_null(0).to_numpy()
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    values = series.filter(series.list.len() > 0).explode().to_numpy()
+    return values, offsets
+
+
+def implode_values(
+    name: str,
+    values: NDArray | pl.Series,
+    offsets: NDArray[np.int64],
+) -> pl.Series:
+    """Build a list series from values and row offsets.
+
+    This is the inverse of `flatten_lists`.
+
+    Args:
+        name: The name of the resulting series.
+        values: The concatenated values of all rows.
+        offsets: The offsets of the rows in `values`.
+
+    Returns:
+        The list series with one list per row.
+    """
+    n_rows = len(offsets) - 1
+    rows = np.repeat(np.arange(n_rows), np.diff(offsets))
+    imploded = (
+        pl.DataFrame({"row": rows, name: values})
+        .group_by("row", maintain_order=True)
+        .agg(pl.col(name))
+    )
+    if len(imploded) == n_rows:
+        return imploded.get_column(name)
+    return (
+        pl.DataFrame({"row": np.arange(n_rows)})
+        .join(imploded, on="row", how="left")
+        .get_column(name)
+        .fill_null(pl.lit([], dtype=imploded.schema[name]))
+    )
@@ -0,0 +1,45 @@
+import logging
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def map_features(
+    function: Callable[[str], T],
+    features: Iterable[str],
+    *,
+    max_workers: int | None = None,
+) -> dict[str, T]:
+    """Apply a function to each feature, optionally in a thread pool.
+
+    Most of the work of the vectorized transforms is done by numpy and
+    polars, which release the GIL, so features can be processed in threads.
+    The time spent on each feature is logged at the debug level.
+
+    Args:
+        function: The function to apply to the name of each feature.
+        features: The names of the features.
+        max_workers: The number of threads used to process the features. If
+            `None`, the features are processed sequentially.
+
+    Returns:
+        The results of the function keyed by feature in the given order.
+    """
+
+    def timed(feature: str) -> T:
+        start = time.perf_counter()
+        result = function(feature)
+        duration = time.perf_counter() - start
+        logger.debug("Processed feature %s in %.6f s", feature, duration)
+        return result
+
+    features = list(dict.fromkeys(features))
+    if max_workers is None or len(features) < 2:  # noqa: PLR2004
+        return {feature: timed(feature) for feature in features}
+    with ThreadPoolExecutor(max_workers, "flowcean-transform") as pool:
+        return dict(zip(features, pool.map(timed, features), strict=True))
@@ -43,3 +43,7 @@ class Explode(Transform):
     def transform(self, data: pl.DataFrame) -> pl.DataFrame:
         logger.debug("Exploding timeseries")
         return data.explode(self.features)
+
+    @override
+    def transform_lazy(self, data: pl.LazyFrame) -> pl.LazyFrame:
+        return data.explode(self.features)
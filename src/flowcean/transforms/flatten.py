@@ -5,7 +5,13 @@ from typing import override
 import polars as pl
 
 from flowcean.core import Transform
-from flowcean.utils import is_timeseries_feature
+from flowcean.utils import (
+    TimeSeriesSchema,
+    analyze_schema,
+    get_timeseries_field,
+)
+
+from ._parallel import map_features
 
 logger = logging.getLogger(__name__)
 
@@ -30,63 +36,92 @@ class Flatten(Transform):
     --------------|---------------|---------------|----|----
     0             | 1             | 2             | 42 | 43
     3             | 4             | 5             | 42 | 43
+
+    The values of each time series are extracted only once and converted to
+    a fixed-width array. With `as_array=True`, this array is kept as a single
+    `pl.Array` column instead of being split into one column per time step.
+    Its values can be viewed as a `(rows, n)` numpy array with `to_numpy()`
+    without copying, which is useful for learners.
     """
 
-    def __init__(self, features: Iterable[str] | None = None) -> None:
+    def __init__(
+        self,
+        features: Iterable[str] | None = None,
+        *,
+        as_array: bool = False,
+        max_workers: int | None = None,
+    ) -> None:
         """Initialize the flatten transform.
 
         Args:
             features: The features to flatten. If not provided or set to None,
                 all possible features from the given dataframe will be
                 flattened.
+            as_array: Whether to flatten each time series into a single
+                fixed-width array column instead of one column per time step.
+            max_workers: The number of threads used to flatten the features
+                concurrently. If `None`, the features are flattened
+                sequentially.
         """
         self.features = features
+        self.as_array = as_array
+        self.max_workers = max_workers
 
     @override
     def transform(self, data: pl.DataFrame) -> pl.DataFrame:
+        schema = analyze_schema(data.schema)
         # Loop over the features we want to explode
         feature_names = (
-            self.features
+            list(self.features)
             if self.features is not None
-            else [
-                column_name
-                for column_name in data.columns
-                if is_timeseries_feature(data, column_name)
-            ]
+            else list(schema.timeseries_features)
         )
 
+        # Check if the features really are time series
         for feature in feature_names:
-            # Check if the feature really is a time series
-            if not is_timeseries_feature(data, feature):
+            if not schema.is_timeseries(feature):
                 msg = f"Feature '{feature}' is no time series"
                 raise NoTimeSeriesFeatureError(msg)
 
-            # Figure out how "long" the feature is and how many new columns
-            # need to be added
-            row_lengths = data.select(
-                pl.col(feature)
-                .list.eval(pl.first().struct.field("value"))
-                .list.len()
-            ).unique()
-
-            # Check if all rows have the same length
-            if row_lengths.count().item(0, 0) > 1:
-                msg = f"Time series length in feature '{feature}' varies"
-                raise FeatureLengthVaryError(msg)
-            n = row_lengths.item(0, 0)
-
-            # Construct the new columns and drop the old feature
-            data = data.with_columns(
-                [
-                    pl.col(feature)
-                    .list.eval(pl.first().struct.field("value"))
-                    .list.get(i)
-                    .alias(f"{feature}_{i}")
-                    for i in range(n)
-                ]
-            ).drop(feature)
-
-        return data
+        arrays = map_features(
+            lambda feature: _to_array(data, schema, feature),
+            feature_names,
+            max_workers=self.max_workers,
+        )
+
+        if self.as_array:
+            return data.with_columns(arrays.values())
+
+        # Construct the new columns and drop the old features
+        return data.drop(list(arrays)).hstack(
+            [
+                column
+                for feature, array in arrays.items()
+                for column in array.arr.to_struct(
+                    fields=lambda i, name=feature: f"{name}_{i}",
+                )
+                .struct.unnest()
+                .get_columns()
+            ],
+        )
+
+
+def _to_array(
+    data: pl.DataFrame,
+    schema: TimeSeriesSchema,
+    feature: str,
+) -> pl.Series:
+    # Extract the values only once and figure out how "long" the feature is
+    values = get_timeseries_field(data, feature, "value", schema)
+    row_lengths = values.list.len().unique()
+
+    # Check if all rows have the same length
+    if row_lengths.count() > 1:
+        msg = f"Time series length in feature '{feature}' varies"
+        raise FeatureLengthVaryError(msg)
+    n = row_lengths.item(0)
+
+    return values.list.to_array(n)
 
 
 class FeatureLengthVaryError(Exception):
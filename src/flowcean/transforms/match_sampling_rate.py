@@ -1,10 +1,14 @@
 import logging
+from typing import override
 
+import numpy as np
 import polars as pl
-from numpy import interp
 
 from flowcean.core import Transform
 
+from ._lists import flatten_lists, implode_values
+from ._parallel import map_features
+
 logger = logging.getLogger(__name__)
 
 
@@ -53,6 +57,8 @@ class MatchSamplingRate(Transform):
         self,
         reference_timestamps: str,
         feature_columns_with_timestamps: dict[str, str],
+        *,
+        max_workers: int | None = None,
     ) -> None:
         """Initialize the MatchSamplingRate transform.
 
@@ -61,51 +67,54 @@ class MatchSamplingRate(Transform):
             feature_columns_with_timestamps: Names of the features that are
                 getting interpolated with their respective original timestamp
                 feature names.
+            max_workers: The number of threads used to interpolate the
+                features concurrently. If `None`, the features are
+                interpolated sequentially.
         """
         self.reference_timestamps = reference_timestamps
         self.feature_columns_with_timestamps = feature_columns_with_timestamps
+        self.max_workers = max_workers
 
+    @override
     def transform(self, data: pl.DataFrame) -> pl.DataFrame:
         logger.debug("Matching sampling rate of time series.")
 
-        for i in range(len(data)):
-            reference_timestamps = data[self.reference_timestamps][i]
-            for (
-                feature,
-                timestamp,
-            ) in self.feature_columns_with_timestamps.items():
-                timestamps = data[timestamp][i].to_numpy()
-                feature_data = data[feature][i].to_numpy()
-                resampled_timeseries = interp(
-                    reference_timestamps,
-                    timestamps,
-                    feature_data,
-                ).tolist()
-                data = (
-                    data.lazy()
-                    .with_row_index()
-                    .with_columns(
-                        pl.when(pl.col("index") == i)
-                        .then(resampled_timeseries)
-                        .otherwise(pl.col(feature))
-                        .alias(feature)
-                    )
-                    .drop("index")
-                    .collect()
+        reference = data.get_column(self.reference_timestamps)
+        reference_values, reference_offsets = flatten_lists(
+            reference.cast(pl.List(pl.Float64)),
+        )
+
+        def interpolate(feature: str) -> pl.Series:
+            timestamp = self.feature_columns_with_timestamps[feature]
+            timestamps, timestamp_offsets = flatten_lists(
+                data.get_column(timestamp).cast(pl.List(pl.Float64)),
+            )
+            values, value_offsets = flatten_lists(
+                data.get_column(feature).cast(pl.List(pl.Float64)),
+            )
+            resampled = np.empty_like(reference_values)
+            for i in range(len(data)):
+                start, end = reference_offsets[i], reference_offsets[i + 1]
+                resampled[start:end] = np.interp(
+                    reference_values[start:end],
+                    timestamps[
+                        timestamp_offsets[i] : timestamp_offsets[i + 1]
+                    ],
+                    values[value_offsets[i] : value_offsets[i + 1]],
                 )
-                reference_timestamps = pl.Series(
-                    reference_timestamps
-                ).to_list()
-                data = (
-                    data.lazy()
-                    .with_row_index()
-                    .with_columns(
-                        pl.when(pl.col("index") == i)
-                        .then(reference_timestamps)
-                        .otherwise(pl.col(timestamp))
-                        .alias(timestamp)
-                    )
-                    .drop("index")
-                    .collect()
-                )
-        return data
+            return implode_values(
+                feature,
+                resampled,
+                reference_offsets,
+            ).cast(data.schema[feature])
+
+        resampled = map_features(
+            interpolate,
+            self.feature_columns_with_timestamps,
+            max_workers=self.max_workers,
+        )
+        timestamps = {
+            timestamp: reference.cast(data.schema[timestamp]).alias(timestamp)
+            for timestamp in self.feature_columns_with_timestamps.values()
+        }
+        return data.with_columns(**resampled, **timestamps)
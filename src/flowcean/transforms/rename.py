@@ -23,3 +23,7 @@ class Rename(Transform):
     @override
     def transform(self, data: pl.DataFrame) -> pl.DataFrame:
         return data.rename(self.mapping)
+
+    @override
+    def transform_lazy(self, data: pl.LazyFrame) -> pl.LazyFrame:
+        return data.rename(self.mapping)
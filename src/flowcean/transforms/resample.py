@@ -4,10 +4,18 @@ from typing import Literal, cast, override
 
 import numpy as np
 import polars as pl
+from numpy.typing import NDArray
 from scipy.interpolate import CubicSpline
 
 from flowcean.core import Transform
-from flowcean.utils import is_timeseries_feature
+from flowcean.utils import (
+    TimeSeriesSchema,
+    analyze_schema,
+    get_timeseries_field,
+)
+
+from ._lists import flatten_lists, implode_values
+from ._parallel import map_features
 
 logger = logging.getLogger(__name__)
 
@@ -15,13 +23,21 @@ type InterpolationMethod = Literal["linear", "cubic"]
 
 
 class Resample(Transform):
-    """Resample time series features to a given sampling rate."""
+    """Resample time series features to a given sampling rate.
+
+    Each time series is resampled on an equidistant grid from its first to
+    its last point in time. All rows of a feature are resampled in bulk. If
+    all rows of a feature share the same points in time, they are
+    interpolated in a single vectorized operation. Time series in the
+    columnar layout stay in the columnar layout.
+    """
 
     def __init__(
         self,
         sampling_rate: float | dict[str, float],
         *,
         interpolation_method: InterpolationMethod = "linear",
+        max_workers: int | None = None,
     ) -> None:
         """Initializes the Resample transform.
 
@@ -33,79 +49,183 @@ class Resample(Transform):
             interpolation_method: The interpolation method to use. Supported
                 are "linear" and "cubic", with the default being
                 "linear".
+            max_workers: The number of threads used to resample the features
+                concurrently. If `None`, the features are resampled
+                sequentially.
         """
         self.sampling_rate = sampling_rate
         self.interpolation_method = interpolation_method
+        self.max_workers = max_workers
 
     @override
     def transform(self, data: pl.DataFrame) -> pl.DataFrame:
+        schema = analyze_schema(data.schema)
         sampling_mapping = (
-            {
-                column_name: self.sampling_rate
-                for column_name in data.columns
-                if is_timeseries_feature(data, column_name)
-            }
+            dict.fromkeys(
+                schema.timeseries_features,
+                self.sampling_rate,
+            )
             if isinstance(self.sampling_rate, float)
             else cast(dict[str, float], self.sampling_rate)
         )
 
-        for feature, dt in sampling_mapping.items():
-            data = data.with_columns(
-                pl.struct(
-                    pl.col(feature)
-                    .list.eval(pl.first().struct.field("time"))
-                    .alias("time"),
-                    pl.col(feature)
-                    .list.eval(pl.first().struct.field("value"))
-                    .alias("value"),
-                )
-                .map_elements(
-                    lambda series, dt=dt: self.resample_data(
-                        series,
-                        dt,
-                    ),
-                    return_dtype=pl.List(
-                        pl.Struct(
-                            {
-                                "time": pl.Float64,
-                                "value": pl.Float64,
-                            }
-                        )
-                    ),
-                )
-                .alias(feature)
-            )
-        return data
+        resampled = map_features(
+            lambda feature: self._resample_feature(
+                data,
+                schema,
+                feature,
+                sampling_mapping[feature],
+            ),
+            sampling_mapping,
+            max_workers=self.max_workers,
+        )
+        return data.with_columns(**resampled)
 
-    def resample_data(
-        self, data: dict[str, list[float]], dt: float
+    def _resample_feature(
+        self,
+        data: pl.DataFrame,
+        schema: TimeSeriesSchema,
+        feature: str,
+        dt: float,
     ) -> pl.Series:
-        time = data["time"]
-        value = data["value"]
-
-        time_start = time[0]
-        time_end = time[-1]
-        t_interp = np.linspace(
-            time_start,
-            time_end,
-            int(math.ceil(time_end - time_start) / dt) + 1,
+        time, offsets = flatten_lists(
+            get_timeseries_field(data, feature, "time", schema).cast(
+                pl.List(pl.Float64),
+            ),
         )
+        value, _ = flatten_lists(
+            get_timeseries_field(data, feature, "value", schema).cast(
+                pl.List(pl.Float64),
+            ),
+        )
+        n_rows = len(offsets) - 1
+        lengths = np.diff(offsets)
 
-        # Interpolate the value vector to match the new time vector
-        value_interp = None
-        if self.interpolation_method == "linear":
-            value_interp = np.interp(t_interp, time, value)
-        elif self.interpolation_method == "cubic":
-            interpolator = CubicSpline(time, value)
-            value_interp = interpolator(t_interp)
+        if _shares_time_grid(time, lengths):
+            # All rows are sampled at the same points in time, so the new
+            # time grid is the same for all rows and all rows can be
+            # interpolated at once.
+            m = lengths[0]
+            grid = np.linspace(
+                time[0],
+                time[m - 1],
+                int(math.ceil(time[m - 1] - time[0]) / dt) + 1,
+            )
+            values = self._interpolate_rows(
+                grid,
+                time[:m],
+                value.reshape(n_rows, m),
+            )
+            resampled_time = np.tile(grid, n_rows)
+            resampled_value = values.ravel()
+            resampled_offsets = np.arange(n_rows + 1) * len(grid)
         else:
+            start = time[offsets[:-1]]
+            stop = time[offsets[1:] - 1]
+            counts = (np.ceil(stop - start) / dt).astype(np.int64) + 1
+            resampled_offsets = np.zeros(n_rows + 1, dtype=np.int64)
+            np.cumsum(counts, out=resampled_offsets[1:])
+            resampled_time = _sampling_grids(
+                start,
+                stop,
+                counts,
+                resampled_offsets,
+            )
+            resampled_value = np.empty_like(resampled_time)
+            for i in range(n_rows):
+                target = slice(resampled_offsets[i], resampled_offsets[i + 1])
+                source = slice(offsets[i], offsets[i + 1])
+                resampled_value[target] = self._interpolate(
+                    resampled_time[target],
+                    time[source],
+                    value[source],
+                )
+
+        if schema.is_columnar(feature):
+            return pl.DataFrame(
+                [
+                    implode_values("time", resampled_time, resampled_offsets),
+                    implode_values(
+                        "value",
+                        resampled_value,
+                        resampled_offsets,
+                    ),
+                ],
+            ).to_struct(feature)
+        points = pl.DataFrame(
+            {"time": resampled_time, "value": resampled_value},
+        ).to_struct(feature)
+        return implode_values(feature, points, resampled_offsets)
+
+    def _interpolate(
+        self,
+        x: NDArray[np.float64],
+        xp: NDArray[np.float64],
+        fp: NDArray[np.float64],
+    ) -> NDArray[np.float64]:
+        if self.interpolation_method == "cubic":
+            return CubicSpline(xp, fp)(x)
+        if self.interpolation_method != "linear":
             logger.warning(
                 "Unknown interpolation method %s. Defaulting to linear",
                 self.interpolation_method,
             )
-        return (
-            pl.DataFrame({"time": t_interp, "value": value_interp})
-            .to_struct()
-            .implode()
-            .item()
-        )
+        return np.interp(x, xp, fp)
+
+    def _interpolate_rows(
+        self,
+        x: NDArray[np.float64],
+        xp: NDArray[np.float64],
+        fp: NDArray[np.float64],
+    ) -> NDArray[np.float64]:
+        if self.interpolation_method == "cubic":
+            return CubicSpline(xp, fp, axis=1)(x)
+        if self.interpolation_method != "linear":
+            logger.warning(
+                "Unknown interpolation method %s. Defaulting to linear",
+                self.interpolation_method,
+            )
+        return _interp_rows(x, xp, fp)
+
+
+def _shares_time_grid(
+    time: NDArray[np.float64],
+    lengths: NDArray[np.int64],
+) -> bool:
+    if len(lengths) == 0 or lengths[0] < 1 or np.any(lengths != lengths[0]):
+        return False
+    grid = time.reshape(len(lengths), lengths[0])
+    return bool(np.all(grid == grid[0]))
+
+
+def _sampling_grids(
+    start: NDArray[np.float64],
+    stop: NDArray[np.float64],
+    counts: NDArray[np.int64],
+    offsets: NDArray[np.int64],
+) -> NDArray[np.float64]:
+    # Equivalent to concatenating `np.linspace(start, stop, count)` per row.
+    index = np.arange(offsets[-1]) - np.repeat(offsets[:-1], counts)
+    step = (stop - start) / np.maximum(counts - 1, 1)
+    grid = index * np.repeat(step, counts) + np.repeat(start, counts)
+    has_end = counts > 1
+    grid[offsets[1:][has_end] - 1] = stop[has_end]
+    return grid
+
+
+def _interp_rows(
+    x: NDArray[np.float64],
+    xp: NDArray[np.float64],
+    fp: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    # Equivalent to `np.interp(x, xp, row)` for each row of `fp`.
+    if len(xp) == 1:
+        return np.repeat(fp, len(x), axis=1)
+    j = np.clip(np.searchsorted(xp, x, side="right") - 1, 0, len(xp) - 2)
+    slope = (fp[:, j + 1] - fp[:, j]) / (xp[j + 1] - xp[j])
+    result = slope * (x - xp[j]) + fp[:, j]
+    exact = x == xp[j]
+    result[:, exact] = fp[:, j[exact]]
+    result[:, x < xp[0]] = fp[:, :1]
+    result[:, x >= xp[-1]] = fp[:, -1:]
+    return result
@@ -27,3 +27,7 @@ class Select(Transform):
     def transform(self, data: pl.DataFrame) -> pl.DataFrame:
         logger.debug("selecting features %s", self.features)
         return data.select(self.features)
+
+    @override
+    def transform_lazy(self, data: pl.LazyFrame) -> pl.LazyFrame:
+        return data.select(self.features)
@@ -1,6 +1,10 @@
-from typing import override
+from collections.abc import Iterable, Iterator
+from typing import Any, override
 
+import numpy as np
 import polars as pl
+from numpy.lib.stride_tricks import sliding_window_view
+from numpy.typing import NDArray
 
 from flowcean.core import Transform
 
@@ -31,6 +35,16 @@ class SlidingWindow(Transform):
      2  | 20  | 200 | 3   | 30  | 300 | 4   | 40  | 400
      3  | 30  | 300 | 4   | 40  | 400 | 5   | 50  | 500
 
+    The columns of the result are zero-copy slices of the original columns.
+    When transforming a stream of batches, the last `window_size - 1` rows of
+    each batch are carried over to the next one, so that windows spanning
+    batch boundaries are not lost.
+
+    Instead of one column per row and window position, the windows can also
+    be retrieved as a strided numpy view of shape
+    `(windows, window_size, columns)` with `window_view` and
+    `window_view_stream`, which does not copy the data of each window.
+
     Args:
         window_size: size of the sliding window.
     """
@@ -40,12 +54,82 @@ class SlidingWindow(Transform):
 
     @override
     def transform(self, data: pl.DataFrame) -> pl.DataFrame:
+        n_windows = max(len(data) - self.window_size + 1, 0)
+        return data.select(
+            [
+                pl.all().slice(i, n_windows).name.suffix(f"_{i}")
+                for i in range(self.window_size)
+            ]
+        )
+
+    @override
+    def transform_lazy(self, data: pl.LazyFrame) -> pl.LazyFrame:
+        n_windows = pl.max_horizontal(pl.len() - self.window_size + 1, 0)
         return data.select(
             [
-                pl.all()
-                .shift(self.window_size - 1 - i)
-                .slice(self.window_size - 1)
-                .name.suffix(f"_{i}")
+                pl.all().slice(i, n_windows).name.suffix(f"_{i}")
                 for i in range(self.window_size)
             ]
         )
+
+    def window_view(self, data: pl.DataFrame) -> NDArray[Any]:
+        """Get the sliding windows over the data as a numpy view.
+
+        The data is converted to a single numpy array, on which the windows
+        are a read-only strided view. Row `j` of window `i` is row `i + j` of
+        the data.
+
+        Args:
+            data: The data to create windows over. All columns must have a
+                common numeric type.
+
+        Returns:
+            The windows with shape `(windows, window_size, columns)`.
+        """
+        return self._window_view(data.to_numpy())
+
+    def window_view_stream(
+        self,
+        batches: Iterable[pl.DataFrame],
+    ) -> Iterator[NDArray[Any]]:
+        """Get the sliding windows over a stream of batches as numpy views.
+
+        Like `transform_stream`, the last `window_size - 1` rows of each
+        batch are carried over to the next one.
+
+        Args:
+            batches: The batches to create windows over.
+
+        Yields:
+            The windows of each batch with shape
+            `(windows, window_size, columns)`.
+        """
+        carry: NDArray[Any] | None = None
+        for batch in batches:
+            data = batch.to_numpy()
+            if carry is not None:
+                data = np.concatenate([carry, data])
+            if len(data) >= self.window_size:
+                yield self._window_view(data)
+            carry = data[len(data) - self.window_size + 1 :]
+
+    def _window_view(self, data: NDArray[Any]) -> NDArray[Any]:
+        if len(data) < self.window_size:
+            return np.empty((0, self.window_size, *data.shape[1:]), data.dtype)
+        return sliding_window_view(
+            data,
+            self.window_size,
+            axis=0,
+        ).transpose(0, 2, 1)
+
+    @override
+    def transform_stream(
+        self,
+        batches: Iterable[pl.DataFrame],
+    ) -> Iterator[pl.DataFrame]:
+        carry: pl.DataFrame | None = None
+        for batch in batches:
+            data = batch if carry is None else pl.concat([carry, batch])
+            if len(data) >= self.window_size:
+                yield self.transform(data)
+            carry = data.tail(self.window_size - 1)
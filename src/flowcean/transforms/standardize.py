@@ -1,12 +1,19 @@
+import math
 from typing import override
 
 import polars as pl
 from polars.type_aliases import PythonLiteral
 
-from flowcean.core import Transform, UnsupervisedLearner
+from flowcean.core import (
+    Transform,
+    UnsupervisedIncrementalLearner,
+    UnsupervisedLearner,
+)
 
 
-class Standardize(Transform, UnsupervisedLearner):
+class Standardize(
+    Transform, UnsupervisedLearner, UnsupervisedIncrementalLearner
+):
     r"""Standardize features by removing the mean and scaling to unit variance.
 
     A sample $x$ is standardized as:
@@ -20,6 +27,13 @@ class Standardize(Transform, UnsupervisedLearner):
     - $\mu$ is the mean of the samples
     - $\sigma$ is the standard deviation of the samples.
 
+    The statistics can be learned from all data at once with `fit`, or from
+    a stream of batches with `fit_incremental`. Statistics learned on
+    different parts of the data, e.g., by parallel workers, can be combined
+    with `merge`. Incremental updates and merges use the numerically stable
+    pairwise update of Chan et al., so they yield the same statistics as
+    fitting on all data at once.
+
     Attributes:
         mean: The mean $\mu$ of each feature.
         std: The standard deviation $\sigma$
@@ -33,23 +47,136 @@ class Standardize(Transform, UnsupervisedLearner):
 
     @override
     def fit(self, data: pl.DataFrame) -> None:
-        self.mean = {c: _as_float(data[c].mean()) for c in data.columns}
-        self.std = {c: _as_float(data[c].std()) for c in data.columns}
+        statistics = _statistics(data)
+        self.mean = {c: _as_float(s["mean"]) for c, s in statistics.items()}
+        self.std = {c: _as_float(s["std"]) for c, s in statistics.items()}
+        self.counts = len(data)
+
+    @override
+    def fit_transform(self, data: pl.DataFrame) -> pl.DataFrame:
+        # Compute the statistics and the standardized data in a single query,
+        # in which each statistic is computed only once.
+        columns = data.columns
+        result = (
+            data.lazy()
+            .select(
+                *(
+                    (pl.col(c) - pl.col(c).mean())
+                    / pl.when(pl.col(c).std() != 0)
+                    .then(pl.col(c).std())
+                    .otherwise(1.0)
+                    for c in columns
+                ),
+                *(
+                    pl.col(c).mean().alias(f"{_MEAN}{i}")
+                    for i, c in enumerate(columns)
+                ),
+                *(
+                    pl.col(c).std().alias(f"{_STD}{i}")
+                    for i, c in enumerate(columns)
+                ),
+            )
+            .collect()
+        )
+        statistics = result.row(0, named=True) if len(result) > 0 else {}
+        self.mean = {
+            c: _as_float(statistics.get(f"{_MEAN}{i}"))
+            for i, c in enumerate(columns)
+        }
+        self.std = {
+            c: _as_float(statistics.get(f"{_STD}{i}"))
+            for i, c in enumerate(columns)
+        }
         self.counts = len(data)
+        return result.select(columns)
+
+    @override
+    def fit_incremental(self, data: pl.DataFrame) -> None:
+        if len(data) == 0:
+            return
+        batch = Standardize()
+        statistics = _statistics(data)
+        batch.mean = {c: _as_float(s["mean"]) for c, s in statistics.items()}
+        batch.std = {
+            c: 0.0 if s["std"] is None else _as_float(s["std"])
+            for c, s in statistics.items()
+        }
+        batch.counts = len(data)
+        self.merge(batch)
+
+    def merge(self, other: "Standardize") -> None:
+        """Merge the statistics learned by another standardization.
+
+        Afterwards, this standardization has the statistics of the combined
+        data of both standardizations. Both standardizations must have
+        learned the same features.
+
+        Args:
+            other: The standardization to merge into this one.
+
+        Raises:
+            ValueError: If the standardizations learned different features.
+        """
+        if other.mean is None or other.std is None or not other.counts:
+            return
+        if self.mean is None or self.std is None or not self.counts:
+            self.mean = dict(other.mean)
+            self.std = dict(other.std)
+            self.counts = other.counts
+            return
+        if self.mean.keys() != other.mean.keys():
+            message = (
+                "cannot merge standardizations of different features: "
+                f"{sorted(self.mean)} and {sorted(other.mean)}"
+            )
+            raise ValueError(message)
+
+        n_a = self.counts
+        n_b = other.counts
+        n = n_a + n_b
+        for c, mean_b in other.mean.items():
+            mean_a = self.mean[c]
+            m2_a = self.std[c] ** 2 * (n_a - 1)
+            m2_b = other.std[c] ** 2 * (n_b - 1)
+            delta = mean_b - mean_a
+            self.mean[c] = mean_a + delta * n_b / n
+            self.std[c] = math.sqrt(
+                (m2_a + m2_b + delta**2 * n_a * n_b / n) / (n - 1),
+            )
+        self.counts = n
 
     @override
     def transform(self, data: pl.DataFrame) -> pl.DataFrame:
+        return data.select(self._standardize(data.columns))
+
+    @override
+    def transform_lazy(self, data: pl.LazyFrame) -> pl.LazyFrame:
+        return data.select(self._standardize(data.collect_schema().names()))
+
+    def _standardize(self, columns: list[str]) -> list[pl.Expr]:
         if self.mean is None or self.std is None:
             message = "Standardize transform has not been fitted"
             raise RuntimeError(message)
 
-        return data.select(
-            [
-                (pl.col(c) - (self.mean.get(c) or 0.0))
-                / (self.std.get(c) or 1.0)
-                for c in data.columns
-            ],
-        )
+        return [
+            (pl.col(c) - (self.mean.get(c) or 0.0)) / (self.std.get(c) or 1.0)
+            for c in columns
+        ]
+
+
+_MEAN = "__flowcean_mean_"
+_STD = "__flowcean_std_"
+
+
+def _statistics(data: pl.DataFrame) -> dict[str, dict[str, PythonLiteral]]:
+    # Compute the statistics of all columns in a single query.
+    return data.select(
+        pl.struct(
+            pl.col(c).mean().alias("mean"),
+            pl.col(c).std().alias("std"),
+        ).alias(c)
+        for c in data.columns
+    ).row(0, named=True)
 
 
 def _as_float(value: PythonLiteral | None) -> float:
@@ -3,16 +3,30 @@ import math
 from collections.abc import Iterable
 from typing import override
 
+import numpy as np
 import polars as pl
+from numpy.typing import NDArray
 
 from flowcean.core import Transform
-from flowcean.utils import is_timeseries_feature
+from flowcean.utils import (
+    TimeSeriesSchema,
+    analyze_schema,
+)
+
+from ._parallel import map_features
 
 logger = logging.getLogger(__name__)
 
 
 class TimeWindow(Transform):
-    """Limit time series to a certain time window."""
+    """Limit time series to a certain time window.
+
+    By default, the elements of each series are filtered by their time. If
+    the time series are known to be sorted by time, pass `assume_sorted=True`
+    to find the window bounds of each series with a binary search instead
+    and slice the series without evaluating every element. The result is
+    undefined for unsorted time series in this case.
+    """
 
     def __init__(
         self,
@@ -20,6 +34,8 @@ class TimeWindow(Transform):
         features: Iterable[str] | None = None,
         time_start: float = 0.0,
         time_end: float = math.inf,
+        assume_sorted: bool = False,
+        max_workers: int | None = None,
     ) -> None:
         """Initializes the TimeWindow transform.
 
@@ -32,33 +48,159 @@ class TimeWindow(Transform):
             time_end: Window end time. Defaults to infinite. All data after
                 this time will be removed from the time series when applying
                 the transform.
+            assume_sorted: Whether the time series are sorted by time. If
+                `True`, the window is found with a binary search without
+                checking the order of the time series.
+            max_workers: The number of threads used to window the features
+                concurrently. If `None`, the features are windowed
+                sequentially.
         """
         self.features = features
         self.t_start = time_start
         self.t_end = time_end
+        self.assume_sorted = assume_sorted
+        self.max_workers = max_workers
 
     @override
     def transform(self, data: pl.DataFrame) -> pl.DataFrame:
-        for feature in (
-            self.features
-            if self.features is not None
-            else [
-                feature
-                for feature in data.columns
-                if is_timeseries_feature(data, feature)
-            ]
-        ):
-            time_expression = (
-                pl.element().struct.field("time").cast(pl.Float64)
+        schema = analyze_schema(data.schema)
+        windows = map_features(
+            lambda feature: self._window(data, schema, feature),
+            self._features(schema),
+            max_workers=self.max_workers,
+        )
+        return data.with_columns(windows.values())
+
+    @override
+    def transform_lazy(self, data: pl.LazyFrame) -> pl.LazyFrame:
+        if self.assume_sorted:
+            # Slicing sorted time series requires the data
+            return super().transform_lazy(data)
+        schema = analyze_schema(data.collect_schema())
+        return data.with_columns(
+            self._filter(schema, feature)
+            for feature in dict.fromkeys(self._features(schema))
+        )
+
+    @property
+    @override
+    def fusable(self) -> bool:
+        # The binary search over sorted series runs on the materialized data.
+        return not self.assume_sorted
+
+    def _window(
+        self,
+        data: pl.DataFrame,
+        schema: TimeSeriesSchema,
+        feature: str,
+    ) -> pl.Series:
+        columnar = schema.is_columnar(feature)
+        expression = (
+            self._slice(
+                feature,
+                *self._sorted_window(data, feature, columnar=columnar),
+                columnar=columnar,
             )
+            if self.assume_sorted
+            else self._filter(schema, feature)
+        )
+        return data.select(expression).to_series()
+
+    def _features(self, schema: TimeSeriesSchema) -> list[str]:
+        if self.features is not None:
+            return list(self.features)
+        return list(schema.timeseries_features)
+
+    def _filter(self, schema: TimeSeriesSchema, feature: str) -> pl.Expr:
+        if schema.is_columnar(feature):
+            return self._window_columnar(feature)
 
-            data = data.with_columns(
-                pl.col(feature).list.eval(
-                    pl.element().filter(
-                        time_expression.ge(self.t_start).and_(
-                            time_expression.le(self.t_end)
-                        )
-                    )
+        time_expression = pl.element().struct.field("time").cast(pl.Float64)
+        return pl.col(feature).list.eval(
+            pl.element().filter(
+                time_expression.ge(self.t_start).and_(
+                    time_expression.le(self.t_end)
                 )
             )
-        return data
+        )
+
+    def _window_columnar(self, feature: str) -> pl.Expr:
+        time = pl.element().cast(pl.Float64)
+        indices = (
+            pl.col(feature)
+            .struct.field("time")
+            .list.eval(
+                pl.arg_where(
+                    time.ge(self.t_start).and_(time.le(self.t_end)),
+                ),
+            )
+        )
+        return pl.struct(
+            pl.col(feature).struct.field("time").list.gather(indices),
+            pl.col(feature).struct.field("value").list.gather(indices),
+        ).alias(feature)
+
+    def _sorted_window(
+        self,
+        data: pl.DataFrame,
+        feature: str,
+        *,
+        columnar: bool,
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        series = data.get_column(feature)
+        field = "time"
+        if columnar:
+            series = series.struct.field("time")
+            field = None
+        first = _search_sorted(series, field, self.t_start, right=False)
+        last = _search_sorted(series, field, self.t_end, right=True)
+        return first, np.maximum(last - first, 0)
+
+    def _slice(
+        self,
+        feature: str,
+        offsets: NDArray[np.int64],
+        lengths: NDArray[np.int64],
+        *,
+        columnar: bool,
+    ) -> pl.Expr:
+        offset = pl.lit(pl.Series(offsets))
+        length = pl.lit(pl.Series(lengths))
+        if columnar:
+            return pl.struct(
+                pl.col(feature)
+                .struct.field("time")
+                .list.slice(offset, length),
+                pl.col(feature)
+                .struct.field("value")
+                .list.slice(offset, length),
+            ).alias(feature)
+        return pl.col(feature).list.slice(offset, length)
+
+
+def _search_sorted(
+    series: pl.Series,
+    field: str | None,
+    bound: float,
+    *,
+    right: bool,
+) -> NDArray[np.int64]:
+    # Binary search for the bound in all rows at once, accessing only the
+    # probed elements of each row. Returns the index of the first element of
+    # each row that is not less than (or, with `right`, greater than) the
+    # bound.
+    low = np.zeros(len(series), dtype=np.int64)
+    high = series.list.len().fill_null(0).to_numpy().astype(np.int64)
+    while np.any(active := low < high):
+        middle = np.where(active, (low + high) // 2, 0)
+        value = series.list.get(pl.Series(middle), null_on_oob=True)
+        if field is not None:
+            value = value.struct.field(field)
+        below = (
+            value.cast(pl.Float64).to_numpy() <= bound
+            if right
+            else value.cast(pl.Float64).to_numpy() < bound
+        )
+        low = np.where(active & below, middle + 1, low)
+        high = np.where(active & ~below, middle, high)
+    return low
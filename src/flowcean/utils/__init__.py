@@ -1,9 +1,32 @@
 __all__ = [
+    "TimeSeriesSchema",
+    "analyze_schema",
     "build_environments_from_directory",
+    "combine_fingerprints",
+    "file_fingerprint",
+    "get_timeseries_field",
+    "is_columnar_timeseries_feature",
     "is_timeseries_feature",
+    "rebatch",
+    "resolve_features",
+    "to_columnar_timeseries",
+    "to_row_timeseries",
 ]
 
 from .build_environments_from_directory import (
     build_environments_from_directory,
 )
-from .is_time_series import is_timeseries_feature
+from .fingerprint import combine_fingerprints, file_fingerprint
+from .is_time_series import (
+    TimeSeriesSchema,
+    analyze_schema,
+    is_columnar_timeseries_feature,
+    is_timeseries_feature,
+)
+from .rebatch import rebatch
+from .resolve_features import resolve_features
+from .time_series_layout import (
+    get_timeseries_field,
+    to_columnar_timeseries,
+    to_row_timeseries,
+)
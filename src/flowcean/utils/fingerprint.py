@@ -0,0 +1,54 @@
+import hashlib
+from collections.abc import Iterable
+from pathlib import Path
+
+
+def file_fingerprint(path: Path, *parameters: object) -> str:
+    """Fingerprint the data of a file.
+
+    The fingerprint is derived from the resolved path, the size and the
+    modification time of the file, so that it is equal across runs and
+    changes whenever the file is written. Parameters that affect how the file
+    is read, e.g., a separator, are included as well.
+
+    Args:
+        path: The path of the file.
+        *parameters: Parameters affecting the data read from the file.
+
+    Returns:
+        The fingerprint of the file.
+    """
+    stat = path.stat()
+    return _hash(
+        [
+            str(path.resolve()),
+            str(stat.st_size),
+            str(stat.st_mtime_ns),
+            *map(repr, parameters),
+        ],
+    )
+
+
+def combine_fingerprints(fingerprints: Iterable[str | None]) -> str | None:
+    """Combine fingerprints into a single fingerprint.
+
+    Args:
+        fingerprints: The fingerprints to combine, in order.
+
+    Returns:
+        The combined fingerprint, or `None` if any fingerprint is `None`.
+    """
+    parts: list[str] = []
+    for fingerprint in fingerprints:
+        if fingerprint is None:
+            return None
+        parts.append(fingerprint)
+    return _hash(parts)
+
+
+def _hash(parts: Iterable[str]) -> str:
+    combined = hashlib.sha256()
+    for part in parts:
+        combined.update(part.encode())
+        combined.update(b"\0")
+    return combined.hexdigest()
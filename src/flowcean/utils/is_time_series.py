@@ -1,11 +1,114 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import cached_property
 from typing import cast
 
 import polars as pl
 
 
+@dataclass(frozen=True)
+class TimeSeriesSchema:
+    """Classification of the columns of a schema into time series layouts.
+
+    Attributes:
+        row_features: The time series features stored as a list of `time`
+            and `value` structs, in column order.
+        columnar_features: The time series features stored in the columnar
+            layout, i.e., as a struct of a `time` and a `value` list, in
+            column order.
+        timeseries_features: All time series features in column order.
+    """
+
+    row_features: tuple[str, ...]
+    columnar_features: tuple[str, ...]
+    timeseries_features: tuple[str, ...]
+
+    @cached_property
+    def _columnar(self) -> frozenset[str]:
+        return frozenset(self.columnar_features)
+
+    @cached_property
+    def _timeseries(self) -> frozenset[str]:
+        return frozenset(self.timeseries_features)
+
+    def is_timeseries(self, feature: str) -> bool:
+        """Check whether a feature is a time series in either layout."""
+        return feature in self._timeseries
+
+    def is_columnar(self, feature: str) -> bool:
+        """Check whether a feature is a time series in the columnar layout."""
+        return feature in self._columnar
+
+
+def analyze_schema(schema: Mapping[str, pl.DataType]) -> TimeSeriesSchema:
+    """Classify all columns of a schema into time series layouts.
+
+    Transforms processing many features should analyze the schema once per
+    call and look up the layout of each feature in the result, instead of
+    checking every feature separately.
+
+    Args:
+        schema: The schema to analyze, e.g., `DataFrame.schema`.
+
+    Returns:
+        The classification of the columns.
+    """
+    row_features = []
+    columnar_features = []
+    timeseries_features = []
+    for name, data_type in schema.items():
+        if _is_row_timeseries_type(data_type):
+            row_features.append(name)
+        elif _is_columnar_timeseries_type(data_type):
+            columnar_features.append(name)
+        else:
+            continue
+        timeseries_features.append(name)
+    return TimeSeriesSchema(
+        row_features=tuple(row_features),
+        columnar_features=tuple(columnar_features),
+        timeseries_features=tuple(timeseries_features),
+    )
+
+
 def is_timeseries_feature(df: pl.DataFrame, column_name: str) -> bool:
+    """Check whether a feature is a time series.
+
+    Time series are either stored as a list of `time` and `value` structs,
+    or in the columnar layout as a struct of a `time` and a `value` list (see
+    `is_columnar_timeseries_feature`).
+
+    Args:
+        df: The DataFrame containing the feature.
+        column_name: The name of the feature.
+
+    Returns:
+        Whether the feature is a time series in either layout.
+    """
     data_type = df.select(column_name).dtypes[0]
+    return _is_row_timeseries_type(data_type) or _is_columnar_timeseries_type(
+        data_type,
+    )
+
+
+def is_columnar_timeseries_feature(df: pl.DataFrame, column_name: str) -> bool:
+    """Check whether a feature is a time series in the columnar layout.
+
+    In the columnar layout, a time series is a struct of a `time` and a
+    `value` list of equal length. Accessing either field does not copy any
+    data, while the row layout requires evaluating every list element.
 
+    Args:
+        df: The DataFrame containing the feature.
+        column_name: The name of the feature.
+
+    Returns:
+        Whether the feature is a time series in the columnar layout.
+    """
+    return _is_columnar_timeseries_type(df.select(column_name).dtypes[0])
+
+
+def _is_row_timeseries_type(data_type: pl.DataType) -> bool:
     if data_type.base_type() != pl.List:
         return False
 
@@ -15,3 +118,15 @@ def is_timeseries_feature(df: pl.DataFrame, column_name: str) -> bool:
 
     field_names = [field.name for field in cast(pl.Struct, inner_type).fields]
     return "time" in field_names and "value" in field_names
+
+
+def _is_columnar_timeseries_type(data_type: pl.DataType) -> bool:
+    if data_type.base_type() != pl.Struct:
+        return False
+    fields = {
+        field.name: field.dtype for field in cast(pl.Struct, data_type).fields
+    }
+    return all(
+        name in fields and fields[name].base_type() == pl.List
+        for name in ("time", "value")
+    )
@@ -0,0 +1,42 @@
+from collections.abc import Iterable, Iterator
+
+import polars as pl
+
+
+def rebatch(
+    frames: Iterable[pl.DataFrame],
+    batch_size: int,
+) -> Iterator[pl.DataFrame]:
+    """Re-batch a stream of DataFrames into batches of a fixed size.
+
+    Readers often return data in chunks whose size is determined by the file
+    layout, e.g., Parquet row groups or CSV read buffers. This helper buffers
+    these chunks and yields batches of exactly `batch_size` rows. Only the
+    last batch may be smaller.
+
+    Args:
+        frames: The stream of DataFrames to re-batch.
+        batch_size: The number of rows of each batch.
+
+    Yields:
+        Batches with `batch_size` rows.
+    """
+    if batch_size < 1:
+        message = "batch_size must be positive"
+        raise ValueError(message)
+    pending: list[pl.DataFrame] = []
+    pending_rows = 0
+    for frame in frames:
+        pending.append(frame)
+        pending_rows += len(frame)
+        if pending_rows < batch_size:
+            continue
+        data = pl.concat(pending, how="vertical", rechunk=False)
+        offset = 0
+        while pending_rows - offset >= batch_size:
+            yield data.slice(offset, batch_size)
+            offset += batch_size
+        pending = [data.slice(offset)]
+        pending_rows -= offset
+    if pending_rows > 0:
+        yield pl.concat(pending, how="vertical")
@@ -0,0 +1,43 @@
+import re
+from collections.abc import Iterable, Sequence
+
+from polars.exceptions import ColumnNotFoundError
+
+
+def resolve_features(
+    feature_names: Sequence[str],
+    selectors: Iterable[str],
+) -> list[str]:
+    """Resolve feature selectors against the features of a data source.
+
+    Selectors follow the same rules as polars column selections: a selector
+    wrapped by `^` and `$` is treated as a regular expression and matches all
+    features whose name matches the expression, any other selector must match
+    a feature name exactly. This allows to determine which features are
+    required before any data is read from a source.
+
+    Args:
+        feature_names: The names of the features available in the source.
+        selectors: The feature names or regular expressions to resolve.
+
+    Returns:
+        The names of the selected features without duplicates, in the order
+        of the selectors. Features matched by a regular expression are ordered
+        as in the source.
+
+    Raises:
+        ColumnNotFoundError: If a selector does not match any feature.
+    """
+    resolved: dict[str, None] = {}
+    for selector in selectors:
+        if selector.startswith("^") and selector.endswith("$"):
+            pattern = re.compile(selector)
+            matches = [name for name in feature_names if pattern.match(name)]
+        elif selector in feature_names:
+            matches = [selector]
+        else:
+            matches = []
+        if not matches:
+            raise ColumnNotFoundError(selector)
+        resolved.update(dict.fromkeys(matches))
+    return list(resolved)
@@ -0,0 +1,129 @@
+from collections.abc import Iterable
+from typing import Literal
+
+import polars as pl
+
+from .is_time_series import (
+    TimeSeriesSchema,
+    analyze_schema,
+    is_columnar_timeseries_feature,
+)
+
+
+def get_timeseries_field(
+    data: pl.DataFrame,
+    feature: str,
+    field: Literal["time", "value"],
+    schema: TimeSeriesSchema | None = None,
+) -> pl.Series:
+    """Get the time or value lists of a time series feature.
+
+    For time series in the columnar layout this does not copy any data.
+
+    Args:
+        data: The DataFrame containing the feature.
+        feature: The name of the time series feature.
+        field: The field to get.
+        schema: The analyzed schema of the data, if available, e.g., when
+            getting the fields of many features. Otherwise, only the data type
+            of the feature is inspected.
+
+    Returns:
+        A list series with the times or values of each time series.
+    """
+    series = data.get_column(feature)
+    columnar = (
+        is_columnar_timeseries_feature(data, feature)
+        if schema is None
+        else schema.is_columnar(feature)
+    )
+    if columnar:
+        return series.struct.field(field).alias(feature)
+    return series.list.eval(pl.element().struct.field(field))
+
+
+def to_columnar_timeseries(
+    data: pl.DataFrame,
+    features: Iterable[str] | None = None,
+) -> pl.DataFrame:
+    """Convert time series features into the columnar layout.
+
+    Time series stored as a list of `time` and `value` structs are converted
+    into a struct of a `time` and a `value` list. Features that are already
+    in the columnar layout are left unchanged.
+
+    Args:
+        data: The data to convert.
+        features: The time series features to convert. If `None`, all time
+            series features are converted.
+
+    Returns:
+        The data with the time series in the columnar layout.
+    """
+    features = _row_timeseries_features(data, features)
+    return data.with_columns(
+        pl.struct(
+            pl.col(feature)
+            .list.eval(pl.element().struct.field("time"))
+            .alias("time"),
+            pl.col(feature)
+            .list.eval(pl.element().struct.field("value"))
+            .alias("value"),
+        ).alias(feature)
+        for feature in features
+    )
+
+
+def to_row_timeseries(
+    data: pl.DataFrame,
+    features: Iterable[str] | None = None,
+) -> pl.DataFrame:
+    """Convert time series features from the columnar into the row layout.
+
+    This is the inverse of `to_columnar_timeseries`.
+
+    Args:
+        data: The data to convert.
+        features: The time series features to convert. If `None`, all time
+            series features in the columnar layout are converted.
+
+    Returns:
+        The data with the time series as lists of `time` and `value` structs.
+    """
+    features = (
+        list(features)
+        if features is not None
+        else analyze_schema(data.schema).columnar_features
+    )
+    rows = pl.DataFrame({"row": pl.Series(range(len(data)), dtype=pl.UInt32)})
+    columns = []
+    for feature in features:
+        points = (
+            data.select(
+                pl.col(feature).struct.field("time"),
+                pl.col(feature).struct.field("value"),
+            )
+            .with_row_index("row")
+            .filter(pl.col("time").list.len() > 0)
+            .explode("time", "value")
+            .group_by("row", maintain_order=True)
+            .agg(pl.struct("time", "value").alias(feature))
+        )
+        columns.append(
+            rows.join(points, on="row", how="left")
+            .get_column(feature)
+            .fill_null(pl.lit([], dtype=points.schema[feature])),
+        )
+    return data.with_columns(columns)
+
+
+def _row_timeseries_features(
+    data: pl.DataFrame,
+    features: Iterable[str] | None,
+) -> list[str]:
+    schema = analyze_schema(data.schema)
+    if features is not None:
+        return [
+            feature for feature in features if not schema.is_columnar(feature)
+        ]
+    return list(schema.row_features)
@@ -1,12 +1,22 @@
 import unittest
+from typing import Self, override
 
 import polars as pl
+import pytest
 from polars.testing import assert_frame_equal
 
+from flowcean.core.environment import EnvironmentLoadError
 from flowcean.core.environment.chain import ChainEnvironment
 from flowcean.environments.dataset import Dataset
 
 
+class FailingDataset(Dataset):
+    @override
+    def load(self) -> Self:
+        message = "failed to load"
+        raise RuntimeError(message)
+
+
 class TestChain(unittest.TestCase):
     def test_chain_environment(self) -> None:
         dataset1 = Dataset(
@@ -70,6 +80,30 @@ class TestChain(unittest.TestCase):
             ),
         )
 
+    def test_concurrent_load(self) -> None:
+        datasets = [Dataset(pl.DataFrame({"A": [i]})) for i in range(10)]
+
+        chain = ChainEnvironment(
+            *datasets,
+            max_workers=4,
+            max_in_flight=2,
+        ).load()
+
+        assert_frame_equal(chain.get_data(), pl.DataFrame({"A": range(10)}))
+
+    def test_concurrent_load_failure(self) -> None:
+        chain = ChainEnvironment(
+            Dataset(pl.DataFrame({"A": [0]})),
+            FailingDataset(pl.DataFrame({"A": [1]})),
+            Dataset(pl.DataFrame({"A": [2]})),
+            FailingDataset(pl.DataFrame({"A": [3]})),
+            max_workers=2,
+        )
+
+        with pytest.raises(EnvironmentLoadError) as error:
+            chain.load()
+        assert sorted(error.value.failures) == [1, 3]
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+from typing import override
+
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from flowcean.core import Chain, Transform, UnsupervisedLearner
+from flowcean.transforms import (
+    Flatten,
+    Rename,
+    Select,
+    SlidingWindow,
+    Standardize,
+    TimeWindow,
+)
+
+
+class CountingTransform(Transform, UnsupervisedLearner):
+    def __init__(self) -> None:
+        self.fits = 0
+        self.transforms = 0
+
+    @override
+    def fit(self, data: pl.DataFrame) -> None:
+        self.fits += 1
+
+    @override
+    def transform(self, data: pl.DataFrame) -> pl.DataFrame:
+        self.transforms += 1
+        return data
+
+
+class TestChainTransform(unittest.TestCase):
+    def test_fused_matches_sequential(self) -> None:
+        data_frame = pl.DataFrame(
+            {
+                "series": [
+                    [{"time": t, "value": i * t} for t in range(4)]
+                    for i in range(6)
+                ],
+                "a": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+                "b": [6, 5, 4, 3, 2, 1],
+                "c": [0, 0, 0, 0, 0, 0],
+            }
+        )
+        standardize = Standardize()
+        standardize.fit(data_frame.select("a", "b"))
+        transforms: list[Transform] = [
+            TimeWindow(time_start=1.0, time_end=2.0),
+            Flatten(),
+            Select(["a", "b", "series_0"]),
+            standardize,
+            Rename({"series_0": "s"}),
+            SlidingWindow(window_size=2),
+        ]
+
+        expected = data_frame
+        for transform in transforms:
+            expected = transform.transform(expected)
+
+        assert_frame_equal(Chain(*transforms).transform(data_frame), expected)
+
+    def test_eager_transforms(self) -> None:
+        data_frame = pl.DataFrame(
+            {
+                "series": [
+                    [{"time": t, "value": i * t} for t in range(4)]
+                    for i in range(6)
+                ],
+            }
+        )
+        time_window = TimeWindow(
+            time_start=1.0,
+            time_end=2.0,
+            assume_sorted=True,
+        )
+        counting = CountingTransform()
+        chain = Chain(
+            Rename({"series": "s"}), time_window, counting, Flatten()
+        )
+
+        assert not time_window.fusable
+        assert not counting.fusable
+        assert not chain.fusable
+        assert Chain(Rename({"series": "s"}), Select(["s"])).fusable
+        assert_frame_equal(
+            chain.transform(data_frame),
+            Flatten().transform(
+                TimeWindow(time_start=1.0, time_end=2.0).transform(
+                    data_frame.rename({"series": "s"}),
+                ),
+            ),
+        )
+        assert counting.transforms == 1
+
+    def test_standardize_lazy(self) -> None:
+        data_frame = pl.DataFrame({"a": [1.0, 2.0, 3.0], "b": [4, 5, 9]})
+        standardize = Standardize()
+        standardize.fit(data_frame)
+
+        assert_frame_equal(
+            standardize.transform_lazy(data_frame.lazy()).collect(),
+            standardize.transform(data_frame),
+        )
+
+    def test_fit_transform_once(self) -> None:
+        data_frame = pl.DataFrame({"a": [1.0, 2.0, 3.0]})
+        counting = CountingTransform()
+        chain = Chain(counting, Standardize(), CountingTransform())
+
+        transformed_data = chain.fit_transform(data_frame)
+
+        assert counting.fits == 1
+        assert counting.transforms == 1
+        assert_frame_equal(transformed_data, chain.transform(data_frame))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from flowcean.core.environment import Collector
+
+
+def _samples(n: int) -> list[pl.DataFrame]:
+    return [
+        pl.DataFrame({"a": [i, i + 1], "b": [float(i)] * 2}) for i in range(n)
+    ]
+
+
+class TestCollector(unittest.TestCase):
+    def test_collect(self) -> None:
+        samples = _samples(10)
+        collector = Collector(chunk_size=3)
+        for sample in samples:
+            collector.append(sample)
+
+        assert len(collector) == 20
+        data = collector.finish()
+        assert_frame_equal(data, pl.concat(samples))
+        assert data.n_chunks() == 1
+
+    def test_collect_nothing(self) -> None:
+        assert_frame_equal(Collector().finish(), pl.DataFrame())
+
+    def test_spill(self) -> None:
+        samples = _samples(10)
+        with tempfile.TemporaryDirectory() as directory:
+            collector = Collector(
+                chunk_size=2,
+                memory_limit=1,
+                spill_directory=directory,
+            )
+            for sample in samples:
+                collector.append(sample)
+            assert any(Path(directory).iterdir())
+
+            data = collector.finish()
+            assert not any(Path(directory).iterdir())
+
+        assert_frame_equal(data, pl.concat(samples))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+from pathlib import Path
+from typing import override
+
+import numpy as np
+import polars as pl
+
+from flowcean.core import Model
+
+
+class SumModel(Model):
+    @override
+    def predict(self, input_features: pl.DataFrame) -> pl.DataFrame:
+        return input_features.select(
+            total=pl.col("a") + pl.col("b"),
+            difference=pl.col("a") - pl.col("b"),
+        )
+
+    @override
+    def save(self, path: Path) -> None:
+        raise NotImplementedError
+
+    @override
+    def load(self, path: Path) -> None:
+        raise NotImplementedError
+
+
+class TestModel(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = SumModel()
+        self.model.input_names = ["a", "b"]
+
+    def test_predict_array_names_columns(self) -> None:
+        predictions = self.model.predict_array(np.array([[3.0, 1.0]]))
+
+        np.testing.assert_allclose(predictions, [[4.0, 2.0]])
+
+    def test_predict_one_non_contiguous_out(self) -> None:
+        buffer = np.zeros(4)
+        out = buffer[::2]
+
+        prediction = self.model.predict_one(np.array([3.0, 1.0]), out)
+
+        assert prediction is out
+        np.testing.assert_allclose(buffer, [4.0, 0.0, 2.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+from collections.abc import Iterator
+from itertools import count, islice
+from typing import Self, override
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from flowcean.core.environment import IncrementalEnvironment
+from flowcean.environments.dataset import Dataset
+
+
+class Counter(IncrementalEnvironment):
+    @override
+    def load(self) -> Self:
+        return self
+
+    @override
+    def __iter__(self) -> Iterator[pl.DataFrame]:
+        for i in count():
+            yield pl.DataFrame({"a": [i]})
+
+
+class Failing(IncrementalEnvironment):
+    @override
+    def load(self) -> Self:
+        return self
+
+    @override
+    def __iter__(self) -> Iterator[pl.DataFrame]:
+        yield pl.DataFrame({"a": [0]})
+        message = "failed to produce"
+        raise RuntimeError(message)
+
+
+class Aborted(BaseException):
+    pass
+
+
+class Aborting(IncrementalEnvironment):
+    @override
+    def load(self) -> Self:
+        return self
+
+    @override
+    def __iter__(self) -> Iterator[pl.DataFrame]:
+        yield pl.DataFrame({"a": [0]})
+        raise Aborted
+
+
+class TestPrefetchingEnvironment(unittest.TestCase):
+    def test_prefetch(self) -> None:
+        data = pl.DataFrame({"a": range(10)})
+        environment = Dataset(data).as_stream(batch_size=3).prefetch(depth=2)
+        environment.load()
+
+        assert_frame_equal(pl.concat(environment), data)
+
+    def test_stop_early(self) -> None:
+        environment = Counter().prefetch(depth=1).load()
+
+        batches = list(islice(environment, 3))
+
+        assert_frame_equal(pl.concat(batches), pl.DataFrame({"a": [0, 1, 2]}))
+
+    def test_exception(self) -> None:
+        environment = Failing().prefetch().load()
+        with pytest.raises(RuntimeError, match="failed to produce"):
+            list(environment)
+
+    def test_base_exception(self) -> None:
+        environment = Aborting().prefetch().load()
+        with pytest.raises(Aborted):
+            list(environment)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,9 @@ import unittest
 import polars as pl
 from polars.testing import assert_frame_equal
 
+from flowcean.core.environment import ChainEnvironment
 from flowcean.environments.dataset import Dataset
+from flowcean.utils import to_row_timeseries
 
 
 class TestToTimeSeries(unittest.TestCase):
@@ -45,6 +47,140 @@ class TestToTimeSeries(unittest.TestCase):
             check_column_order=False,
         )
 
+    def test_to_time_series_partition_by(self) -> None:
+        dataset = Dataset(
+            pl.DataFrame(
+                {
+                    "run": [0, 0, 1, 1],
+                    "time_feature": [0, 1, 0, 1],
+                    "feature_a": [42, 43, 44, 45],
+                }
+            )
+        )
+
+        time_series_dataset = dataset.to_time_series(
+            "time_feature",
+            partition_by="run",
+        )
+
+        assert_frame_equal(
+            time_series_dataset.get_data(),
+            pl.DataFrame(
+                {
+                    "run": [0, 1],
+                    "feature_a": [
+                        [
+                            {"time": 0, "value": 42},
+                            {"time": 1, "value": 43},
+                        ],
+                        [
+                            {"time": 0, "value": 44},
+                            {"time": 1, "value": 45},
+                        ],
+                    ],
+                },
+            ),
+        )
+
+    def test_chain_to_time_series(self) -> None:
+        datasets = [
+            Dataset(
+                pl.DataFrame(
+                    {
+                        "time_feature": [0, 1, 2],
+                        "feature_a": [i, i + 1, i + 2],
+                        "feature_b": [-i, -i - 1, -i - 2],
+                    }
+                )
+            )
+            for i in range(5)
+        ]
+
+        chain = ChainEnvironment(*datasets)
+        time_series_dataset = chain.to_time_series_per_environment(
+            "time_feature",
+        )
+
+        assert_frame_equal(
+            time_series_dataset.get_data(),
+            pl.concat(
+                [
+                    dataset.to_time_series("time_feature").get_data()
+                    for dataset in datasets
+                ],
+            ),
+        )
+
+        assert_frame_equal(
+            chain.to_time_series("time_feature").get_data(),
+            Dataset(pl.concat(dataset.get_data() for dataset in datasets))
+            .to_time_series("time_feature")
+            .get_data(),
+        )
+
+    def test_chain_to_time_series_empty_environment(self) -> None:
+        data = pl.DataFrame({"time_feature": [0, 1], "feature_a": [1, 2]})
+        chain = ChainEnvironment(
+            Dataset(data),
+            Dataset(data.clear()),
+            Dataset(data),
+        )
+
+        for columnar in (False, True):
+            time_series_dataset = chain.to_time_series_per_environment(
+                "time_feature",
+                columnar=columnar,
+            )
+            assert_frame_equal(
+                time_series_dataset.get_data(),
+                pl.concat(
+                    [
+                        dataset.to_time_series(
+                            "time_feature",
+                            columnar=columnar,
+                        ).get_data()
+                        for dataset in chain.environments
+                    ],
+                ),
+            )
+
+    def test_to_time_series_columnar(self) -> None:
+        dataset = Dataset(
+            pl.DataFrame(
+                {
+                    "run": [0, 0, 1, 1],
+                    "time_feature": [0, 1, 0, 1],
+                    "feature_a": [42, 43, 44, 45],
+                }
+            )
+        )
+
+        time_series_dataset = dataset.to_time_series(
+            "time_feature",
+            partition_by="run",
+            columnar=True,
+        )
+
+        assert_frame_equal(
+            time_series_dataset.get_data(),
+            pl.DataFrame(
+                {
+                    "run": [0, 1],
+                    "feature_a": [
+                        {"time": [0, 1], "value": [42, 43]},
+                        {"time": [0, 1], "value": [44, 45]},
+                    ],
+                },
+            ),
+        )
+        assert_frame_equal(
+            to_row_timeseries(time_series_dataset.get_data()),
+            dataset.to_time_series(
+                "time_feature",
+                partition_by="run",
+            ).get_data(),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
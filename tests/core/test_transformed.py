@@ -0,0 +1,200 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from flowcean.environments.csv import CsvDataLoader
+from flowcean.environments.dataset import Dataset
+from flowcean.transforms import (
+    Flatten,
+    Rename,
+    Resample,
+    Select,
+    SlidingWindow,
+)
+
+
+class TestTransformedEnvironment(unittest.TestCase):
+    def test_get_lazy(self) -> None:
+        environment = Dataset(
+            pl.DataFrame(
+                {
+                    "A": [1, 2],
+                    "B": [3, 4],
+                    "C": [5, 6],
+                },
+            )
+        ).with_transform(Select(["A", "B"]) | Rename({"A": "X"}))
+
+        lazy_data = environment.get_lazy()
+
+        assert isinstance(lazy_data, pl.LazyFrame)
+        assert_frame_equal(
+            lazy_data.collect(),
+            pl.DataFrame(
+                {
+                    "X": [1, 2],
+                    "B": [3, 4],
+                },
+            ),
+        )
+        assert_frame_equal(environment.get_data(), lazy_data.collect())
+
+    def test_cache(self) -> None:
+        transform = Rename({"A": "X"})
+        environment = Dataset(
+            pl.DataFrame({"A": [1, 2]}),
+        ).with_transform(transform, cache=True)
+        environment.load()
+
+        data = environment.get_data()
+        assert environment.get_data() is data
+        assert environment.cache_misses == 1
+        assert environment.cache_hits == 1
+
+        transform.mapping = {"A": "Y"}
+        assert environment.get_data().columns == ["Y"]
+        assert environment.cache_misses == 2
+
+        environment.load()
+        environment.get_data()
+        assert environment.cache_misses == 3
+
+    def test_cache_source_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "data.csv"
+            pl.DataFrame({"A": [1, 2]}).write_csv(path)
+            environment = CsvDataLoader(path).with_transform(
+                Rename({"A": "X"}),
+                cache=True,
+            )
+            environment.load()
+            environment.get_data()
+
+            environment.environment.load()
+            environment.get_data()
+            assert environment.cache_hits == 1
+
+            pl.DataFrame({"A": [1, 2, 3]}).write_csv(path)
+            environment.environment.load()
+            assert_frame_equal(
+                environment.get_data(),
+                pl.DataFrame({"X": [1, 2, 3]}),
+            )
+            assert environment.cache_misses == 2
+
+    def test_cache_feature_transforms(self) -> None:
+        environment = Dataset(
+            pl.DataFrame(
+                {
+                    "series": [
+                        [{"time": t, "value": float(t)} for t in range(4)],
+                        [{"time": t, "value": -float(t)} for t in range(4)],
+                    ],
+                },
+            ),
+        ).with_transform(Resample(1.0) | Flatten(), cache=True)
+        environment.load()
+
+        for _ in range(4):
+            environment.get_data()
+
+        assert environment.cache_misses == 1
+        assert environment.cache_hits == 3
+
+    def test_cache_requires_offline_environment(self) -> None:
+        with pytest.raises(ValueError, match="offline"):
+            Dataset(pl.DataFrame({"A": [1]})).as_stream().with_transform(
+                Rename({"A": "X"}),
+                cache=True,
+            )
+
+    def test_disk_cache(self) -> None:
+        with (
+            tempfile.TemporaryDirectory() as source,
+            tempfile.TemporaryDirectory() as directory,
+        ):
+            path = Path(source) / "data.csv"
+            pl.DataFrame({"A": [1, 2]}).write_csv(path)
+
+            for run in range(3):
+                environment = CsvDataLoader(path).with_transform(
+                    Rename({"A": "X"}),
+                    cache=True,
+                    cache_directory=directory,
+                )
+                environment.load()
+
+                data = environment.get_data()
+                assert_frame_equal(data, pl.DataFrame({"X": [1, 2]}))
+                assert environment.cache_misses == (run == 0)
+                assert [path.stem for path in Path(directory).iterdir()] == [
+                    environment.fingerprint(),
+                ]
+
+                environment.invalidate_cache()
+                assert_frame_equal(data, pl.DataFrame({"X": [1, 2]}))
+
+    def test_disk_cache_requires_fingerprint(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            environment = Dataset(
+                pl.DataFrame({"A": [1, 2]}),
+            ).with_transform(
+                Rename({"A": "X"}),
+                cache=True,
+                cache_directory=directory,
+            )
+            environment.load()
+
+            with pytest.raises(ValueError, match="fingerprint"):
+                environment.get_data()
+
+    def test_iter_batches(self) -> None:
+        data = pl.DataFrame(
+            {
+                "A": list(range(10)),
+                "B": [float(i) for i in range(10)],
+            },
+        )
+
+        with tempfile.NamedTemporaryFile() as f:
+            data.write_csv(f.name)
+            environment = CsvDataLoader(
+                path=Path(f.name),
+                read_size=3,
+            ).with_transform(Rename({"A": "X"}))
+            environment.load()
+            batches = list(environment.iter_batches(4, ["X"]))
+
+        assert environment.environment.data is None
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        assert_frame_equal(
+            pl.concat(batches),
+            data.select(X=pl.col("A")),
+        )
+
+    def test_stream(self) -> None:
+        data = pl.DataFrame({"A": [1, 2, 3, 4, 5]})
+        environment = (
+            Dataset(data)
+            .as_stream(batch_size=2)
+            .with_transform(Rename({"A": "X"}) | SlidingWindow(window_size=2))
+        )
+        environment.load()
+
+        assert_frame_equal(
+            pl.concat(environment),
+            pl.DataFrame(
+                {
+                    "X_0": [1, 2, 3, 4],
+                    "X_1": [2, 3, 4, 5],
+                },
+            ),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
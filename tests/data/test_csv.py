@@ -29,6 +29,55 @@ class TestCsvDataLoader(unittest.TestCase):
             loaded_data = dataloader.get_data()
             assert_frame_equal(loaded_data, data)
 
+    def test_select(self) -> None:
+        data = pl.DataFrame(
+            {
+                "A": [1, 2, 3],
+                "B_0": [4, 5, 6],
+                "B_1": [7, 8, 9],
+            },
+        )
+
+        with tempfile.NamedTemporaryFile() as f:
+            data.write_csv(f.name)
+            dataloader = CsvDataLoader(path=Path(f.name)).load()
+            selected_data = dataloader.select(["^B_.*$", "A"])
+            assert_frame_equal(selected_data, data.select("B_0", "B_1", "A"))
+
+    def test_stream(self) -> None:
+        data = pl.DataFrame(
+            {
+                "A": list(range(10)),
+                "B": [float(i) for i in range(10)],
+            },
+        )
+
+        with tempfile.NamedTemporaryFile() as f:
+            data.write_csv(f.name)
+            dataloader = CsvDataLoader(path=Path(f.name), read_size=3)
+            stream = dataloader.as_stream(batch_size=4).load()
+            batches = list(stream)
+
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        assert_frame_equal(pl.concat(batches), data)
+
+    def test_iter_batches_features(self) -> None:
+        data = pl.DataFrame(
+            {
+                "A": list(range(10)),
+                "B_0": [float(i) for i in range(10)],
+                "B_1": [-float(i) for i in range(10)],
+            },
+        )
+
+        with tempfile.NamedTemporaryFile() as f:
+            data.write_csv(f.name)
+            dataloader = CsvDataLoader(path=Path(f.name), read_size=3).load()
+            batches = list(dataloader.iter_batches(4, ["^B_.*$", "A"]))
+
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        assert_frame_equal(pl.concat(batches), data.select("B_0", "B_1", "A"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -29,6 +29,59 @@ class TestParquetDataLoader(unittest.TestCase):
             loaded_data = dataloader.get_data()
             assert_frame_equal(loaded_data, data)
 
+    def test_parquet_loader_lazy(self) -> None:
+        data = pl.DataFrame(
+            {
+                "A": [1, 2, 3],
+                "B": [4, 5, 6],
+            },
+        )
+
+        with tempfile.NamedTemporaryFile() as f:
+            data.write_parquet(f.name)
+            dataloader = ParquetDataLoader(path=Path(f.name))
+            with pytest.raises(NotLoadedError):
+                dataloader.get_lazy()
+            dataloader.load()
+            loaded_data = dataloader.get_lazy().select("B").collect()
+            assert_frame_equal(loaded_data, data.select("B"))
+
+    def test_stream(self) -> None:
+        data = pl.DataFrame(
+            {
+                "A": list(range(10)),
+                "B": [float(i) for i in range(10)],
+            },
+        )
+
+        with tempfile.NamedTemporaryFile() as f:
+            data.write_parquet(f.name)
+            dataloader = ParquetDataLoader(path=Path(f.name), read_size=3)
+            stream = dataloader.as_stream(batch_size=4).load()
+            batches = list(stream)
+
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        assert_frame_equal(pl.concat(batches), data)
+
+    def test_iter_batches_features(self) -> None:
+        data = pl.DataFrame(
+            {
+                "A": list(range(10)),
+                "B_0": [float(i) for i in range(10)],
+                "B_1": [-float(i) for i in range(10)],
+            },
+        )
+
+        with tempfile.NamedTemporaryFile() as f:
+            data.write_parquet(f.name)
+            dataloader = ParquetDataLoader(
+                path=Path(f.name), read_size=3
+            ).load()
+            batches = list(dataloader.iter_batches(4, ["^B_.*$", "A"]))
+
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        assert_frame_equal(pl.concat(batches), data.select("B_0", "B_1", "A"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+import polars as pl
+import torch
+
+from flowcean.environments.pytorch import TorchDataset
+
+
+class TestTorchDataset(unittest.TestCase):
+    def setUp(self) -> None:
+        self.inputs = pl.DataFrame(
+            {"a": [1.0, 2.0, 3.0, 4.0, 5.0], "b": [1, 2, 3, 4, 5]},
+        )
+        self.outputs = pl.DataFrame({"c": [0.5, 1.5, 2.5, 3.5, 4.5]})
+
+    def test_sample(self) -> None:
+        dataset = TorchDataset(self.inputs, self.outputs)
+
+        assert len(dataset) == 5
+        inputs, outputs = dataset[1]
+        assert torch.equal(inputs, torch.tensor([2.0, 2.0]))
+        assert torch.equal(outputs, torch.tensor([1.5]))
+        assert inputs.dtype == torch.float32
+
+    def test_without_outputs(self) -> None:
+        inputs, outputs = TorchDataset(self.inputs)[0:2]
+
+        assert inputs.shape == (2, 2)
+        assert outputs.shape == (2, 0)
+
+    def test_batches(self) -> None:
+        dataset = TorchDataset(self.inputs, self.outputs)
+
+        batches = list(dataset.data_loader(2))
+
+        assert [len(inputs) for inputs, _ in batches] == [2, 2, 1]
+        assert torch.equal(
+            torch.cat([inputs for inputs, _ in batches]),
+            dataset.input_tensor,
+        )
+        assert torch.equal(
+            torch.cat([outputs for _, outputs in batches]),
+            dataset.output_tensor,
+        )
+
+    def test_shuffled_batches(self) -> None:
+        dataset = TorchDataset(self.inputs, self.outputs)
+
+        batches = list(dataset.data_loader(2, shuffle=True))
+
+        inputs = torch.cat([inputs for inputs, _ in batches])
+        outputs = torch.cat([outputs for _, outputs in batches])
+        assert sorted(outputs.flatten().tolist()) == [0.5, 1.5, 2.5, 3.5, 4.5]
+        assert torch.equal(inputs[:, 0] - 0.5, outputs[:, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
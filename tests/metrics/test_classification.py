@@ -1,6 +1,7 @@
 import unittest
 
 import polars as pl
+import pytest
 
 from flowcean.metrics.classification import (
     Accuracy,
@@ -39,6 +40,30 @@ class TestMetrics(unittest.TestCase):
         recall = Recall()(self.true, self.predicted)
         assert recall == 0.5
 
+    def test_non_binary_labels(self) -> None:
+        for true, predicted, match in (
+            ([0, 1, 2], [2, 1, 0], "not binary"),
+            ([0, 2, 0], [2, 0, 0], "positive label"),
+        ):
+            with pytest.raises(ValueError, match=match):
+                PrecisionScore()(
+                    pl.DataFrame({"a": true}),
+                    pl.DataFrame({"a": predicted}),
+                )
+        with pytest.raises(ValueError, match="single label column"):
+            Recall()(
+                pl.DataFrame({"a": [0, 1], "b": [1, 0]}),
+                pl.DataFrame({"a": [0, 1], "b": [1, 1]}),
+            )
+
+    def test_non_binary_labels_across_batches(self) -> None:
+        first, second = FBetaScore(), FBetaScore()
+        first.update(pl.DataFrame({"a": [0, 1]}), pl.DataFrame({"a": [1, 1]}))
+        second.update(pl.DataFrame({"a": [2]}), pl.DataFrame({"a": [2]}))
+
+        with pytest.raises(ValueError, match="not binary"):
+            first.merge(second)
+
 
 if __name__ == "__main__":
     unittest.main()
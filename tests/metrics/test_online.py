@@ -0,0 +1,128 @@
+import copy
+import unittest
+
+import numpy as np
+import polars as pl
+from sklearn import metrics
+
+from flowcean.core import OnlineMetric
+from flowcean.metrics import (
+    Accuracy,
+    FBetaScore,
+    MaxError,
+    MeanAbsoluteError,
+    MeanSquaredError,
+    PrecisionScore,
+    R2Score,
+    Recall,
+)
+
+
+def _batches(data: pl.DataFrame, size: int) -> list[pl.DataFrame]:
+    return [data.slice(offset, size) for offset in range(0, len(data), size)]
+
+
+class TestOnlineMetrics(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self.regression_true = pl.DataFrame(rng.normal(5, 2, (100, 2)))
+        self.regression_predicted = pl.DataFrame(rng.normal(5, 2, (100, 2)))
+        self.classification_true = pl.DataFrame(
+            {"a": rng.integers(0, 2, 100)},
+        )
+        self.classification_predicted = pl.DataFrame(
+            {"a": rng.integers(0, 2, 100)},
+        )
+
+    def assert_streaming(
+        self,
+        metric: OnlineMetric,
+        true: pl.DataFrame,
+        predicted: pl.DataFrame,
+        expected: float,
+    ) -> None:
+        assert np.isclose(metric(true, predicted), expected)
+
+        metric.reset()
+        for true_batch, predicted_batch in zip(
+            _batches(true, 7),
+            _batches(predicted, 7),
+            strict=True,
+        ):
+            metric.update(true_batch, predicted_batch)
+        assert np.isclose(metric.compute(), expected)
+
+        first, second = copy.deepcopy(metric), copy.deepcopy(metric)
+        first.reset()
+        second.reset()
+        first.update(true[:30], predicted[:30])
+        second.update(true[30:], predicted[30:])
+        first.merge(second)
+        assert np.isclose(first.compute(), expected)
+
+    def test_regression(self) -> None:
+        true, predicted = self.regression_true, self.regression_predicted
+        self.assert_streaming(
+            MeanSquaredError(),
+            true,
+            predicted,
+            metrics.mean_squared_error(true, predicted),
+        )
+        self.assert_streaming(
+            MeanAbsoluteError(),
+            true,
+            predicted,
+            metrics.mean_absolute_error(true, predicted),
+        )
+        self.assert_streaming(
+            R2Score(),
+            true,
+            predicted,
+            metrics.r2_score(true, predicted),
+        )
+        self.assert_streaming(
+            MaxError(),
+            true[:, :1],
+            predicted[:, :1],
+            metrics.max_error(true[:, :1], predicted[:, :1]),
+        )
+
+    def test_classification(self) -> None:
+        true = self.classification_true
+        predicted = self.classification_predicted
+        self.assert_streaming(
+            Accuracy(),
+            true,
+            predicted,
+            metrics.accuracy_score(true, predicted),
+        )
+        self.assert_streaming(
+            PrecisionScore(),
+            true,
+            predicted,
+            metrics.precision_score(true, predicted),
+        )
+        self.assert_streaming(
+            Recall(),
+            true,
+            predicted,
+            metrics.recall_score(true, predicted),
+        )
+        self.assert_streaming(
+            FBetaScore(beta=0.5),
+            true,
+            predicted,
+            metrics.fbeta_score(true, predicted, beta=0.5),
+        )
+
+    def test_call_keeps_state(self) -> None:
+        metric = MeanSquaredError()
+        metric.update(pl.DataFrame({"a": [0.0]}), pl.DataFrame({"a": [2.0]}))
+
+        metric(pl.DataFrame({"a": [0.0]}), pl.DataFrame({"a": [0.0]}))
+
+        assert metric.compute() == 4.0
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
+import math
 import unittest
 
 import polars as pl
+import pytest
 
 from flowcean.metrics.regression import (
     MaxError,
@@ -31,6 +33,21 @@ class TestMetrics(unittest.TestCase):
         r2 = R2Score()(self.true, self.predicted)
         assert r2 == -1.0
 
+    def test_r2_score_single_sample(self) -> None:
+        r2 = R2Score()(self.true[:1], self.predicted[:1])
+        assert math.isnan(r2)
+
+    def test_different_shapes(self) -> None:
+        predicted = self.predicted.with_columns(b=pl.col("a"))
+        for metric in (
+            MaxError(),
+            MeanAbsoluteError(),
+            MeanSquaredError(),
+            R2Score(),
+        ):
+            with pytest.raises(ValueError, match="different shapes"):
+                metric(self.true, predicted)
+
 
 if __name__ == "__main__":
     unittest.main()
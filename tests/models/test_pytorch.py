@@ -0,0 +1,117 @@
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import polars as pl
+import pytest
+import torch
+from polars.testing import assert_frame_equal
+
+from flowcean.models.pytorch import PyTorchModel
+
+
+class Slow(torch.nn.Module):
+    def __init__(self) -> None:
+        super().__init__()
+        self.running = 0
+        self.max_running = 0
+
+    def forward(self, inputs: torch.Tensor) -> torch.Tensor:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        time.sleep(0.001)
+        self.running -= 1
+        return inputs[:, :1]
+
+
+class TestPyTorchModel(unittest.TestCase):
+    def setUp(self) -> None:
+        torch.manual_seed(0)
+        self.module = torch.nn.Linear(3, 2)
+        self.inputs = pl.DataFrame(
+            np.random.default_rng(0).random((10, 3)),
+            schema=["a", "b", "c"],
+        )
+
+    def expected(self) -> pl.DataFrame:
+        with torch.no_grad():
+            outputs = self.module(torch.tensor(self.inputs.to_numpy()).float())
+        return pl.DataFrame(outputs.numpy(), ["x", "y"])
+
+    def test_predict_batches(self) -> None:
+        model = PyTorchModel(self.module, ["x", "y"], batch_size=3)
+
+        assert_frame_equal(model.predict(self.inputs), self.expected())
+
+    def test_predict_single_batch(self) -> None:
+        model = PyTorchModel(
+            self.module,
+            ["x", "y"],
+            batch_size=32,
+            num_threads=1,
+        )
+
+        assert_frame_equal(model.predict(self.inputs), self.expected())
+
+    def test_concurrent_num_threads(self) -> None:
+        module = Slow()
+        model = PyTorchModel(module, ["x"], num_threads=1)
+        previous = torch.get_num_threads()
+        torch.set_num_threads(4)
+        try:
+            with ThreadPoolExecutor(8) as pool:
+                list(
+                    pool.map(
+                        lambda size: model.predict(self.inputs[:size]),
+                        [1 + i % 10 for i in range(50)],
+                    ),
+                )
+            assert torch.get_num_threads() == 4
+            assert module.max_running == 1
+        finally:
+            torch.set_num_threads(previous)
+
+    def test_predict_into_buffer(self) -> None:
+        model = PyTorchModel(self.module, ["x", "y"], batch_size=4)
+        out = np.zeros((10, 2), dtype=np.float32)
+
+        predictions = model.predict_tensor(
+            torch.tensor(self.inputs.to_numpy()).float(),
+            out=out,
+        )
+
+        assert predictions is out
+        np.testing.assert_array_equal(out, self.expected().to_numpy())
+
+    def test_predict_one(self) -> None:
+        model = PyTorchModel(self.module, ["x", "y"])
+        out = np.zeros(2, dtype=np.float32)
+
+        prediction = model.predict_one(self.inputs.to_numpy()[3], out)
+
+        assert prediction is out
+        np.testing.assert_allclose(
+            out,
+            self.expected().to_numpy()[3],
+            rtol=1e-6,
+        )
+
+    def test_predict_vector_output(self) -> None:
+        module = torch.nn.Sequential(
+            torch.nn.Linear(3, 1),
+            torch.nn.Flatten(0),
+        )
+        model = PyTorchModel(module, ["x"], batch_size=4)
+
+        for rows in (3, 10):
+            predictions = model.predict(self.inputs.head(rows))
+            assert predictions.shape == (rows, 1)
+
+    def test_num_workers_deprecated(self) -> None:
+        with pytest.warns(DeprecationWarning, match="num_workers"):
+            PyTorchModel(self.module, ["x", "y"], num_workers=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
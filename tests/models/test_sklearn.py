@@ -0,0 +1,68 @@
+import importlib
+import unittest
+import warnings
+
+import numpy as np
+import polars as pl
+from sklearn.linear_model import LinearRegression
+
+from flowcean.core import ModelWithTransform
+from flowcean.models import sklearn
+from flowcean.models.sklearn import SciKitModel
+from flowcean.transforms import Standardize
+
+
+class TestSciKitModel(unittest.TestCase):
+    def setUp(self) -> None:
+        # The filter for arrays without feature names is installed on import,
+        # reload the module as the test runner resets the filters.
+        importlib.reload(sklearn)
+        self.inputs = pl.DataFrame(
+            {"a": [1.0, 2.0, 3.0], "b": [0.0, 1.0, 0.0]}
+        )
+        outputs = self.inputs.select(y=pl.col("a") * 2 + pl.col("b"))
+        self.model = SciKitModel(
+            LinearRegression().fit(self.inputs, outputs["y"]),
+            "y",
+        )
+        self.expected = self.model.predict(self.inputs).to_numpy()
+
+    def test_predict_array(self) -> None:
+        with warnings.catch_warnings(record=True) as caught:
+            filters = list(warnings.filters)
+            predictions = self.model.predict_array(self.inputs.to_numpy())
+
+            assert warnings.filters == filters
+        assert not caught
+        np.testing.assert_allclose(predictions, self.expected)
+
+    def test_predict_one(self) -> None:
+        out = np.zeros(1)
+
+        prediction = self.model.predict_one(np.array([2.0, 1.0]), out)
+
+        assert prediction is out
+        np.testing.assert_allclose(out, self.expected[1])
+
+    def test_predict_array_with_transform(self) -> None:
+        transform = Standardize()
+        transformed = transform.fit_transform(self.inputs)
+        model = ModelWithTransform(
+            model=SciKitModel(
+                LinearRegression().fit(transformed, [1.0, 2.0, 3.0]),
+                "y",
+            ),
+            transform=transform,
+            input_names=["a", "b"],
+        )
+
+        predictions = model.predict_array(self.inputs.to_numpy())
+
+        np.testing.assert_allclose(
+            predictions,
+            model.predict(self.inputs).to_numpy(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+import polars as pl
+
+from flowcean.environments.dataset import Dataset
+from flowcean.learners.dummy_learner import DummyModel
+from flowcean.metrics import MeanAbsoluteError, MeanSquaredError
+from flowcean.strategies.incremental import evaluate_incremental
+from flowcean.strategies.offline import evaluate_offline
+
+
+class TestEvaluateIncremental(unittest.TestCase):
+    def test_matches_offline(self) -> None:
+        environment = Dataset(
+            pl.DataFrame({"x": range(10), "y": [float(i) for i in range(10)]}),
+        ).load()
+        model = DummyModel(["y"])
+        metrics = [MeanSquaredError(), MeanAbsoluteError()]
+
+        report = evaluate_incremental(
+            model,
+            environment.as_stream(batch_size=3).load(),
+            ["x"],
+            ["y"],
+            metrics,
+        )
+
+        assert report.metrics == {
+            "MeanSquaredError": 28.5,
+            "MeanAbsoluteError": 4.5,
+        }
+        assert (
+            report.metrics
+            == evaluate_offline(
+                model, environment, ["x"], ["y"], metrics
+            ).metrics
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
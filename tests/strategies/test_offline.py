@@ -0,0 +1,78 @@
+import unittest
+from typing import Any, override
+
+import numpy as np
+import polars as pl
+
+from flowcean.core import OfflineMetric
+from flowcean.environments.dataset import Dataset
+from flowcean.learners.dummy_learner import DummyLearner, DummyModel
+from flowcean.metrics import MaxError, MeanSquaredError, R2Score
+from flowcean.strategies.offline import evaluate_offline, learn_offline
+
+
+class Samples(OfflineMetric):
+    @override
+    def __call__(self, true: pl.DataFrame, predicted: pl.DataFrame) -> Any:
+        return (len(true), len(predicted))
+
+
+class TestEvaluateOffline(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self.environment = Dataset(
+            pl.DataFrame(
+                {
+                    "x": rng.random(100),
+                    "y": rng.integers(0, 2, 100),
+                },
+            ),
+        ).load()
+        self.model = DummyModel(["y"])
+        self.metrics: list[OfflineMetric] = [
+            MeanSquaredError(),
+            Samples(),
+            MaxError(),
+            R2Score(),
+        ]
+
+    def test_batches(self) -> None:
+        expected = evaluate_offline(
+            self.model,
+            self.environment,
+            ["x"],
+            ["y"],
+            self.metrics,
+        )
+
+        for max_workers in (None, 2):
+            report = evaluate_offline(
+                self.model,
+                self.environment,
+                ["x"],
+                ["y"],
+                self.metrics,
+                batch_size=7,
+                max_workers=max_workers,
+            )
+
+            assert list(report.metrics) == list(expected.metrics)
+            assert report.metrics["Samples"] == (100, 100)
+            for name in ("MeanSquaredError", "MaxError", "R2Score"):
+                assert np.isclose(
+                    report.metrics[name],
+                    expected.metrics[name],
+                )
+
+    def test_learn_records_input_names(self) -> None:
+        model = learn_offline(self.environment, DummyLearner(), ["x"], ["y"])
+
+        assert model.input_names == ["x"]
+        np.testing.assert_allclose(
+            model.predict_array(np.array([[0.5]])),
+            [[0.0]],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
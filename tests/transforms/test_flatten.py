@@ -263,6 +263,79 @@ class FlattenTransform(unittest.TestCase):
         with pytest.raises(FeatureLengthVaryError):
             flatten_transform.transform(data_frame)
 
+    def test_flatten_as_array(self) -> None:
+        flatten_transform = Flatten(as_array=True)
+
+        data_frame = pl.DataFrame(
+            {
+                "feature_a": [
+                    [{"time": 0, "value": 1}, {"time": 1, "value": 2}],
+                    [{"time": 0, "value": 3}, {"time": 1, "value": 4}],
+                ],
+                "scalar": [42, 43],
+            }
+        )
+        transformed_data = flatten_transform.transform(data_frame)
+
+        assert_frame_equal(
+            transformed_data,
+            pl.DataFrame(
+                {
+                    "feature_a": [[1, 2], [3, 4]],
+                    "scalar": [42, 43],
+                },
+                schema_overrides={"feature_a": pl.Array(pl.Int64, 2)},
+            ),
+        )
+        assert transformed_data.get_column("feature_a").to_numpy().shape == (
+            2,
+            2,
+        )
+
+    def test_flatten_columnar(self) -> None:
+        flatten_transform = Flatten()
+
+        data_frame = pl.DataFrame(
+            {
+                "feature_a": [
+                    {"time": [0, 1], "value": [1, 2]},
+                    {"time": [0, 1], "value": [3, 4]},
+                ],
+                "scalar": [42, 43],
+            }
+        )
+        transformed_data = flatten_transform.transform(data_frame)
+
+        assert_frame_equal(
+            transformed_data,
+            pl.DataFrame(
+                {
+                    "scalar": [42, 43],
+                    "feature_a_0": [1, 3],
+                    "feature_a_1": [2, 4],
+                }
+            ),
+        )
+
+    def test_flatten_parallel(self) -> None:
+        data_frame = pl.DataFrame(
+            {
+                f"feature_{i}": [
+                    [{"time": t, "value": i * t} for t in range(3)],
+                    [{"time": t, "value": -i * t} for t in range(3)],
+                ]
+                for i in range(4)
+            }
+        )
+        flatten_transform = Flatten(max_workers=2)
+
+        with self.assertLogs("flowcean.transforms", "DEBUG") as logs:
+            result = flatten_transform.transform(data_frame)
+
+        assert_frame_equal(result, Flatten().transform(data_frame))
+        for feature in data_frame.columns:
+            assert any(f"feature {feature} in" in log for log in logs.output)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 
+import numpy as np
 import polars as pl
 from polars.testing import assert_frame_equal
 
@@ -38,6 +39,45 @@ class MatchSamplingRateTransform(unittest.TestCase):
             ),
         )
 
+    def test_match_sampling_rate_many_rows(self) -> None:
+        rng = np.random.default_rng(0)
+        reference = [np.sort(rng.random(5)).tolist() for _ in range(100)]
+        timestamps = [np.sort(rng.random(3)).tolist() for _ in range(100)]
+        values = [rng.random(3).tolist() for _ in range(100)]
+        data_frame = pl.DataFrame(
+            {
+                "time_a": reference,
+                "time_b": timestamps,
+                "feature_b": values,
+                "time_c": timestamps,
+                "feature_c": values,
+            },
+        )
+        transform = MatchSamplingRate(
+            reference_timestamps="time_a",
+            feature_columns_with_timestamps={
+                "feature_b": "time_b",
+                "feature_c": "time_c",
+            },
+            max_workers=2,
+        )
+
+        transformed_data = transform.transform(data_frame)
+
+        expected = [
+            np.interp(r, t, v).tolist()
+            for r, t, v in zip(reference, timestamps, values, strict=True)
+        ]
+        assert_frame_equal(
+            transformed_data,
+            data_frame.with_columns(
+                time_b=pl.Series(reference),
+                feature_b=pl.Series(expected),
+                time_c=pl.Series(reference),
+                feature_c=pl.Series(expected),
+            ),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,10 @@
+import math
 import unittest
 
+import numpy as np
 import polars as pl
 from polars.testing import assert_frame_equal
+from scipy.interpolate import CubicSpline
 
 from flowcean.transforms import Resample
 
@@ -155,6 +158,115 @@ class ResampleTransform(unittest.TestCase):
             ),
         )
 
+    def test_bulk_matches_per_row(self) -> None:
+        rng = np.random.default_rng(0)
+        shared_time = np.sort(rng.random(8) * 5)
+        data_frame = pl.DataFrame(
+            {
+                "shared": [
+                    [
+                        {"time": t, "value": v}
+                        for t, v in zip(
+                            shared_time, rng.random(8), strict=True
+                        )
+                    ]
+                    for _ in range(10)
+                ],
+                "varying": [
+                    [
+                        {"time": t, "value": v}
+                        for t, v in zip(
+                            np.sort(rng.random(n) * 5),
+                            rng.random(n),
+                            strict=True,
+                        )
+                    ]
+                    for n in rng.integers(4, 10, size=10)
+                ],
+            }
+        )
+
+        for method in ("linear", "cubic"):
+            transform = Resample(
+                0.5,
+                interpolation_method=method,
+                max_workers=2,
+            )
+            transformed_data = transform.transform(data_frame)
+
+            for feature in data_frame.columns:
+                expected = [
+                    _resample_row(row, 0.5, method)
+                    for row in data_frame.select(
+                        pl.col(feature).list.eval(
+                            pl.element().struct.field("time"),
+                        ),
+                        pl.col(feature)
+                        .list.eval(pl.element().struct.field("value"))
+                        .alias("value"),
+                    )
+                    .rename({feature: "time"})
+                    .iter_rows(named=True)
+                ]
+                assert_frame_equal(
+                    transformed_data.select(feature),
+                    pl.DataFrame({feature: expected}),
+                )
+
+    def test_columnar(self) -> None:
+        transform = Resample(1.0)
+        data_frame = pl.DataFrame(
+            {
+                "feature_a": [
+                    {"time": [0, 2], "value": [1, 2]},
+                    {"time": [0, 3], "value": [0, 3]},
+                ],
+                "scalar": [1, 2],
+            }
+        )
+        transformed_data = transform.transform(data_frame)
+
+        assert_frame_equal(
+            transformed_data,
+            pl.DataFrame(
+                {
+                    "feature_a": [
+                        {"time": [0.0, 1.0, 2.0], "value": [1.0, 1.5, 2.0]},
+                        {
+                            "time": [0.0, 1.0, 2.0, 3.0],
+                            "value": [0.0, 1.0, 2.0, 3.0],
+                        },
+                    ],
+                    "scalar": [1, 2],
+                }
+            ),
+        )
+
+
+def _resample_row(
+    row: dict[str, list[float]],
+    dt: float,
+    method: str,
+) -> pl.Series:
+    # Reference implementation resampling a single time series.
+    time = row["time"]
+    t_interp = np.linspace(
+        time[0],
+        time[-1],
+        int(math.ceil(time[-1] - time[0]) / dt) + 1,
+    )
+    value_interp = (
+        CubicSpline(time, row["value"])(t_interp)
+        if method == "cubic"
+        else np.interp(t_interp, time, row["value"])
+    )
+    return (
+        pl.DataFrame({"time": t_interp, "value": value_interp})
+        .to_struct()
+        .implode()
+        .item()
+    )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 
+import numpy as np
 import polars as pl
 from polars.testing import assert_frame_equal
 
@@ -36,6 +37,46 @@ class SlidingWindowTransform(unittest.TestCase):
             ),
         )
 
+    def test_sliding_window_stream(self) -> None:
+        transform = SlidingWindow(window_size=3)
+
+        data_frame = pl.DataFrame(
+            {
+                "a": [1, 2, 3, 4, 5, 6, 7],
+                "b": [10, 20, 30, 40, 50, 60, 70],
+            }
+        )
+        batches = [data_frame.slice(i, 2) for i in range(0, 7, 2)]
+        transformed_data = pl.concat(transform.transform_stream(batches))
+
+        assert_frame_equal(
+            transformed_data,
+            transform.transform(data_frame),
+        )
+
+    def test_window_view(self) -> None:
+        transform = SlidingWindow(window_size=3)
+
+        data_frame = pl.DataFrame(
+            {
+                "a": [1, 2, 3, 4, 5, 6, 7],
+                "b": [10, 20, 30, 40, 50, 60, 70],
+            }
+        )
+        windows = transform.window_view(data_frame)
+
+        assert windows.shape == (5, 3, 2)
+        np.testing.assert_array_equal(
+            windows.reshape(5, 6),
+            transform.transform(data_frame).to_numpy(),
+        )
+
+        batches = [data_frame.slice(i, 2) for i in range(0, 7, 2)]
+        np.testing.assert_array_equal(
+            np.concatenate(list(transform.window_view_stream(batches))),
+            windows,
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
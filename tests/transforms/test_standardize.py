@@ -0,0 +1,86 @@
+import unittest
+
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from flowcean.transforms import Standardize
+
+
+class StandardizeTransform(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self.data_frame = pl.DataFrame(
+            {
+                "a": rng.normal(1e6, 3.0, 100),
+                "b": rng.integers(0, 10, 100),
+            }
+        )
+
+    def test_fit(self) -> None:
+        transform = Standardize()
+        transform.fit(self.data_frame)
+
+        assert transform.counts == 100
+        transformed_data = transform.transform(self.data_frame)
+        assert transformed_data["a"].mean() == pytest.approx(0.0, abs=1e-9)
+        assert transformed_data["b"].std() == pytest.approx(1.0)
+
+    def test_fit_transform(self) -> None:
+        expected = Standardize()
+        expected.fit(self.data_frame)
+
+        transform = Standardize()
+        transformed_data = transform.fit_transform(self.data_frame)
+
+        assert transform.mean == expected.mean
+        assert transform.std == expected.std
+        assert_frame_equal(
+            transformed_data,
+            expected.transform(self.data_frame),
+        )
+
+    def test_fit_incremental(self) -> None:
+        expected = Standardize()
+        expected.fit(self.data_frame)
+
+        transform = Standardize()
+        for offset in range(0, 100, 7):
+            transform.fit_incremental(self.data_frame.slice(offset, 7))
+
+        assert transform.counts == 100
+        assert_frame_equal(
+            transform.transform(self.data_frame),
+            expected.transform(self.data_frame),
+        )
+
+    def test_merge(self) -> None:
+        expected = Standardize()
+        expected.fit(self.data_frame)
+
+        first = Standardize()
+        first.fit(self.data_frame.head(30))
+        second = Standardize()
+        second.fit(self.data_frame.tail(70))
+        first.merge(second)
+
+        assert first.counts == 100
+        assert first.mean == pytest.approx(expected.mean)
+        assert first.std == pytest.approx(expected.std)
+
+    def test_merge_different_features(self) -> None:
+        first = Standardize()
+        first.fit(self.data_frame)
+        second = Standardize()
+        second.fit(self.data_frame.select("a"))
+
+        with pytest.raises(ValueError, match="different features"):
+            first.merge(second)
+        with pytest.raises(ValueError, match="different features"):
+            first.fit_incremental(self.data_frame.select("b"))
+        assert first.counts == 100
+
+
+if __name__ == "__main__":
+    unittest.main()
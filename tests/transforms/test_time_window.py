@@ -1,9 +1,12 @@
+import math
 import unittest
 
+import numpy as np
 import polars as pl
 from polars.testing import assert_frame_equal
 
 from flowcean.transforms import TimeWindow
+from flowcean.utils import to_columnar_timeseries
 
 
 class TimeWindowTransform(unittest.TestCase):
@@ -77,6 +80,90 @@ class TimeWindowTransform(unittest.TestCase):
             ),
         )
 
+    def test_columnar(self) -> None:
+        transform = TimeWindow(time_start=1.0, time_end=2.0)
+        data_frame = pl.DataFrame(
+            {
+                "feature_a": [
+                    {"time": [0, 1, 2, 3], "value": [0, 1, 2, 3]},
+                    {"time": [0, 2, 5], "value": [0, 2, 5]},
+                ],
+                "scalar": [1, 2],
+            }
+        )
+        transformed_data = transform.transform(data_frame)
+
+        assert_frame_equal(
+            transformed_data,
+            pl.DataFrame(
+                {
+                    "feature_a": [
+                        {"time": [1, 2], "value": [1, 2]},
+                        {"time": [2], "value": [2]},
+                    ],
+                    "scalar": [1, 2],
+                }
+            ),
+        )
+
+    def test_sorted_matches_filter(self) -> None:
+        rng = np.random.default_rng(0)
+        times = [np.sort(rng.integers(0, 10, n)) for n in (0, 1, 5, 20, 50)]
+        times.append(rng.integers(0, 10, 20))
+        data_frame = pl.DataFrame(
+            {
+                "feature_a": [
+                    [
+                        {"time": t, "value": v}
+                        for t, v in zip(
+                            time, rng.random(len(time)), strict=True
+                        )
+                    ]
+                    for time in times
+                ],
+            },
+            schema={
+                "feature_a": pl.List(
+                    pl.Struct({"time": pl.Int64, "value": pl.Float64}),
+                ),
+            },
+        )
+
+        for data in (data_frame, to_columnar_timeseries(data_frame)):
+            for time_start, time_end in ((0.0, math.inf), (2.5, 7.0), (4, 4)):
+                expected = TimeWindow(
+                    time_start=time_start,
+                    time_end=time_end,
+                ).transform(data)
+                assert_frame_equal(
+                    TimeWindow(
+                        time_start=time_start,
+                        time_end=time_end,
+                        assume_sorted=True,
+                    ).transform(data.head(5)),
+                    expected.head(5),
+                )
+
+    def test_parallel_features(self) -> None:
+        data_frame = pl.DataFrame(
+            {
+                f"feature_{i}": [
+                    [{"time": t, "value": i * t} for t in range(5)],
+                    [{"time": t, "value": -i * t} for t in range(3)],
+                ]
+                for i in range(4)
+            }
+        )
+        sequential = TimeWindow(time_start=1.0, time_end=3.0)
+        parallel = TimeWindow(time_start=1.0, time_end=3.0, max_workers=2)
+
+        with self.assertLogs("flowcean.transforms", "DEBUG") as logs:
+            result = parallel.transform(data_frame)
+
+        assert_frame_equal(result, sequential.transform(data_frame))
+        for feature in data_frame.columns:
+            assert any(f"feature {feature} in" in log for log in logs.output)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+import polars as pl
+import pytest
+from polars.exceptions import ColumnNotFoundError
+
+from flowcean.utils import (
+    analyze_schema,
+    is_columnar_timeseries_feature,
+    is_timeseries_feature,
+)
+
+
+class TestAnalyzeSchema(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data = pl.DataFrame(
+            {
+                "scalar": [1.0],
+                "rows": [[{"time": 0.0, "value": 1.0}]],
+                "columnar": [{"time": [0.0], "value": [1.0]}],
+                "list": [[1.0]],
+                "struct": [{"time": 0.0, "value": 1.0}],
+            },
+        )
+
+    def test_classify(self) -> None:
+        schema = analyze_schema(self.data.schema)
+
+        assert schema.row_features == ("rows",)
+        assert schema.columnar_features == ("columnar",)
+        assert schema.timeseries_features == ("rows", "columnar")
+        assert schema.is_timeseries("rows")
+        assert schema.is_columnar("columnar")
+        assert not schema.is_columnar("rows")
+        assert not schema.is_timeseries("struct")
+
+    def test_feature_checks(self) -> None:
+        assert is_timeseries_feature(self.data, "columnar")
+        assert not is_timeseries_feature(self.data, "list")
+        assert is_columnar_timeseries_feature(self.data, "columnar")
+        assert not is_columnar_timeseries_feature(self.data, "rows")
+        with pytest.raises(ColumnNotFoundError):
+            is_timeseries_feature(self.data, "missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,21 @@
+import unittest
+
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from flowcean.utils import rebatch
+
+
+class TestRebatch(unittest.TestCase):
+    def test_rebatch(self) -> None:
+        data = pl.DataFrame({"a": range(10)})
+        frames = [data.slice(0, 3), data.slice(3, 1), data.slice(4, 6)]
+
+        batches = list(rebatch(frames, batch_size=4))
+
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        assert_frame_equal(pl.concat(batches), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+
+import pytest
+from polars.exceptions import ColumnNotFoundError
+
+from flowcean.utils import resolve_features
+
+
+class TestResolveFeatures(unittest.TestCase):
+    def test_names(self) -> None:
+        assert resolve_features(["a", "b", "c"], ["c", "a"]) == ["c", "a"]
+
+    def test_regular_expression(self) -> None:
+        feature_names = ["p_0", "T", "p_1", "p_initial"]
+        assert resolve_features(feature_names, ["^p_\\d$", "T", "p_0"]) == [
+            "p_0",
+            "p_1",
+            "T",
+        ]
+
+    def test_missing_feature(self) -> None:
+        with pytest.raises(ColumnNotFoundError):
+            resolve_features(["a", "b"], ["c"])
+        with pytest.raises(ColumnNotFoundError):
+            resolve_features(["a", "b"], ["^c.*$"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+import polars as pl
+from polars.testing import assert_frame_equal, assert_series_equal
+
+from flowcean.utils import (
+    analyze_schema,
+    get_timeseries_field,
+    is_columnar_timeseries_feature,
+    is_timeseries_feature,
+    to_columnar_timeseries,
+    to_row_timeseries,
+)
+
+ROW_LAYOUT = pl.DataFrame(
+    {
+        "feature_a": [
+            [{"time": 0.0, "value": 1}, {"time": 1.0, "value": 2}],
+            [],
+        ],
+        "scalar": [1, 2],
+    }
+)
+COLUMNAR_LAYOUT = pl.DataFrame(
+    {
+        "feature_a": [
+            {"time": [0.0, 1.0], "value": [1, 2]},
+            {"time": [], "value": []},
+        ],
+        "scalar": [1, 2],
+    }
+)
+
+
+class TestTimeSeriesLayout(unittest.TestCase):
+    def test_detect_layout(self) -> None:
+        assert is_timeseries_feature(ROW_LAYOUT, "feature_a")
+        assert is_timeseries_feature(COLUMNAR_LAYOUT, "feature_a")
+        assert not is_columnar_timeseries_feature(ROW_LAYOUT, "feature_a")
+        assert is_columnar_timeseries_feature(COLUMNAR_LAYOUT, "feature_a")
+        assert not is_timeseries_feature(COLUMNAR_LAYOUT, "scalar")
+
+    def test_convert(self) -> None:
+        assert_frame_equal(to_columnar_timeseries(ROW_LAYOUT), COLUMNAR_LAYOUT)
+        assert_frame_equal(to_row_timeseries(COLUMNAR_LAYOUT), ROW_LAYOUT)
+        assert_frame_equal(
+            to_columnar_timeseries(COLUMNAR_LAYOUT),
+            COLUMNAR_LAYOUT,
+        )
+
+    def test_get_field(self) -> None:
+        for data in (ROW_LAYOUT, COLUMNAR_LAYOUT):
+            assert_series_equal(
+                get_timeseries_field(data, "feature_a", "value"),
+                pl.Series("feature_a", [[1, 2], []]),
+            )
+            assert_series_equal(
+                get_timeseries_field(
+                    data,
+                    "feature_a",
+                    "time",
+                    analyze_schema(data.schema),
+                ),
+                pl.Series("feature_a", [[0.0, 1.0], []]),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()